@@ -0,0 +1,129 @@
+"""
+Tests for the SQL-side backtest report aggregates.
+
+What we test
+------------
+1. The SQL aggregates agree with compute_metrics() over the persisted
+   records, including None prices and actuals below MAPE_EPSILON.
+2. The horizon filter restricts the rows aggregated.
+3. query_report_metrics() returns both slicings from one scan.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from dataclasses import replace
+from datetime import date
+
+import pytest
+
+from wow_forecaster.backtest.metrics import PredictionRecord
+from wow_forecaster.backtest.reporter import (
+    persist_backtest_run,
+    persist_prediction_records,
+    query_report_metrics,
+)
+from wow_forecaster.backtest.slices import (
+    slice_by_event_window,
+    slice_by_model_and_horizon,
+)
+from wow_forecaster.db.schema import apply_schema
+
+
+@pytest.fixture
+def conn():
+    c = sqlite3.connect(":memory:")
+    c.row_factory = sqlite3.Row
+    apply_schema(c)
+    yield c
+    c.close()
+
+
+def _record(fold: int, horizon: int, is_event: bool = False) -> PredictionRecord:
+    return PredictionRecord(
+        fold_index=fold,
+        archetype_id=7,
+        realm_slug="area-52",
+        category_tag="consumable",
+        model_name="last_value",
+        train_end=date(2024, 9, 10 + fold),
+        test_date=date(2024, 9, 10 + fold + horizon),
+        horizon_days=horizon,
+        actual_price=100.0 + fold,
+        predicted_price=None if fold == 2 else 98.5,
+        last_known_price=99.0,
+        is_event_window=is_event,
+    )
+
+
+def _persist(conn, records: list[PredictionRecord]) -> int:
+    run_id = persist_backtest_run(
+        conn, None, "area-52", date(2024, 9, 1), date(2024, 10, 1),
+        window_days=7, step_days=1, fold_count=3,
+        model_names=["last_value"], config_snapshot={},
+    )
+    persist_prediction_records(conn, run_id, records)
+    return run_id
+
+
+def _mixed_records() -> list[PredictionRecord]:
+    prices = [
+        (120.0, 118.5), (80.0, 95.25), (None, 40.0), (55.0, None),
+        (0.005, 1.0), (10.0, 10.0), (3000.0, 2750.0), (None, None),
+    ]
+    return [
+        replace(
+            _record(fold, horizon, is_event=i % 3 == 0),
+            model_name=model,
+            archetype_id=i,
+            actual_price=actual,
+            predicted_price=predicted,
+        )
+        for fold in range(2)
+        for horizon in (1, 3)
+        for model in ("last_value", "rolling_mean")
+        for i, (actual, predicted) in enumerate(prices)
+    ]
+
+
+_NUMERIC_FIELDS = (
+    "n_predictions", "n_evaluated", "mae", "rmse", "mape",
+    "mean_actual", "mean_predicted", "directional_accuracy",
+)
+
+
+def _assert_metrics_match(sql, py) -> None:
+    assert sql.keys() == py.keys()
+    for key, m in sql.items():
+        for field in _NUMERIC_FIELDS:
+            assert getattr(m, field) == pytest.approx(getattr(py[key], field)), (key, field)
+        assert m.slice_key == py[key].slice_key
+
+
+@pytest.mark.parametrize("horizon", [None, 3])
+def test_sql_aggregates_match_python_slices(conn, horizon) -> None:
+    mixed = _mixed_records()
+    run_id = _persist(conn, mixed)
+    # last_known_price is not persisted, so the SQL side cannot score direction.
+    records = [
+        replace(r, last_known_price=None)
+        for r in mixed
+        if horizon is None or r.horizon_days == horizon
+    ]
+
+    by_model, by_event = query_report_metrics(conn, run_id, horizon)
+
+    _assert_metrics_match(by_model, slice_by_model_and_horizon(records))
+    _assert_metrics_match(by_event, slice_by_event_window(records))
+
+
+def test_sql_aggregates_empty_for_unknown_run(conn) -> None:
+    assert query_report_metrics(conn, 999) == ({}, {})
+
+
+def test_event_window_keys_are_ordered(conn) -> None:
+    run_id = _persist(conn, _mixed_records())
+
+    _, by_event = query_report_metrics(conn, run_id)
+
+    assert list(by_event) == ["non_event_window", "event_window"]
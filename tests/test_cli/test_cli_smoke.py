@@ -21,6 +21,13 @@ in-process without spawning a subprocess.
 
 from __future__ import annotations
 
+import json
+import os
+import sqlite3
+import subprocess
+import sys
+from pathlib import Path
+
 import pytest
 from typer.testing import CliRunner
 
@@ -96,6 +103,13 @@ class TestValidateConfig:
         assert result.exit_code == 0
         assert "database" in result.output
 
+    def test_full_json_parses_and_matches_config(self):
+        from wow_forecaster.config import load_config
+
+        result = runner.invoke(app, ["validate-config", "--full"])
+        body = result.output.split("Full config (JSON):", 1)[1].rsplit("[OK]", 1)[0]
+        assert json.loads(body) == load_config().model_dump(mode="json")
+
 
 # ── init-db ───────────────────────────────────────────────────────────────────
 
@@ -154,6 +168,56 @@ class TestDryRunCommands:
         assert result.exit_code == 0
         assert "DRY RUN" in result.output
 
+    def test_backtest_dry_run_fold_counts_match_splits(self):
+        from datetime import date
+
+        from wow_forecaster.backtest.splits import generate_walk_forward_splits
+
+        result = runner.invoke(
+            app,
+            [
+                "backtest",
+                "--dry-run",
+                "--start-date", "2024-09-10",
+                "--end-date", "2024-12-01",
+                "--window-days", "30",
+                "--step-days", "4",
+                "--horizons", "7,1,3",
+            ],
+        )
+        assert result.exit_code == 0
+        for h in (7, 1, 3):
+            folds = generate_walk_forward_splits(
+                date(2024, 9, 10), date(2024, 12, 1), 30, 4, h
+            )
+            assert f"horizon={h}d | folds={len(folds)} |" in result.output
+
+    def test_backtest_dry_run_accepts_utc_timestamps(self):
+        result = runner.invoke(
+            app,
+            [
+                "backtest",
+                "--dry-run",
+                "--start-date", "2024-09-10T00:00:00Z",
+                "--end-date", "2024-12-01T23:30:00-05:00",
+            ],
+        )
+        assert result.exit_code == 0
+        # The -05:00 evening falls on the next UTC day.
+        assert "2024-09-10 -> 2024-12-02" in result.output
+
+    def test_build_datasets_dry_run_does_not_import_pyarrow(self):
+        # Fresh interpreter: this session has long since imported pyarrow.
+        probe = (
+            "import sys\n"
+            "from typer.testing import CliRunner\n"
+            "from wow_forecaster.cli import app\n"
+            "r = CliRunner().invoke(app, ['build-datasets', '--dry-run',"
+            " '--start-date', '2025-01-01', '--end-date', '2025-01-31'])\n"
+            "sys.exit(r.exit_code or ('pyarrow' in sys.modules))\n"
+        )
+        assert subprocess.run([sys.executable, "-c", probe]).returncode == 0
+
     def test_build_datasets_dry_run_mentions_parquet(self):
         result = runner.invoke(
             app,
@@ -167,6 +231,193 @@ class TestDryRunCommands:
         assert "parquet" in result.output.lower()
 
 
+# ── config memoization ────────────────────────────────────────────────────────
+
+class TestConfigMemo:
+    def test_repeat_load_returns_same_instance(self):
+        from wow_forecaster.cli import _load_config_or_exit
+
+        assert _load_config_or_exit() is _load_config_or_exit()
+
+    def test_env_override_change_is_not_served_stale(self, tmp_path, monkeypatch):
+        from wow_forecaster.cli import _load_config_or_exit
+
+        first = _load_config_or_exit()
+        other = str(tmp_path / "other.db")
+        monkeypatch.setenv("WOW_FORECASTER_DB_PATH", other)
+        assert first.database.db_path != other
+        assert _load_config_or_exit().database.db_path == other
+
+    def test_edited_config_file_is_reread(self, tmp_path):
+        from wow_forecaster.cli import _load_config_or_exit
+
+        cfg = tmp_path / "edit.toml"
+        cfg.write_text('[logging]\nlevel = "INFO"\n', encoding="utf-8")
+        first = _load_config_or_exit(str(cfg))
+        assert _load_config_or_exit(str(cfg)) is first
+
+        cfg.write_text('[logging]\nlevel = "DEBUG"\n', encoding="utf-8")
+        stat = cfg.stat()
+        os.utime(cfg, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert _load_config_or_exit(str(cfg)).logging.level == "DEBUG"
+
+    def test_skip_validation_only_applies_to_dry_run(self, tmp_path, monkeypatch):
+        from wow_forecaster.cli import _load_config_or_exit
+
+        cfg = tmp_path / "bad.toml"
+        cfg.write_text('[logging]\nlevel = "VERBOSE"\n', encoding="utf-8")
+        monkeypatch.setenv("WOW_FORECASTER_SKIP_VALIDATION", "1")
+
+        loaded = _load_config_or_exit(str(cfg), dry_run=True)
+        assert loaded.logging.level == "VERBOSE"
+        result = runner.invoke(app, ["validate-config", "--config", str(cfg)])
+        assert result.exit_code == 1
+
+
+class TestHourlyRefreshSummary:
+    def test_summary_lines_and_warnings(self):
+        from unittest.mock import patch
+
+        from wow_forecaster.pipeline.orchestrator import (
+            OrchestratorResult,
+            RealmIngestionResult,
+        )
+
+        fake = OrchestratorResult(
+            realm_results=[
+                RealmIngestionResult("r1", True, 5),
+                RealmIngestionResult("r2", False, 0, "boom"),
+            ],
+            normalize_success=True,
+            normalize_rows=7,
+            monitoring_files=["a.json", "b.json"],
+            errors=["IngestStage[r2]: boom"],
+            status="partial",
+        )
+        with patch(
+            "wow_forecaster.pipeline.orchestrator.HourlyOrchestrator.run",
+            return_value=fake,
+        ):
+            result = runner.invoke(app, ["run-hourly-refresh"])
+
+        assert result.exit_code == 0
+        assert (
+            "  Ingest [r1] ok | rows=5\n"
+            "  Ingest [r2] FAIL | rows=0 | err=boom\n"
+            "  Normalize       ok | rows=7\n"
+            "\n"
+            "  Monitoring outputs:\n"
+            "    a.json\n"
+            "    b.json\n"
+        ) in result.stdout
+        assert result.stderr == "  [WARN] IngestStage[r2]: boom\n"
+        assert "[PARTIAL] Hourly refresh partial." in result.stdout
+
+
+class TestReportBacktest:
+    def test_report_is_one_block(self, tmp_path):
+        from datetime import date
+
+        from wow_forecaster.backtest.metrics import PredictionRecord
+        from wow_forecaster.backtest.reporter import (
+            persist_backtest_run,
+            persist_prediction_records,
+        )
+        from wow_forecaster.db.schema import apply_schema
+
+        db = str(tmp_path / "bt.db")
+        with sqlite3.connect(db) as conn:
+            apply_schema(conn)
+            run_id = persist_backtest_run(
+                conn, None, "us", date(2025, 1, 1), date(2025, 2, 1),
+                window_days=7, step_days=1, fold_count=1,
+                model_names=["last_value"], config_snapshot={},
+            )
+            persist_prediction_records(conn, run_id, [
+                PredictionRecord(
+                    fold_index=0, archetype_id=1, realm_slug="us",
+                    category_tag="consumable", model_name="last_value",
+                    train_end=date(2025, 1, 10), test_date=date(2025, 1, 11),
+                    horizon_days=1, actual_price=100.0, predicted_price=98.0,
+                    last_known_price=None, is_event_window=is_event,
+                )
+                for is_event in (False, True)
+            ])
+
+        result = runner.invoke(app, ["report-backtest", "--db-path", db])
+
+        assert result.exit_code == 0, result.output
+        assert (
+            "  Predictions: 2\n"
+            "\n"
+            "Per-model metrics (MAE in gold | RMSE | MAPE | Dir.Acc):\n"
+        ) in result.stdout
+        assert "  last_value               1       2      2.00      2.00     2.0%      N/A\n" in (
+            result.stdout
+        )
+        assert "  non_event_window     N=    1  MAE=2.00  DirAcc=N/A\n" in result.stdout
+        assert result.stdout.endswith("\n[OK] Report complete.\n")
+
+    def test_run_without_records(self, tmp_path):
+        from datetime import date
+
+        from wow_forecaster.backtest.reporter import persist_backtest_run
+        from wow_forecaster.db.schema import apply_schema
+
+        db = str(tmp_path / "bt.db")
+        with sqlite3.connect(db) as conn:
+            apply_schema(conn)
+            persist_backtest_run(
+                conn, None, "us", date(2025, 1, 1), date(2025, 2, 1),
+                window_days=7, step_days=1, fold_count=0,
+                model_names=[], config_snapshot={},
+            )
+
+        result = runner.invoke(app, ["report-backtest", "--db-path", db])
+
+        assert result.exit_code == 0, result.output
+        assert result.stdout.endswith(
+            "  Window:      7d | Folds: 0\n"
+            "  No prediction records found for this run.\n"
+        )
+
+
+class TestSchemaMemo:
+    def test_second_call_skips_connection(self, tmp_path, monkeypatch):
+        from wow_forecaster import cli
+        from wow_forecaster.config import load_config
+        from wow_forecaster.db import connection
+
+        db = str(tmp_path / "memo.db")
+        config = load_config()
+        cli._ensure_schema(db, config)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("schema re-checked on a known DB file")
+
+        monkeypatch.setattr(connection, "get_connection", fail)
+        cli._ensure_schema(db, config)
+
+    def test_replaced_db_file_is_checked_again(self, tmp_path):
+        from wow_forecaster import cli
+        from wow_forecaster.config import load_config
+
+        db = tmp_path / "memo.db"
+        config = load_config()
+        cli._ensure_schema(str(db), config)
+
+        # Simulate a restore: a fresh, empty file swapped in at the same path.
+        # It is created before the unlink so it cannot reuse the old inode.
+        fresh = tmp_path / "fresh.db"
+        sqlite3.connect(fresh).close()
+        os.replace(fresh, db)
+        cli._ensure_schema(str(db), config)
+
+        with sqlite3.connect(db) as conn:
+            tables = {r[0] for r in conn.execute("SELECT name FROM sqlite_master")}
+        assert "wow_events" in tables
+
+
 # ── error paths ───────────────────────────────────────────────────────────────
 
 class TestErrorPaths:
@@ -176,6 +427,13 @@ class TestErrorPaths:
         )
         assert result.exit_code == 1
 
+    def test_import_events_directory_exits_1(self, tmp_path):
+        csv_dir = tmp_path / "events.csv"
+        csv_dir.mkdir()
+        result = runner.invoke(app, ["import-events", "--file", str(csv_dir)])
+        assert result.exit_code == 1
+        assert "Events file not found" in result.output
+
     def test_import_auctionator_missing_file_exits_1(self):
         result = runner.invoke(
             app, ["import-auctionator", "--path", "/nonexistent/Auctionator.lua"]
@@ -204,6 +462,19 @@ class TestErrorPaths:
         )
         assert result.exit_code == 1
 
+    def test_backtest_bad_date_reported_before_config(self, tmp_path):
+        result = runner.invoke(
+            app,
+            [
+                "backtest",
+                "--start-date", "not-a-date",
+                "--end-date", "2024-12-01",
+                "--config", str(tmp_path / "absent.toml"),
+            ],
+        )
+        assert result.exit_code == 1
+        assert "Invalid date format" in result.output
+
     def test_build_datasets_end_before_start_exits_1(self):
         result = runner.invoke(
             app,
@@ -260,6 +531,74 @@ class TestImportEventsWithRealFile:
         )
         assert "Validated" in result.output
 
+    def test_dry_run_with_explicit_file_skips_config(self, tmp_path):
+        """A missing --config is never read when --file is given with --dry-run."""
+        result = runner.invoke(
+            app,
+            [
+                "import-events",
+                "--dry-run",
+                "--file", "config/events/tww_events.json",
+                "--config", str(tmp_path / "absent.toml"),
+            ],
+        )
+        assert result.exit_code == 0, result.output
+
+    def test_missing_file_reported_before_config(self, tmp_path):
+        result = runner.invoke(
+            app,
+            [
+                "import-events",
+                "--file", str(tmp_path / "absent.json"),
+                "--config", str(tmp_path / "absent.toml"),
+            ],
+        )
+        assert result.exit_code == 1
+        assert "Events file not found" in result.output
+
+    def test_non_object_entry_reports_its_index(self, tmp_path):
+        events = tmp_path / "events.json"
+        events.write_text('[{"slug": "x"}, "not-an-object"]', encoding="utf-8")
+        result = runner.invoke(
+            app, ["import-events", "--dry-run", "--file", str(events)]
+        )
+        assert result.exit_code == 1
+        assert "Malformed JSON object at index 1" in result.output
+
+    def test_many_invalid_events_are_counted_but_few_printed(self, tmp_path):
+        events = tmp_path / "events.json"
+        events.write_text(json.dumps([{"slug": f"bad-{i}"} for i in range(8)]), encoding="utf-8")
+        result = runner.invoke(
+            app, ["import-events", "--dry-run", "--file", str(events)]
+        )
+        assert result.exit_code == 1
+        assert "8 event(s) failed validation" in result.output
+        assert "Event #4:" in result.output
+        assert "Event #5:" not in result.output
+        assert "... and 3 more." in result.output
+
+    def test_import_writes_every_event(self, isolated_product_db):
+        runner.invoke(app, ["init-db"])
+        result = runner.invoke(
+            app, ["import-events", "--file", "config/events/tww_events.json"]
+        )
+        assert result.exit_code == 0, result.output
+        with sqlite3.connect(isolated_product_db) as conn:
+            count = conn.execute("SELECT COUNT(*) FROM wow_events").fetchone()[0]
+        assert count == len(json.loads(Path("config/events/tww_events.json").read_text()))
+
+    def test_invalid_event_writes_nothing(self, tmp_path, isolated_product_db):
+        """A bad entry after a valid one must roll back the whole import."""
+        runner.invoke(app, ["init-db"])
+        good = json.loads(Path("config/events/tww_events.json").read_text())[0]
+        events = tmp_path / "events.json"
+        events.write_text(json.dumps([good, {"slug": "incomplete"}]), encoding="utf-8")
+        result = runner.invoke(app, ["import-events", "--file", str(events)])
+        assert result.exit_code == 1
+        with sqlite3.connect(isolated_product_db) as conn:
+            count = conn.execute("SELECT COUNT(*) FROM wow_events").fetchone()[0]
+        assert count == 0
+
     def test_unsupported_file_format_exits_1(self, tmp_path):
         bad_file = tmp_path / "events.xml"
         bad_file.write_text("<events/>")
@@ -11,6 +11,9 @@ override, so a test run never writes ``data/learn/`` into the checkout.
 
 from __future__ import annotations
 
+import subprocess
+import sys
+
 import pytest
 from typer.testing import CliRunner
 
@@ -80,6 +83,14 @@ class TestHelp:
         result = runner.invoke(app, ["learn"])
         assert "Usage:" in result.output
 
+    def test_registering_group_does_not_import_models(self):
+        # Fresh interpreter: this session has long since imported the models.
+        probe = (
+            "import sys, wow_forecaster.cli; "
+            "sys.exit('wow_forecaster.learning.models' in sys.modules)"
+        )
+        assert subprocess.run([sys.executable, "-c", probe]).returncode == 0
+
 
 class TestStatus:
     def test_reports_every_module(self, learn_env):
@@ -18,6 +18,8 @@ from pydantic import ValidationError
 
 from wow_forecaster.config import (
     AppConfig,
+    BackupConfig,
+    DatabaseConfig,
     ForecastConfig,
     LoggingConfig,
     _apply_env_overrides,
@@ -176,6 +178,22 @@ class TestLoggingConfigValidator:
             LoggingConfig(level="")
 
 
+class TestDatabaseConfigValidator:
+    def test_pragma_values_are_uppercased(self):
+        cfg = DatabaseConfig(synchronous="full", temp_store="file")
+        assert cfg.synchronous == "FULL"
+        assert cfg.temp_store == "FILE"
+
+    def test_unknown_synchronous_raises(self):
+        # Interpolated into a PRAGMA statement, so nothing else may pass.
+        with pytest.raises(ValidationError):
+            DatabaseConfig(synchronous="NORMAL; DROP TABLE items")
+
+    def test_unknown_temp_store_raises(self):
+        with pytest.raises(ValidationError):
+            DatabaseConfig(temp_store="ram")
+
+
 # ── load_config error path ────────────────────────────────────────────────────
 
 class TestLoadConfig:
@@ -191,3 +209,25 @@ class TestLoadConfig:
         cfg = load_config()
         with pytest.raises(ValidationError):
             cfg.database.db_path = "mutated"  # type: ignore[misc]
+
+    def test_validate_false_skips_validators(self, tmp_path: Path):
+        cfg = tmp_path / "bad.toml"
+        cfg.write_text('[logging]\nlevel = "VERBOSE"\n', encoding="utf-8")
+        with pytest.raises(ValidationError):
+            load_config(config_path=cfg)
+        loaded = load_config(config_path=cfg, validate=False)
+        assert loaded.logging.level == "VERBOSE"
+        assert loaded.database.db_path  # defaults still filled in
+
+    def test_cloud_sync_section_is_applied(self, tmp_path: Path):
+        cfg = tmp_path / "sync.toml"
+        cfg.write_text("[cloud_sync]\nmax_backfill_days = 9\n", encoding="utf-8")
+        loaded = load_config(config_path=cfg)
+        assert loaded.cloud_sync.max_backfill_days == 9
+        assert loaded.cloud_sync.max_objects_per_run == 96
+
+    def test_absent_section_keeps_defaults(self, tmp_path: Path):
+        cfg = tmp_path / "empty.toml"
+        cfg.write_text("", encoding="utf-8")
+        loaded = load_config(config_path=cfg)
+        assert loaded.backup == BackupConfig()
@@ -0,0 +1,66 @@
+"""Tests for get_connection() — per-connection PRAGMA settings and read-only mode."""
+
+from __future__ import annotations
+
+import sqlite3
+
+import pytest
+
+from wow_forecaster.config import DatabaseConfig
+from wow_forecaster.db.connection import get_connection
+
+
+class TestConnectionPragmas:
+    def test_config_pragmas_are_applied(self, tmp_path):
+        cfg = DatabaseConfig(
+            synchronous="normal", cache_size_kib=2048, temp_store="memory"
+        )
+        with get_connection(str(tmp_path / "t.db"), **cfg.connection_kwargs()) as conn:
+            assert conn.execute("PRAGMA synchronous;").fetchone()[0] == 1  # NORMAL
+            assert conn.execute("PRAGMA cache_size;").fetchone()[0] == -2048
+            assert conn.execute("PRAGMA temp_store;").fetchone()[0] == 2  # MEMORY
+            assert conn.execute("PRAGMA mmap_size;").fetchone()[0] == 0
+
+    def test_unset_arguments_keep_sqlite_defaults(self, tmp_path):
+        with get_connection(str(tmp_path / "t.db")) as conn:
+            assert conn.execute("PRAGMA synchronous;").fetchone()[0] == 2  # FULL
+            assert conn.execute("PRAGMA temp_store;").fetchone()[0] == 0  # DEFAULT
+
+
+class TestReadOnly:
+    def test_reads_while_writes_are_rejected(self, tmp_path):
+        db = str(tmp_path / "t.db")
+        with get_connection(db) as conn:
+            conn.execute("CREATE TABLE t (x INTEGER);")
+            conn.execute("INSERT INTO t VALUES (1);")
+
+        with get_connection(db, read_only=True) as conn:
+            assert conn.execute("SELECT x FROM t;").fetchone()["x"] == 1
+            with pytest.raises(sqlite3.OperationalError, match="readonly"):
+                conn.execute("INSERT INTO t VALUES (2);")
+
+    def test_reader_sees_commits_while_writer_holds_lock(self, tmp_path):
+        db = str(tmp_path / "t.db")
+        with get_connection(db) as conn:
+            conn.execute("CREATE TABLE t (x INTEGER);")
+
+        with get_connection(db) as writer, get_connection(db, read_only=True) as reader:
+            writer.execute("BEGIN IMMEDIATE;")
+            writer.execute("INSERT INTO t VALUES (1);")
+            assert reader.execute("SELECT COUNT(*) FROM t;").fetchone()[0] == 0
+            writer.commit()
+            assert reader.execute("SELECT COUNT(*) FROM t;").fetchone()[0] == 1
+
+    def test_missing_file_is_not_created(self, tmp_path):
+        db = tmp_path / "sub" / "missing.db"
+        with pytest.raises(sqlite3.OperationalError, match="not found"):
+            with get_connection(str(db), read_only=True):
+                pass
+        assert not db.parent.exists()
+
+    def test_uri_special_characters_in_path(self, tmp_path):
+        db = tmp_path / "odd #dir %41" / "t.db"
+        with get_connection(str(db)) as conn:
+            conn.execute("CREATE TABLE t (x INTEGER);")
+        with get_connection(str(db), read_only=True) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM t;").fetchone()[0] == 0
@@ -0,0 +1,56 @@
+"""Tests for DB migration 0010 - covering index for report-backtest.
+
+Covers idx_bt_results_run_horizon (schema and upgrade path) and pins that
+the query_report_metrics() scan is answered from the index alone.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+
+from wow_forecaster.backtest.reporter import _PARTIALS_SQL
+from wow_forecaster.db.migrations import MIGRATIONS, run_migrations
+from wow_forecaster.db.schema import apply_schema, get_existing_indexes
+
+NEW_INDEX = "idx_bt_results_run_horizon"
+
+
+def _plan(conn: sqlite3.Connection, sql: str, params: dict) -> str:
+    """Join the EXPLAIN QUERY PLAN detail strings for a query."""
+    rows = conn.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+    return " | ".join(str(row[-1]) for row in rows)
+
+
+class TestMigration0010:
+    def test_registered(self):
+        assert "0010_backtest_report_index" in MIGRATIONS
+
+    def test_index_created_by_apply_schema(self, in_memory_db):
+        assert NEW_INDEX in get_existing_indexes(in_memory_db)
+
+    def test_upgrade_path_creates_index(self):
+        """A pre-0010 DB (index absent) gains it from run_migrations()."""
+        conn = sqlite3.connect(":memory:")
+        conn.row_factory = sqlite3.Row
+        apply_schema(conn)
+        conn.execute(f"DROP INDEX {NEW_INDEX};")
+        assert NEW_INDEX not in get_existing_indexes(conn)
+
+        run_migrations(conn)
+        assert NEW_INDEX in get_existing_indexes(conn)
+        conn.close()
+
+    def test_idempotent(self, in_memory_db):
+        run_migrations(in_memory_db)
+        run_migrations(in_memory_db)
+        assert NEW_INDEX in get_existing_indexes(in_memory_db)
+
+
+class TestQueryPlan:
+    def test_report_partials_use_covering_index(self, in_memory_db):
+        for horizon in (None, 7):
+            plan = _plan(
+                in_memory_db, _PARTIALS_SQL,
+                {"run_id": 1, "horizon": horizon, "eps": 0.01},
+            )
+            assert f"COVERING INDEX {NEW_INDEX}" in plan, plan
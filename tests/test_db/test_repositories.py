@@ -110,6 +110,20 @@ class TestWoWEventRepository:
         assert fetched.severity == EventSeverity.CRITICAL
         assert fetched.display_name == "Updated Name"
 
+    def test_upsert_many_inserts_and_updates(self, in_memory_db, sample_event):
+        repo = WoWEventRepository(in_memory_db)
+        repo.insert(sample_event)
+        second = sample_event.model_copy(update={"slug": "test-rtwf-s2"})
+        renamed = sample_event.model_copy(update={"display_name": "Renamed"})
+        assert repo.upsert_many([renamed, second]) == 2
+        assert repo.count() == 2
+        fetched = repo.get_by_slug(sample_event.slug)
+        assert fetched is not None
+        assert fetched.display_name == "Renamed"
+
+    def test_upsert_many_empty_is_noop(self, in_memory_db):
+        assert WoWEventRepository(in_memory_db).upsert_many([]) == 0
+
     def test_count(self, in_memory_db, sample_event):
         repo = WoWEventRepository(in_memory_db)
         assert repo.count() == 0
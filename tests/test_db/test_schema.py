@@ -39,6 +39,24 @@ class TestApplySchema:
         tables = get_existing_tables(in_memory_db)
         assert len(tables) >= len(ALL_TABLE_NAMES)
 
+    def test_complete_schema_runs_no_ddl(self, in_memory_db):
+        statements: list[str] = []
+        in_memory_db.set_trace_callback(statements.append)
+        apply_schema(in_memory_db)
+        in_memory_db.set_trace_callback(None)
+        assert not [s for s in statements if "CREATE" in s]
+
+    def test_dropped_table_is_recreated(self, in_memory_db):
+        """A manual DROP (as in the issue #1 runbook) must not look applied."""
+        in_memory_db.execute("DROP TABLE daily_rollup_item;")
+        apply_schema(in_memory_db)
+        assert "daily_rollup_item" in get_existing_tables(in_memory_db)
+
+    def test_dropped_index_is_recreated(self, in_memory_db):
+        in_memory_db.execute("DROP INDEX idx_obs_raw_observed;")
+        apply_schema(in_memory_db)
+        assert "idx_obs_raw_observed" in get_existing_indexes(in_memory_db)
+
     def test_key_indexes_created(self, in_memory_db):
         indexes = get_existing_indexes(in_memory_db)
         expected_indexes = [
@@ -5,7 +5,9 @@ Verifies that build_datasets() raises RuntimeError with a clear message when
 the wow_events table is empty (i.e. build-events has not been run first), and
 that it proceeds normally when events are present.
 
-Also verifies that the Parquet schema column counts match the feature registry.
+Also verifies that the Parquet schema column counts match the feature registry,
+and that the process-pool path (workers > 1) writes the same files as the
+in-process loop.
 """
 
 from __future__ import annotations
@@ -13,9 +15,10 @@ from __future__ import annotations
 import sqlite3
 from datetime import UTC, date, datetime
 
+import pyarrow.parquet as pq
 import pytest
 
-from wow_forecaster.config import AppConfig
+from wow_forecaster.config import AppConfig, DataConfig
 from wow_forecaster.features.dataset_builder import (
     _EXPECTED_INFERENCE_COLS,
     _EXPECTED_TRAINING_COLS,
@@ -86,6 +89,53 @@ class TestBuildDatasetsPreflight:
             # Other RuntimeErrors (e.g. from Parquet write path) are not our concern here.
 
 
+# ── Process-pool realm fan-out ─────────────────────────────────────────────────
+
+class TestBuildDatasetsWorkers:
+    def test_workers_require_db_path(self, feature_db: sqlite3.Connection):
+        with pytest.raises(ValueError, match="db_path"):
+            build_datasets(
+                conn=feature_db,
+                config=AppConfig(),
+                run=_make_run(),
+                realm_slugs=["area-52", "illidan"],
+                start_date=date(2025, 1, 1),
+                end_date=date(2025, 1, 31),
+                workers=2,
+            )
+
+    def test_pool_matches_in_process(self, feature_db: sqlite3.Connection, tmp_path):
+        db_file = str(tmp_path / "features.db")
+        file_conn = sqlite3.connect(db_file)
+        feature_db.backup(file_conn)
+        file_conn.row_factory = sqlite3.Row
+
+        def build(workers: int, out: str) -> tuple[int, list]:
+            config = AppConfig(data=DataConfig(processed_dir=str(tmp_path / out)))
+            total = build_datasets(
+                conn=file_conn,
+                config=config,
+                run=_make_run(),
+                realm_slugs=["area-52", "illidan"],
+                start_date=date(2025, 1, 1),
+                end_date=date(2025, 2, 1),
+                db_path=db_file,
+                workers=workers,
+            )
+            (train,) = (tmp_path / out).rglob("train_area_52_*.parquet")
+            return total, pq.read_table(train).to_pylist()
+
+        try:
+            serial_total, serial_rows = build(1, "serial")
+            pooled_total, pooled_rows = build(2, "pooled")
+        finally:
+            file_conn.close()
+
+        assert serial_total > 0
+        assert pooled_total == serial_total
+        assert pooled_rows == serial_rows
+
+
 # ── Parquet schema column-count invariants ────────────────────────────────────
 
 class TestParquetSchemaColumnCounts:
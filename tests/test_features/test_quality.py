@@ -11,7 +11,11 @@ from typing import Any
 
 import pytest
 
-from wow_forecaster.features.quality import build_quality_report
+from wow_forecaster.features.quality import (
+    QUALITY_REPORT_COLUMNS,
+    build_quality_report,
+    build_quality_report_arrow,
+)
 
 
 def _make_clean_rows(n: int = 10) -> list[dict[str, Any]]:
@@ -185,3 +189,72 @@ class TestProxyAndColdStart:
         rows = _make_clean_rows(5)
         report = build_quality_report(rows, items_excluded=12)
         assert report.items_excluded_no_archetype == 12
+
+
+class TestProjectionColumns:
+    def test_projection_covers_every_column_the_report_reads(self):
+        """A reader projecting to QUALITY_REPORT_COLUMNS must not starve the report."""
+        read_directly = {
+            "archetype_id", "realm_slug", "obs_date",
+            "event_days_to_next", "is_volume_proxy", "is_cold_start",
+        }
+        assert read_directly <= set(QUALITY_REPORT_COLUMNS)
+        report = build_quality_report(_make_clean_rows(3))
+        assert set(report.missingness) == set(QUALITY_REPORT_COLUMNS)
+
+
+class TestArrowReportMatchesDictReport:
+    """build_quality_report_arrow(table) == build_quality_report(table.to_pylist())."""
+
+    @staticmethod
+    def _table(rows: list[dict[str, Any]]):
+        from wow_forecaster.features.dataset_builder import (
+            build_parquet_schema,
+            rows_to_parquet_table,
+        )
+        return rows_to_parquet_table(rows, build_parquet_schema(include_targets=True))
+
+    @staticmethod
+    def _assert_same(table, **kwargs) -> None:
+        expected = build_quality_report(table.to_pylist(), **kwargs)
+        actual   = build_quality_report_arrow(table, **kwargs)
+        assert actual.missingness == pytest.approx(expected.missingness)
+        assert (
+            {**actual.__dict__, "missingness": None}
+            == {**expected.__dict__, "missingness": None}
+        )
+
+    def test_clean_rows(self):
+        self._assert_same(self._table(_make_clean_rows(10)), items_excluded=4)
+
+    def test_duplicates_gaps_leakage_and_flags(self):
+        a = _make_clean_rows(6)
+        b = [{**r, "archetype_id": 2, "realm_slug": "illidan"} for r in _make_clean_rows(6)]
+        del b[2]                                  # gap in series 2 only
+        a.append(dict(a[3]))                      # duplicate key in series 1
+        a[1]["event_days_to_next"] = -2.0         # leakage
+        b[0]["is_volume_proxy"] = True
+        b[1]["is_cold_start"] = True
+        a[4]["price_mean"] = None
+        report_table = self._table(a + b)
+
+        self._assert_same(report_table, missingness_threshold=0.05)
+        arrow = build_quality_report_arrow(report_table)
+        assert arrow.duplicate_key_count == 1
+        assert arrow.date_gap_series_count == 1
+        assert len(arrow.leakage_warnings) == 1
+
+    def test_interleaved_series_sort_before_gap_check(self):
+        rows = _make_clean_rows(4)
+        other = [{**r, "archetype_id": 9} for r in _make_clean_rows(4)]
+        interleaved = [r for pair in zip(rows, other, strict=True) for r in pair]
+        self._assert_same(self._table(interleaved[::-1]))
+
+    def test_missing_registry_column_counts_as_all_null(self):
+        table = self._table(_make_clean_rows(3)).drop_columns(["price_lag_28d"])
+        self._assert_same(table)
+        assert build_quality_report_arrow(table).missingness["price_lag_28d"] == 1.0
+
+    def test_empty_table(self):
+        table = self._table(_make_clean_rows(1)).slice(0, 0)
+        self._assert_same(table, items_excluded=2)
@@ -286,3 +286,23 @@ class TestCheckAllSourcesFreshness:
         results = check_all_sources_freshness(fresh_db, policies)
         assert results[0].source_id == "z_source"
         assert results[1].source_id == "a_source"
+
+    def test_batched_query_uses_latest_success_per_source(self, fresh_db):
+        _insert_snapshot(fresh_db, "src_a", _ts(10.0))
+        _insert_snapshot(fresh_db, "src_a", _ts(0.5))
+        _insert_snapshot(fresh_db, "src_a", _ts(0.1), success=0)
+        _insert_snapshot(fresh_db, "src_b", _ts(0.1), success=0)
+
+        policies = [
+            _make_freshness_policy("src_a"),
+            _make_freshness_policy("src_b"),
+            _make_freshness_policy("manual", requires_snapshot=False),
+        ]
+        results = check_all_sources_freshness(fresh_db, policies)
+
+        assert results[0].status == FreshnessStatus.FRESH
+        assert results[0].age_hours == pytest.approx(0.5, abs=0.05)
+        assert results[1].status == FreshnessStatus.UNKNOWN
+        assert results[1].last_snapshot_at is None
+        assert results[2].status == FreshnessStatus.UNKNOWN
+        assert results[2].requires_snapshot is False
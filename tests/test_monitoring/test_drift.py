@@ -199,6 +199,12 @@ class TestCheckDataDrift:
         assert report.drift_fraction   == 0.0
         assert report.realm_slug       == "area-52"
 
+    def test_query_error_is_not_reported_as_no_drift(self):
+        conn = sqlite3.connect(":memory:")
+        conn.row_factory = sqlite3.Row
+        with pytest.raises(sqlite3.OperationalError):
+            DriftChecker(conn).check_data_drift("area-52")
+
     def test_baseline_only_no_recent_returns_none(self, drift_db: sqlite3.Connection):
         # Insert obs that are in the baseline window but not recent
         for i in range(5):
@@ -260,6 +266,29 @@ class TestCheckDataDrift:
         assert report.n_series_drifted == 0
 
 
+    def test_series_stats_recent_and_baseline_split(self, drift_db: sqlite3.Connection):
+        """Baseline std is the population std; recent rows never leak into it."""
+        for d, price in zip(range(3, 7), (90.0, 110.0, 90.0, 110.0), strict=True):
+            obs_date = (date.today() - timedelta(days=d)).isoformat()
+            _insert_normalized_obs(drift_db, 1, "area-52", f"{obs_date}T12:00:00Z", price)
+        today = date.today().isoformat()
+        _insert_normalized_obs(drift_db, 1, "area-52", f"{today}T10:00:00Z", 130.0)
+        _insert_normalized_obs(drift_db, 2, "area-52", f"{today}T10:00:00Z", 50.0)
+
+        checker = DriftChecker(drift_db, drift_window_hours=25, baseline_days=10, z_threshold=2.0)
+        stats   = {s.archetype_id: s for s in checker.check_data_drift("area-52").series_stats}
+
+        assert stats[1].baseline_mean == pytest.approx(100.0)
+        assert stats[1].baseline_std  == pytest.approx(10.0)
+        assert (stats[1].baseline_n, stats[1].recent_n) == (4, 1)
+        assert stats[1].z_mean_shift  == pytest.approx(3.0)
+        assert stats[1].is_drifted
+        # Recent-only series: reported, but without a baseline.
+        assert stats[2].baseline_n == 0
+        assert stats[2].baseline_std is None
+        assert stats[2].recent_mean == pytest.approx(50.0)
+
+
 # ── DriftChecker.check_error_drift ────────────────────────────────────────────
 
 class TestCheckErrorDrift:
@@ -281,6 +310,32 @@ class TestCheckErrorDrift:
         assert report.drift_level == DriftLevel.NONE
 
 
+    def test_baseline_from_latest_backtest_run(self, drift_db: sqlite3.Connection):
+        """The baseline MAE comes from the realm's most recent backtest run."""
+        from wow_forecaster.backtest.metrics import PredictionRecord
+        from wow_forecaster.backtest.reporter import (
+            persist_backtest_run,
+            persist_prediction_records,
+        )
+
+        for predicted in (150.0, 104.0):
+            run_id = persist_backtest_run(
+                drift_db, None, "area-52", date(2025, 1, 1), date(2025, 2, 1),
+                window_days=7, step_days=1, fold_count=1,
+                model_names=["m"], config_snapshot={},
+            )
+            persist_prediction_records(drift_db, run_id, [PredictionRecord(
+                fold_index=0, archetype_id=1, realm_slug="area-52",
+                category_tag="consumable", model_name="m",
+                train_end=date(2025, 1, 10), test_date=date(2025, 1, 11),
+                horizon_days=1, actual_price=100.0, predicted_price=predicted,
+                last_known_price=None,
+            )])
+
+        report = DriftChecker(drift_db).check_error_drift("area-52", horizon_days=1)
+        assert report.baseline_mae == pytest.approx(4.0)
+
+
 # ── DriftChecker.check_event_shocks ───────────────────────────────────────────
 
 class TestCheckEventShocks:
@@ -0,0 +1,135 @@
+"""
+Tests for live model health evaluation.
+
+What we test
+------------
+1. compute_health_summaries agrees with per-horizon compute_health_summary
+   (live MAE, n_evaluated, baseline MAE / dir_acc, status).
+2. Output order follows the requested horizons; empty input returns [].
+3. Horizons without forecasts or backtest rows come back as "unknown".
+4. persist_health_summaries writes one snapshot row per summary.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from dataclasses import replace
+from datetime import date, timedelta
+
+import pytest
+
+from wow_forecaster.backtest.metrics import PredictionRecord
+from wow_forecaster.backtest.reporter import (
+    persist_backtest_run,
+    persist_prediction_records,
+)
+from wow_forecaster.db.schema import apply_schema
+from wow_forecaster.monitoring.health import (
+    HEALTH_UNKNOWN,
+    compute_health_summaries,
+    compute_health_summary,
+)
+from wow_forecaster.monitoring.reporter import persist_health_summaries
+
+_REALM = "area-52"
+
+
+@pytest.fixture
+def health_db() -> sqlite3.Connection:
+    """In-memory DB with schema applied and FK enforcement OFF."""
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA foreign_keys = OFF;")
+    apply_schema(conn)
+    yield conn
+    conn.close()
+
+
+def _seed(conn: sqlite3.Connection) -> None:
+    today = date.today()
+    obs_id = 0
+    for days_ago in range(1, 6):
+        target = (today - timedelta(days=days_ago)).isoformat()
+        for price in (100.0, 104.0):
+            obs_id += 1
+            conn.execute(
+                "INSERT INTO market_observations_normalized "
+                "(obs_id, item_id, archetype_id, realm_slug, faction, "
+                " observed_at, price_gold, is_outlier) "
+                "VALUES (?, 1, 1, ?, 'neutral', ?, ?, 0)",
+                (obs_id, _REALM, f"{target}T12:00:00Z", price),
+            )
+        for tag, pred in (("1d", 101.0 + days_ago), ("7d", 90.0)):
+            conn.execute(
+                "INSERT INTO forecast_outputs "
+                "(run_id, archetype_id, realm_slug, forecast_horizon, target_date, "
+                " predicted_price_gold, confidence_lower, confidence_upper, model_slug) "
+                "VALUES (1, 1, ?, ?, ?, ?, 0, 0, 'lgbm')",
+                (_REALM, tag, target, pred),
+            )
+
+    base = PredictionRecord(
+        fold_index=0, archetype_id=1, realm_slug=_REALM,
+        category_tag="consumable", model_name="last_value",
+        train_end=today - timedelta(days=30), test_date=today - timedelta(days=29),
+        horizon_days=1, actual_price=100.0, predicted_price=99.0,
+        last_known_price=98.0,
+    )
+    run_id = persist_backtest_run(
+        conn, None, _REALM, today - timedelta(days=60), today - timedelta(days=20),
+        window_days=7, step_days=1, fold_count=1,
+        model_names=["last_value"], config_snapshot={},
+    )
+    persist_prediction_records(conn, run_id, [
+        base,
+        replace(base, horizon_days=7, predicted_price=95.0),
+        replace(base, horizon_days=7, actual_price=110.0, predicted_price=100.0),
+    ])
+    conn.commit()
+
+
+def test_batch_matches_per_horizon(health_db) -> None:
+    _seed(health_db)
+    horizons = [1, 7, 28]
+
+    batch = compute_health_summaries(health_db, _REALM, horizons, window_days=14)
+    single = [
+        compute_health_summary(health_db, _REALM, h, window_days=14)
+        for h in horizons
+    ]
+
+    assert [s.horizon_days for s in batch] == horizons
+    for b, s in zip(batch, single, strict=True):
+        assert replace(b, checked_at="") == replace(s, checked_at="")
+    assert batch[0].n_evaluated == 5
+    assert batch[0].baseline_mae == pytest.approx(1.0)
+    assert batch[1].live_mae == pytest.approx(12.0)
+    assert batch[1].baseline_mae == pytest.approx(7.5)
+
+
+def test_missing_horizon_is_unknown(health_db) -> None:
+    _seed(health_db)
+    (s,) = compute_health_summaries(health_db, _REALM, [28])
+    assert s.n_evaluated == 0
+    assert s.live_mae is None
+    assert s.baseline_mae is None
+    assert s.health_status == HEALTH_UNKNOWN
+
+
+def test_empty_horizons(health_db) -> None:
+    assert compute_health_summaries(health_db, _REALM, []) == []
+
+
+def test_persist_health_summaries_writes_one_row_each(health_db) -> None:
+    _seed(health_db)
+    summaries = compute_health_summaries(health_db, _REALM, [1, 7, 28])
+
+    persist_health_summaries(health_db, run_id=0, summaries=summaries)
+
+    rows = health_db.execute(
+        "SELECT horizon_days, health_status FROM model_health_snapshots "
+        "ORDER BY horizon_days"
+    ).fetchall()
+    assert [(r["horizon_days"], r["health_status"]) for r in rows] == [
+        (s.horizon_days, s.health_status) for s in summaries
+    ]
@@ -20,6 +20,7 @@ What we test
 from __future__ import annotations
 
 import logging
+import threading
 from datetime import UTC, datetime
 from unittest.mock import MagicMock, patch
 
@@ -171,6 +172,27 @@ class TestPerRealmFailureIsolation:
         # One ingest ok + normalize ok -> partial at minimum
         assert result.status in ("partial", "success")
 
+    def test_workers_ingest_concurrently_in_realm_order(self):
+        realms = ["r1", "r2", "r3", "r4"]
+        config = _make_config(realms)
+        orch   = HourlyOrchestrator(config=config, db_path=":memory:")
+        # Every worker must be inside _run_ingest at once to pass the barrier.
+        barrier = threading.Barrier(len(realms), timeout=5)
+
+        def fake_ingest(realm_slug, run_id):
+            barrier.wait()
+            return RealmIngestionResult(realm_slug=realm_slug, success=True, rows_written=1)
+
+        with patch.object(orch, "_ensure_schema"):
+            with patch.object(orch, "_run_ingest", side_effect=fake_ingest):
+                with patch.object(orch, "_run_normalize", return_value=(4, True, None)):
+                    with patch.object(orch, "_persist_run_start", return_value=1):
+                        with patch.object(orch, "_persist_run_finish"):
+                            result = orch.run(realms, check_drift=False, workers=8)
+
+        assert [r.realm_slug for r in result.realm_results] == realms
+        assert result.status == "success"
+
 
 # ── Normalize failure handling ────────────────────────────────────────────────
 
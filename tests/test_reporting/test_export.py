@@ -6,7 +6,14 @@ import csv
 import json
 from pathlib import Path
 
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
+import pytest
+
 from wow_forecaster.reporting.export import (
+    FORECAST_FLOAT_COLUMNS,
+    export_records,
+    export_to_arrow,
     export_to_csv,
     export_to_json,
     flatten_forecast_records_for_export,
@@ -81,6 +88,71 @@ def test_export_to_csv_returns_path(tmp_path: Path) -> None:
     assert result == out
 
 
+def test_export_to_csv_accepts_generator(tmp_path: Path) -> None:
+    """Rows can be streamed from a generator; the first row sets the columns."""
+    out = tmp_path / "gen.csv"
+    export_to_csv(({"i": i, "sq": i * i} for i in range(3)), out)
+
+    with out.open(encoding="utf-8") as f:
+        reader = list(csv.DictReader(f))
+    assert [r["sq"] for r in reader] == ["0", "1", "4"]
+
+
+# ── export_to_arrow / export_records ─────────────────────────────────────────
+
+
+def test_export_records_parquet_is_typed(tmp_path: Path) -> None:
+    """Numeric columns stay numeric; empty strings become nulls."""
+    records = [
+        {"archetype_id": 1, "score": 72.5, "roi_pct": ""},
+        {"archetype_id": 2, "score": 45.0, "roi_pct": 0.12},
+    ]
+    out = tmp_path / "top.parquet"
+    assert export_records(records, out) == out
+
+    table = pq.read_table(out)
+    assert table.column_names == ["archetype_id", "score", "roi_pct"]
+    assert table.schema.field("score").type == "double"
+    assert table.to_pylist() == [
+        {"archetype_id": 1, "score": 72.5, "roi_pct": None},
+        {"archetype_id": 2, "score": 45.0, "roi_pct": 0.12},
+    ]
+
+
+def test_export_records_feather_with_fieldnames(tmp_path: Path) -> None:
+    out = tmp_path / "nested" / "top.feather"
+    export_records([{"a": 1, "b": "x", "c": 3}], out, fieldnames=["c", "a"])
+    assert feather.read_table(out).to_pylist() == [{"c": 3, "a": 1}]
+
+
+def test_export_records_other_suffix_writes_csv(tmp_path: Path) -> None:
+    out = tmp_path / "top.txt"
+    export_records([{"a": 1}], out)
+    assert out.read_text(encoding="utf-8").splitlines() == ["a", "1"]
+
+
+def test_export_to_arrow_empty_records(tmp_path: Path) -> None:
+    out = tmp_path / "empty.parquet"
+    export_to_arrow([], out)
+    assert pq.read_table(out).num_rows == 0
+
+
+def test_export_to_arrow_mixed_column_written_as_strings(tmp_path: Path) -> None:
+    """A column pyarrow cannot type falls back to strings instead of raising."""
+    out = tmp_path / "mixed.parquet"
+    export_to_arrow([{"a": 1, "b": "x"}, {"a": "two", "b": ""}], out)
+
+    table = pq.read_table(out)
+    assert table.schema.field("a").type == "string"
+    assert table.column("a").to_pylist() == ["1", "two"]
+    assert table.column("b").to_pylist() == ["x", None]
+
+
+def test_export_to_arrow_rejects_other_suffix(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="suffix"):
+        export_to_arrow([{"a": 1}], tmp_path / "x.csv")
+
+
 # ── export_to_json ────────────────────────────────────────────────────────────
 
 
@@ -295,6 +367,39 @@ def test_flatten_forecast_records_preserves_original_keys() -> None:
     assert "ci_width_gold" in result[0]
 
 
+_FORECAST_ROWS = [
+    {"archetype_id": "ore", "current_price": "95.5", "predicted_price": "100",
+     "ci_lower": "90", "ci_upper": "110", "roi_pct": "+4.71%", "score": "70"},
+    {"archetype_id": "herb", "current_price": "", "predicted_price": "N/A",
+     "ci_lower": "", "ci_upper": "", "roi_pct": "", "score": "12.5"},
+]
+
+
+def test_forecast_float_columns_typed_in_parquet(tmp_path: Path) -> None:
+    """Price and score columns land in Parquet as doubles; roi_pct stays a string."""
+    out = export_records(
+        flatten_forecast_records_for_export(_FORECAST_ROWS),
+        tmp_path / "f.parquet",
+        float_columns=FORECAST_FLOAT_COLUMNS,
+    )
+
+    table = pq.read_table(out)
+    for col in FORECAST_FLOAT_COLUMNS:
+        assert table.schema.field(col).type == "double"
+    assert table.schema.field("roi_pct").type == "string"
+    assert table.column("predicted_price").to_pylist() == [100.0, None]
+
+
+def test_forecast_float_columns_leave_csv_text_unchanged(tmp_path: Path) -> None:
+    out = export_records(
+        _FORECAST_ROWS, tmp_path / "f.csv", float_columns=FORECAST_FLOAT_COLUMNS
+    )
+    with out.open(encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert rows[0]["predicted_price"] == "100"
+    assert rows[1]["predicted_price"] == "N/A"
+
+
 # ── flatten_recommendations_for_export — item columns ─────────────────────────
 
 _RECS_JSON_WITH_ITEMS = {
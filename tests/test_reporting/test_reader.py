@@ -10,8 +10,10 @@ from pathlib import Path
 from wow_forecaster.reporting.reader import (
     check_freshness,
     find_latest_file,
+    find_latest_file_with_mtime,
     load_drift_report,
     load_forecast_records,
+    load_forecast_records_with_mtime,
     load_health_report,
     load_provenance_report,
     load_recommendations_report,
@@ -57,6 +59,29 @@ def test_find_latest_file_empty_directory(tmp_path: Path) -> None:
     assert find_latest_file(tmp_path, "*.json") is None
 
 
+def test_find_latest_file_with_mtime_returns_entry_mtime(tmp_path: Path) -> None:
+    """The mtime comes back alongside the newest path and matches its stat."""
+    p = tmp_path / "forecast_area-52_2025-01-15.csv"
+    p.write_text("x")
+    (tmp_path / "forecast_area-52_dir.csv").mkdir()
+
+    found = find_latest_file_with_mtime(tmp_path, "forecast_area-52_*.csv")
+
+    assert found == (p, p.stat().st_mtime)
+
+
+def test_find_latest_file_with_mtime_no_directory(tmp_path: Path) -> None:
+    """Returns None when the directory does not exist."""
+    assert find_latest_file_with_mtime(tmp_path / "nonexistent", "*.csv") is None
+
+
+def test_find_latest_file_with_mtime_path_is_a_file(tmp_path: Path) -> None:
+    """Returns None when the configured directory is actually a file."""
+    not_a_dir = tmp_path / "forecasts"
+    not_a_dir.write_text("x")
+    assert find_latest_file_with_mtime(not_a_dir, "*.csv") is None
+
+
 # ── check_freshness ───────────────────────────────────────────────────────────
 
 
@@ -90,6 +115,14 @@ def test_check_freshness_date_only_today() -> None:
     assert 0.0 <= age <= 25.0
 
 
+def test_check_freshness_explicit_now() -> None:
+    """An explicit reference time replaces the wall clock."""
+    now = datetime(2025, 1, 15, 12, 0, tzinfo=UTC)
+    is_fresh, age = check_freshness("2025-01-15T06:00:00+00:00", max_hours=4.0, now=now)
+    assert is_fresh is False
+    assert age == 6.0
+
+
 def test_check_freshness_none_input() -> None:
     """None input returns (False, None)."""
     is_fresh, age = check_freshness(None)
@@ -203,6 +236,18 @@ def test_load_forecast_records_wrong_realm(tmp_path: Path) -> None:
     assert load_forecast_records("area-52", tmp_path) is None
 
 
+def test_load_forecast_records_with_mtime(tmp_path: Path) -> None:
+    """Returns the rows plus the CSV mtime; (None, None) when nothing matches."""
+    p = tmp_path / "forecast_area-52_2025-01-15.csv"
+    p.write_text("archetype_id,score\nfoo,5\n", encoding="utf-8")
+
+    records, mtime = load_forecast_records_with_mtime("area-52", tmp_path)
+
+    assert records == [{"archetype_id": "foo", "score": "5"}]
+    assert mtime == p.stat().st_mtime
+    assert load_forecast_records_with_mtime("illidan", tmp_path) == (None, None)
+
+
 # ── load_drift_report ─────────────────────────────────────────────────────────
 
 
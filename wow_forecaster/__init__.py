@@ -1,5 +1,11 @@
 """WoW Economy Forecaster — local-first AH research and forecasting system."""
 
-from importlib.metadata import version as _pkg_version
 
-__version__ = _pkg_version("wow-economy-forecaster")
+def __getattr__(name: str):
+    # Resolved on first access (PEP 562): importlib.metadata costs ~25 ms,
+    # and every CLI invocation imports this package without reading it.
+    if name == "__version__":
+        from importlib.metadata import version
+
+        return version("wow-economy-forecaster")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -24,12 +24,19 @@ from __future__ import annotations
 import csv
 import json
 import logging
+import math
 import sqlite3
+from dataclasses import replace
 from datetime import UTC, date, datetime
 from pathlib import Path
 from typing import Any
 
-from wow_forecaster.backtest.metrics import BacktestMetrics, PredictionRecord, compute_metrics
+from wow_forecaster.backtest.metrics import (
+    MAPE_EPSILON,
+    BacktestMetrics,
+    PredictionRecord,
+    compute_metrics,
+)
 from wow_forecaster.backtest.splits import BacktestFold
 
 log = logging.getLogger(__name__)
@@ -143,6 +150,116 @@ def persist_prediction_records(
     return len(rows_to_insert)
 
 
+# Additive partial aggregates over backtest_fold_results at the finest grain
+# any report slices by.  Sums and counts (not averages) so that one scan can be
+# rolled up to several groupings in Python, mirroring compute_metrics().
+_PARTIALS_SQL = """
+    SELECT model_name, horizon_days, is_event_window,
+           COUNT(*)                                            AS n_predictions,
+           COUNT(actual_price - predicted_price)               AS n_evaluated,
+           SUM(ABS(actual_price - predicted_price))            AS abs_err,
+           SUM((actual_price - predicted_price)
+               * (actual_price - predicted_price))             AS sq_err,
+           SUM(CASE WHEN actual_price >= :eps
+                    THEN ABS(actual_price - predicted_price) / actual_price
+               END)                                            AS ape,
+           COUNT(CASE WHEN actual_price >= :eps
+                      THEN actual_price - predicted_price END) AS n_mape,
+           SUM(CASE WHEN predicted_price IS NOT NULL
+                    THEN actual_price END)                     AS sum_actual,
+           SUM(CASE WHEN actual_price IS NOT NULL
+                    THEN predicted_price END)                  AS sum_predicted
+    FROM backtest_fold_results
+    WHERE backtest_run_id = :run_id
+      AND (:horizon IS NULL OR horizon_days = :horizon)
+    GROUP BY model_name, horizon_days, is_event_window
+    ORDER BY model_name, horizon_days, is_event_window
+"""
+
+# Column offsets of the additive fields in a _PARTIALS_SQL row.
+_N_PARTIAL_KEYS = 3
+_N_PARTIAL_SUMS = 8
+
+
+def _query_partials(
+    conn: sqlite3.Connection,
+    backtest_run_id: int,
+    horizon_days: int | None,
+) -> list[tuple]:
+    """Run ``_PARTIALS_SQL``; one plain tuple per (model, horizon, event) group."""
+    cursor = conn.cursor()
+    cursor.row_factory = None
+    return cursor.execute(
+        _PARTIALS_SQL,
+        {"run_id": backtest_run_id, "horizon": horizon_days, "eps": MAPE_EPSILON},
+    ).fetchall()
+
+
+def _roll_up(
+    partials: list[tuple],
+    key_of: Any,
+) -> dict[Any, BacktestMetrics]:
+    """Sum partial rows by ``key_of(row)`` and finish them into BacktestMetrics."""
+    sums: dict[Any, list[float]] = {}
+    for row in partials:
+        acc = sums.setdefault(key_of(row), [0.0] * _N_PARTIAL_SUMS)
+        for i, value in enumerate(row[_N_PARTIAL_KEYS:]):
+            if value is not None:
+                acc[i] += value
+
+    result: dict[Any, BacktestMetrics] = {}
+    for key, (n_pred, n_eval, abs_err, sq_err, ape, n_mape, s_act, s_pred) in sums.items():
+        n_eval = int(n_eval)
+        result[key] = BacktestMetrics(
+            n_predictions=int(n_pred),
+            n_evaluated=n_eval,
+            mae=abs_err / n_eval if n_eval else None,
+            rmse=math.sqrt(sq_err / n_eval) if n_eval else None,
+            mape=ape / n_mape if n_mape else None,
+            # last_known_price is not persisted; direction_correct uses a
+            # different tie rule than compute_metrics(), so it is not
+            # substituted.
+            directional_accuracy=None,
+            n_directional=0,
+            mean_actual=s_act / n_eval if n_eval else None,
+            mean_predicted=s_pred / n_eval if n_eval else None,
+        )
+    return result
+
+
+def _by_model_and_horizon(partials: list[tuple]) -> dict[tuple[str, int], BacktestMetrics]:
+    return {
+        (name, h): replace(m, model_name=name, horizon_days=h, slice_key=f"{name}_{h}d")
+        for (name, h), m in _roll_up(partials, lambda row: (row[0], row[1])).items()
+    }
+
+
+def _by_event_window(partials: list[tuple]) -> dict[str, BacktestMetrics]:
+    result: dict[str, BacktestMetrics] = {}
+    for is_event, m in sorted(_roll_up(partials, lambda row: bool(row[2])).items()):
+        key = "event_window" if is_event else "non_event_window"
+        result[key] = replace(m, slice_key=key)
+    return result
+
+
+def query_report_metrics(
+    conn: sqlite3.Connection,
+    backtest_run_id: int,
+    horizon_days: int | None = None,
+) -> tuple[dict[tuple[str, int], BacktestMetrics], dict[str, BacktestMetrics]]:
+    """Both report slicings from a single scan of ``backtest_fold_results``.
+
+    SQL-side equivalent of ``slice_by_model_and_horizon`` and
+    ``slice_by_event_window`` for a stored run: SQLite aggregates the rows,
+    so only one row per group reaches Python.
+
+    Returns:
+        ``(by_model_and_horizon, by_event_window)``.
+    """
+    partials = _query_partials(conn, backtest_run_id, horizon_days)
+    return _by_model_and_horizon(partials), _by_event_window(partials)
+
+
 # ── CSV output ─────────────────────────────────────────────────────────────────
 
 def write_summary_csv(
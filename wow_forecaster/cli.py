@@ -24,8 +24,13 @@ Install and run::
 
 from __future__ import annotations
 
+import functools
 import json
-from datetime import date, datetime, timedelta
+import os
+import time
+import tomllib
+from collections import Counter
+from datetime import UTC, date, datetime, timedelta
 from pathlib import Path
 
 import typer
@@ -47,13 +52,63 @@ app.add_typer(learn_app, name="learn")
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
-def _load_config_or_exit(config_path: str | None = None):
-    """Load AppConfig, printing a friendly error and exiting on failure."""
+# Escape hatch: with this set to 1, dry runs build AppConfig without pydantic
+# validation. Only dry-run paths honour it, since they never act on config
+# values beyond printing them. Do not set it for real runs.
+_SKIP_VALIDATION_ENV = "WOW_FORECASTER_SKIP_VALIDATION"
+
+
+@functools.lru_cache(maxsize=4)
+def _load_config_cached(
+    resolved_path: str | None,
+    env_snapshot: tuple[tuple[str, str], ...],
+    file_stamps: tuple[int | None, ...],
+    validate: bool,
+):
+    """Memoized ``load_config()``.
+
+    ``env_snapshot`` is part of the key because ``WOW_FORECASTER_*`` variables
+    override TOML values, so the same path can yield a different config.
+    ``file_stamps`` (mtimes of the TOML and its ``local.toml``) is part of it
+    so an edited file is re-read.  Failures raise and are therefore never
+    cached.
+    """
     from wow_forecaster.config import load_config
 
+    return load_config(
+        Path(resolved_path) if resolved_path else None, validate=validate
+    )
+
+
+def _config_file_stamps(resolved_path: str | None) -> tuple[int | None, ...]:
+    """``st_mtime_ns`` of each file ``load_config()`` reads (None if absent)."""
+    from wow_forecaster.config import config_file_paths
+
+    stamps: list[int | None] = []
+    for p in config_file_paths(Path(resolved_path) if resolved_path else None):
+        try:
+            stamps.append(p.stat().st_mtime_ns)
+        except OSError:
+            stamps.append(None)
+    return tuple(stamps)
+
+
+def _load_config_or_exit(config_path: str | None = None, dry_run: bool = False):
+    """Load AppConfig, printing a friendly error and exiting on failure.
+
+    Repeat calls in one process (helpers, in-process test runners) reuse the
+    first result. ``dry_run=True`` lets ``WOW_FORECASTER_SKIP_VALIDATION=1``
+    skip validation.
+    """
+    resolved = str(Path(config_path).resolve()) if config_path else None
+    env_snapshot = tuple(
+        sorted((k, v) for k, v in os.environ.items() if k.startswith("WOW_FORECASTER_"))
+    )
+    validate = not (dry_run and os.environ.get(_SKIP_VALIDATION_ENV) == "1")
     try:
-        cfg_path = Path(config_path) if config_path else None
-        return load_config(cfg_path)
+        return _load_config_cached(
+            resolved, env_snapshot, _config_file_stamps(resolved), validate
+        )
     except FileNotFoundError as exc:
         typer.echo(f"[ERROR] {exc}", err=True)
         raise typer.Exit(code=1) from None
@@ -68,6 +123,55 @@ def _configure_logging(config):
     configure_logging(config.logging)
 
 
+# Identities of DB files whose schema this process has already verified.
+_SCHEMA_READY: set[tuple[str, int, int]] = set()
+
+
+def _db_file_identity(db_path: str) -> tuple[str, int, int] | None:
+    """Return (real path, device, inode) for ``db_path``, or None if absent."""
+    try:
+        st = os.stat(db_path)
+    except OSError:
+        return None
+    return (os.path.realpath(db_path), st.st_dev, st.st_ino)
+
+
+def _ensure_schema(db_path: str, config) -> None:
+    """Apply the schema to ``db_path`` unless this process already has.
+
+    Keyed on the file's identity rather than its path, so a DB that is
+    deleted, or replaced by a restored backup, is checked again.
+    """
+    identity = _db_file_identity(db_path)
+    if identity is not None and identity in _SCHEMA_READY:
+        return
+
+    from wow_forecaster.db.connection import get_connection
+    from wow_forecaster.db.schema import apply_schema
+
+    with get_connection(db_path, **config.database.connection_kwargs()) as conn:
+        apply_schema(conn)
+
+    identity = _db_file_identity(db_path)
+    if identity is not None:
+        _SCHEMA_READY.add(identity)
+
+
+def _parse_date(value: str) -> date:
+    """Parse a ``--*-date`` option: an ISO date, or an ISO timestamp.
+
+    Timestamps (e.g. ``2024-09-10T00:00:00Z``) are reduced to their UTC date.
+    Raises ``ValueError`` on anything ``datetime.fromisoformat`` rejects.
+    """
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(UTC)
+    return parsed.date()
+
+
 def _load_archetype_names(db_path: str) -> dict[int, str]:
     """Return {archetype_id: display_name} from economic_archetypes."""
     import sqlite3 as _sqlite3
@@ -114,15 +218,16 @@ def init_db(
 
     with get_connection(
         target_path,
-        wal_mode=config.database.wal_mode,
-        busy_timeout_ms=config.database.busy_timeout_ms,
+        **config.database.connection_kwargs(),
     ) as conn:
         apply_schema(conn)
         migrations_applied = run_migrations(conn)
 
-    typer.echo(f"  Tables: {len(ALL_TABLE_NAMES)} created/verified.")
-    typer.echo(f"  Migrations applied: {migrations_applied}")
-    typer.echo("[OK] Database ready.")
+    typer.echo(
+        f"  Tables: {len(ALL_TABLE_NAMES)} created/verified.\n"
+        f"  Migrations applied: {migrations_applied}\n"
+        "[OK] Database ready."
+    )
 
 
 @app.command("validate-config")
@@ -144,23 +249,69 @@ def validate_config(
     """
     config = _load_config_or_exit(config_path)
 
-    typer.echo("Configuration validated successfully.")
-    typer.echo("")
-    typer.echo(f"  Database path:    {config.database.db_path}")
-    typer.echo(f"  Active expansion: {config.expansions.active}")
-    typer.echo(f"  Transfer target:  {config.expansions.transfer_target}")
-    typer.echo(f"  Default realms:   {', '.join(config.realms.defaults)}")
-    typer.echo(f"  Forecast horizons:{', '.join(config.forecast.horizons)}")
-    typer.echo(f"  Log level:        {config.logging.level}")
-    typer.echo(f"  Debug mode:       {config.debug}")
-
+    # Built up and echoed once: one write per stream instead of one per line.
+    lines = [
+        "Configuration validated successfully.",
+        "",
+        f"  Database path:    {config.database.db_path}",
+        f"  Active expansion: {config.expansions.active}",
+        f"  Transfer target:  {config.expansions.transfer_target}",
+        f"  Default realms:   {', '.join(config.realms.defaults)}",
+        f"  Forecast horizons:{', '.join(config.forecast.horizons)}",
+        f"  Log level:        {config.logging.level}",
+        f"  Debug mode:       {config.debug}",
+    ]
     if show_full:
-        typer.echo("")
-        typer.echo("Full config (JSON):")
-        typer.echo(json.dumps(config.model_dump(), indent=2, default=str))
+        lines += ["", "Full config (JSON):", config.model_dump_json(indent=2)]
+    lines += ["", "[OK] Config valid."]
+    typer.echo("\n".join(lines))
 
-    typer.echo("")
-    typer.echo("[OK] Config valid.")
+
+# Events validated and written per executemany() call in import-events.
+_EVENT_UPSERT_BATCH = 1000
+
+# Validation failures printed in full; the rest are only counted.
+_EVENT_ERRORS_SHOWN = 5
+
+
+def _iter_json_events(raw_events: list, errors: list[tuple[int, str | None]]):
+    """Yield a ``WoWEvent`` per valid JSON object, recording failures in ``errors``.
+
+    Lazy, so import-events holds at most one batch of validated models.
+    Exits on an entry that is not a JSON object at all. Only the first
+    ``_EVENT_ERRORS_SHOWN`` failures keep a message; later ones record None,
+    since they are only counted.
+    """
+    from pydantic import ValidationError
+
+    from wow_forecaster.models.event import WoWEvent
+
+    for i, raw in enumerate(raw_events):
+        if not isinstance(raw, dict):
+            typer.echo(
+                f"[ERROR] Malformed JSON object at index {i}: "
+                f"expected an object, got {type(raw).__name__}.",
+                err=True,
+            )
+            raise typer.Exit(code=1)
+        try:
+            event = WoWEvent(**raw)
+        except ValidationError as exc:
+            errors.append((i, str(exc) if len(errors) < _EVENT_ERRORS_SHOWN else None))
+            continue
+        yield event
+
+
+def _exit_on_event_errors(errors: list[tuple[int, str | None]]) -> None:
+    """Print the first few event validation failures and exit 1, if any."""
+    if not errors:
+        return
+    typer.echo(f"[ERROR] {len(errors)} event(s) failed validation:", err=True)
+    for idx, msg in errors[:_EVENT_ERRORS_SHOWN]:
+        typer.echo(f"  Event #{idx}: {msg}", err=True)
+    if len(errors) > _EVENT_ERRORS_SHOWN:
+        typer.echo(f"  ... and {len(errors) - _EVENT_ERRORS_SHOWN} more.", err=True)
+    raise typer.Exit(code=1)
 
 
 @app.command("import-events")
@@ -198,38 +349,47 @@ def import_events(
 
     Uses UPSERT semantics — existing events with the same slug are updated.
     """
-    from pydantic import ValidationError
+    from itertools import islice
 
-    from wow_forecaster.db.connection import get_connection
-    from wow_forecaster.db.repositories.event_repo import WoWEventRepository
-    from wow_forecaster.ingestion.event_csv import parse_event_csv
-    from wow_forecaster.models.event import WoWEvent
+    # Check an explicit --file before paying for config. A dry run of one needs
+    # no config at all: it validates the file and never opens the database.
+    if events_file and not os.path.isfile(events_file):
+        typer.echo(f"[ERROR] Events file not found: {events_file}", err=True)
+        raise typer.Exit(code=1)
 
-    config = _load_config_or_exit(config_path)
-    _configure_logging(config)
+    config = None
+    if events_file is None or not dry_run:
+        config = _load_config_or_exit(config_path, dry_run=dry_run)
+        _configure_logging(config)
 
     events_path = Path(events_file) if events_file else Path(config.data.events_seed_file)
 
-    if not events_path.exists():
+    # isfile, not exists: a directory must fail here, not later in the reader.
+    if not os.path.isfile(events_path):
         typer.echo(f"[ERROR] Events file not found: {events_path}", err=True)
         raise typer.Exit(code=1)
 
     typer.echo(f"Loading events from: {events_path}")
     fmt = events_path.suffix.lower()
-    validated: list[WoWEvent] = []
+    errors: list[tuple[int, str | None]] = []
 
+    # Each branch imports its own parser: pydantic and the event model load
+    # only once a file is actually going to be validated.
     if fmt == ".csv":
+        from wow_forecaster.ingestion.event_csv import parse_event_csv
+
         try:
-            validated = parse_event_csv(events_path)
+            events = parse_event_csv(events_path)
         except (FileNotFoundError, ValueError) as exc:
             typer.echo(f"[ERROR] CSV parse failed:\n{exc}", err=True)
             raise typer.Exit(code=1) from None
 
     elif fmt == ".json":
         try:
-            with open(events_path, encoding="utf-8") as f:
-                raw_events = json.load(f)
-        except (json.JSONDecodeError, OSError) as exc:
+            # json.loads takes the raw bytes and detects UTF-8/16/32 itself,
+            # so the file is read in one call with no text-layer decode.
+            raw_events = json.loads(events_path.read_bytes())
+        except (json.JSONDecodeError, UnicodeDecodeError, OSError) as exc:
             typer.echo(f"[ERROR] JSON parse error: {exc}", err=True)
             raise typer.Exit(code=1) from None
 
@@ -237,20 +397,7 @@ def import_events(
             typer.echo("[ERROR] JSON events file must contain an array.", err=True)
             raise typer.Exit(code=1)
 
-        errors: list[tuple[int, str]] = []
-        for i, raw in enumerate(raw_events):
-            try:
-                validated.append(WoWEvent(**raw))
-            except (ValidationError, Exception) as exc:
-                errors.append((i, str(exc)))
-
-        if errors:
-            typer.echo(f"[ERROR] {len(errors)} event(s) failed validation:", err=True)
-            for idx, msg in errors[:5]:
-                typer.echo(f"  Event #{idx}: {msg}", err=True)
-            if len(errors) > 5:
-                typer.echo(f"  ... and {len(errors) - 5} more.", err=True)
-            raise typer.Exit(code=1)
+        events = _iter_json_events(raw_events, errors)
 
     else:
         typer.echo(
@@ -258,24 +405,40 @@ def import_events(
         )
         raise typer.Exit(code=1)
 
-    typer.echo(f"  Validated {len(validated)} event(s) from {fmt} file.")
-
     if dry_run:
-        typer.echo("[DRY RUN] No events written to database.")
-        for ev in validated:
-            typer.echo(f"  {ev.slug} | {ev.event_type.value} | {ev.start_date}")
+        validated = list(events)
+        _exit_on_event_errors(errors)
+        lines = [
+            f"  Validated {len(validated)} event(s) from {fmt} file.",
+            "[DRY RUN] No events written to database.",
+        ]
+        lines += [f"  {ev.slug} | {ev.event_type.value} | {ev.start_date}" for ev in validated]
+        typer.echo("\n".join(lines))
         return
 
+    # Validation feeds the writes one batch at a time inside one explicit
+    # transaction. Any failure raises inside the connection block, which rolls
+    # back the batches already written, so an import with a bad event still
+    # writes nothing. IMMEDIATE takes the write lock up front, under
+    # busy_timeout, so a concurrent hourly run makes this wait rather than
+    # fail partway through.
+    from wow_forecaster.db.connection import get_connection
+    from wow_forecaster.db.repositories.event_repo import WoWEventRepository
+
+    written = 0
     with get_connection(
         config.database.db_path,
-        wal_mode=config.database.wal_mode,
-        busy_timeout_ms=config.database.busy_timeout_ms,
+        **config.database.connection_kwargs(),
     ) as conn:
+        conn.execute("BEGIN IMMEDIATE;")
         repo = WoWEventRepository(conn)
-        for ev in validated:
-            repo.upsert(ev)
+        pending = iter(events)
+        while batch := list(islice(pending, _EVENT_UPSERT_BATCH)):
+            written += repo.upsert_many(batch)
+        _exit_on_event_errors(errors)
 
-    typer.echo(f"  Upserted {len(validated)} event(s) into database.")
+    typer.echo(f"  Validated {written} event(s) from {fmt} file.")
+    typer.echo(f"  Upserted {written} event(s) into database.")
     typer.echo("[OK] Events imported.")
 
 
@@ -435,8 +598,6 @@ def bootstrap_items_cmd(
       wowfc build-events
       wowfc build-datasets
     """
-    import os
-
     from wow_forecaster.ingestion.item_bootstrapper import bootstrap_items
 
     config = _load_config_or_exit(config_path)
@@ -508,6 +669,12 @@ def run_hourly_refresh(
         "--check-drift/--no-check-drift",
         help="Run drift detection after normalize (default: on).",
     ),
+    workers: int = typer.Option(
+        1,
+        "--workers",
+        min=1,
+        help="Realms to ingest concurrently (capped at 8 and at the realm count).",
+    ),
     config_path: str | None = typer.Option(
         None,
         "--config",
@@ -545,9 +712,7 @@ def run_hourly_refresh(
 
     Without credentials the pipeline runs in fixture mode (synthetic sample data).
     """
-    from wow_forecaster.pipeline.orchestrator import HourlyOrchestrator
-
-    config = _load_config_or_exit(config_path)
+    config = _load_config_or_exit(config_path, dry_run=dry_run)
     _configure_logging(config)
 
     target_db     = db_path or config.database.db_path
@@ -555,7 +720,7 @@ def run_hourly_refresh(
 
     typer.echo(
         f"run-hourly-refresh | realms={', '.join(target_realms)} | "
-        f"check_drift={check_drift} | db={target_db}"
+        f"check_drift={check_drift} | workers={workers} | db={target_db}"
     )
 
     if dry_run:
@@ -568,36 +733,40 @@ def run_hourly_refresh(
             typer.echo("  [5] Provenance     -> source freshness summary")
         return
 
+    # Imported past the dry-run return: the orchestrator pulls in every stage.
+    from wow_forecaster.pipeline.orchestrator import HourlyOrchestrator
+
     orchestrator = HourlyOrchestrator(config=config, db_path=target_db)
     result = orchestrator.run(
         realm_slugs=target_realms,
         check_drift=check_drift,
         apply_adaptive=check_drift,
+        workers=workers,
     )
 
     # ── Print summary ─────────────────────────────────────────────────────────
-    typer.echo("")
+    # Built up and echoed once: one write per stream instead of one per line.
+    lines: list[str] = [""]
     for rr in result.realm_results:
         status_str = "ok" if rr.success else "FAIL"
         msg = f"  Ingest [{rr.realm_slug}] {status_str} | rows={rr.rows_written}"
         if rr.error:
             msg += f" | err={rr.error}"
-        typer.echo(msg)
+        lines.append(msg)
 
     norm_status = "ok" if result.normalize_success else "FAIL"
-    typer.echo(f"  Normalize       {norm_status} | rows={result.normalize_rows}")
+    lines.append(f"  Normalize       {norm_status} | rows={result.normalize_rows}")
 
     if result.drift_results:
-        typer.echo("")
-        typer.echo("  Drift check results:")
+        lines += ["", "  Drift check results:"]
         for realm_slug, dr in result.drift_results.items():
             retrain_flag = " [RETRAIN RECOMMENDED]" if dr.retrain_recommended else ""
             shock_flag   = " [EVENT SHOCK]" if dr.event_shock.shock_active else ""
-            typer.echo(
+            lines.append(
                 f"    {realm_slug:<20} drift={dr.overall_drift_level.value:<8} "
                 f"mult=x{dr.uncertainty_multiplier:.2f}{retrain_flag}{shock_flag}"
             )
-            typer.echo(
+            lines.append(
                 f"      data: {dr.data_drift.drift_level.value} "
                 f"({dr.data_drift.n_series_drifted}/{dr.data_drift.n_series_checked} series) | "
                 f"error: {dr.error_drift.drift_level.value} "
@@ -605,15 +774,14 @@ def run_hourly_refresh(
             )
 
     if result.monitoring_files:
-        typer.echo("")
-        typer.echo("  Monitoring outputs:")
-        for f in result.monitoring_files:
-            typer.echo(f"    {f}")
+        lines += ["", "  Monitoring outputs:"]
+        lines += [f"    {f}" for f in result.monitoring_files]
 
     if result.errors:
-        typer.echo("")
-        for e in result.errors:
-            typer.echo(f"  [WARN] {e}", err=True)
+        lines.append("")
+    typer.echo("\n".join(lines))
+    if result.errors:
+        typer.echo("\n".join(f"  [WARN] {e}" for e in result.errors), err=True)
 
     typer.echo("")
     status_tag = (
@@ -668,11 +836,9 @@ def train_model(
     \b
     Run 'build-datasets' first to generate the training Parquet.
     """
-    from wow_forecaster.db.connection import get_connection
-    from wow_forecaster.db.schema import apply_schema
     from wow_forecaster.pipeline.train import TrainStage
 
-    config = _load_config_or_exit(config_path)
+    config = _load_config_or_exit(config_path, dry_run=dry_run)
     _configure_logging(config)
 
     target_db     = db_path or config.database.db_path
@@ -693,12 +859,7 @@ def train_model(
             )
         return
 
-    with get_connection(
-        target_db,
-        wal_mode=config.database.wal_mode,
-        busy_timeout_ms=config.database.busy_timeout_ms,
-    ) as conn:
-        apply_schema(conn)
+    _ensure_schema(target_db, config)
 
     try:
         stage      = TrainStage(config=config, db_path=target_db)
@@ -760,8 +921,6 @@ def run_daily_forecast(
     Run 'build-datasets' first to generate the required feature Parquet files.
     Use --skip-train to reuse existing artifacts (useful for intra-day re-runs).
     """
-    from wow_forecaster.db.connection import get_connection
-    from wow_forecaster.db.schema import apply_schema
     from wow_forecaster.pipeline.forecast import ForecastStage
     from wow_forecaster.pipeline.recommend import RecommendStage
     from wow_forecaster.pipeline.train import TrainStage
@@ -777,13 +936,7 @@ def run_daily_forecast(
         f"skip_train={skip_train} | skip_recommend={skip_recommend}"
     )
 
-    # Ensure schema exists (idempotent).
-    with get_connection(
-        target_db,
-        wal_mode=config.database.wal_mode,
-        busy_timeout_ms=config.database.busy_timeout_ms,
-    ) as conn:
-        apply_schema(conn)
+    _ensure_schema(target_db, config)
 
     # ── Step 1: TrainStage ─────────────────────────────────────────────────────
     if not skip_train:
@@ -928,12 +1081,12 @@ def backtest(
     start_date: str = typer.Option(
         ...,
         "--start-date",
-        help="Start of backtest window (ISO date, e.g. 2024-09-10).",
+        help="Start of backtest window (ISO date or timestamp, e.g. 2024-09-10).",
     ),
     end_date: str = typer.Option(
         ...,
         "--end-date",
-        help="End of backtest window (ISO date, e.g. 2024-12-01).",
+        help="End of backtest window (ISO date or timestamp, e.g. 2024-12-01).",
     ),
     realm: str | None = typer.Option(
         None,
@@ -994,17 +1147,12 @@ def backtest(
       - Event window classification is post-hoc (never a model input).
       - target_price_* columns are never passed to any model.
     """
-    from wow_forecaster.db.connection import get_connection
-    from wow_forecaster.db.schema import apply_schema
     from wow_forecaster.pipeline.backtest import BacktestStage
 
-    config = _load_config_or_exit(config_path)
-    _configure_logging(config)
-
-    # Validate dates.
+    # Validate dates and horizons before paying for config: a typo exits here.
     try:
-        start = date.fromisoformat(start_date)
-        end   = date.fromisoformat(end_date)
+        start = _parse_date(start_date)
+        end   = _parse_date(end_date)
     except ValueError as exc:
         typer.echo(f"[ERROR] Invalid date format: {exc}", err=True)
         raise typer.Exit(code=1) from None
@@ -1024,6 +1172,9 @@ def backtest(
             typer.echo(f"[ERROR] Invalid --horizons value: {exc}", err=True)
             raise typer.Exit(code=1) from None
 
+    config = _load_config_or_exit(config_path, dry_run=dry_run)
+    _configure_logging(config)
+
     target_db    = db_path or config.database.db_path
     target_realm = realm or config.realms.defaults[0]
     win  = window_days or config.backtest.window_days
@@ -1038,23 +1189,20 @@ def backtest(
     if dry_run:
         from wow_forecaster.backtest.models import all_baseline_models
         from wow_forecaster.backtest.splits import generate_walk_forward_splits
-        models = all_baseline_models()
+        model_names = [m.name for m in all_baseline_models()]
+        # Fold cutoffs do not depend on the horizon, so generate them once for
+        # the shortest horizon and count, per horizon, the ones still in range.
+        cutoffs = [
+            f.train_end
+            for f in generate_walk_forward_splits(start, end, win, step, min(hors))
+        ]
         typer.echo("[DRY RUN] Would execute:")
         for h in hors:
-            folds = generate_walk_forward_splits(start, end, win, step, h)
-            typer.echo(
-                f"  horizon={h}d | folds={len(folds)} | "
-                f"models={[m.name for m in models]}"
-            )
+            n_folds = sum(1 for c in cutoffs if c + timedelta(days=h) <= end)
+            typer.echo(f"  horizon={h}d | folds={n_folds} | models={model_names}")
         return
 
-    # Ensure schema exists (idempotent).
-    with get_connection(
-        target_db,
-        wal_mode=config.database.wal_mode,
-        busy_timeout_ms=config.database.busy_timeout_ms,
-    ) as conn:
-        apply_schema(conn)
+    _ensure_schema(target_db, config)
 
     typer.echo("  Running BacktestStage ...")
     try:
@@ -1121,11 +1269,7 @@ def report_backtest(
     Use --run-id to target a specific run; otherwise the most recent run
     matching --realm is shown.
     """
-    from wow_forecaster.backtest.metrics import PredictionRecord
-    from wow_forecaster.backtest.slices import (
-        slice_by_event_window,
-        slice_by_model_and_horizon,
-    )
+    from wow_forecaster.backtest.reporter import query_report_metrics
     from wow_forecaster.db.connection import get_connection
 
     config = _load_config_or_exit(config_path)
@@ -1135,8 +1279,8 @@ def report_backtest(
 
     with get_connection(
         target_db,
-        wal_mode=config.database.wal_mode,
-        busy_timeout_ms=config.database.busy_timeout_ms,
+        **config.database.connection_kwargs(),
+        read_only=True,
     ) as conn:
         # ── Find the target backtest run ─────────────────────────────────────
         if backtest_run_id is not None:
@@ -1168,69 +1312,38 @@ def report_backtest(
         fold_count  = run_row["fold_count"]
         window_days = run_row["window_days"]
 
-        typer.echo("")
-        typer.echo("=== Backtest Report ===")
-        typer.echo(f"  Run ID:      {bt_run_id}")
-        typer.echo(f"  Realm:       {realm_slug}")
-        typer.echo(f"  Date range:  {bt_start} -> {bt_end}")
-        typer.echo(f"  Window:      {window_days}d | Folds: {fold_count}")
-
-        # ── Load prediction records ──────────────────────────────────────────
-        q_results = """
-            SELECT fold_index, archetype_id, realm_slug, category_tag,
-                   model_name, train_end, test_date, horizon_days,
-                   actual_price, predicted_price,
-                   direction_actual, direction_predicted, direction_correct,
-                   is_event_window
-            FROM backtest_fold_results
-            WHERE backtest_run_id = ?
-        """
-        params_r: list = [bt_run_id]
-        if horizon is not None:
-            q_results += " AND horizon_days = ?"
-            params_r.append(horizon)
-        result_rows = conn.execute(q_results, params_r).fetchall()
-
-    if not result_rows:
-        typer.echo("  No prediction records found for this run.")
+        # Built up and echoed once: one write per stream instead of one per line.
+        lines: list[str] = [
+            "",
+            "=== Backtest Report ===",
+            f"  Run ID:      {bt_run_id}",
+            f"  Realm:       {realm_slug}",
+            f"  Date range:  {bt_start} -> {bt_end}",
+            f"  Window:      {window_days}d | Folds: {fold_count}",
+        ]
+
+        # ── Aggregate in SQLite: one scan, one row per group comes back ─────────
+        model_metrics, event_metrics = query_report_metrics(conn, bt_run_id, horizon)
+
+    n_records = sum(m.n_predictions for m in model_metrics.values())
+    if not n_records:
+        lines.append("  No prediction records found for this run.")
+        typer.echo("\n".join(lines))
         raise typer.Exit(code=0)
 
-    # ── Reconstruct PredictionRecords ────────────────────────────────────────
-    import datetime as _dt
-    records: list[PredictionRecord] = []
-    for r in result_rows:
-        try:
-            train_end  = _dt.date.fromisoformat(r["train_end"])
-            test_date  = _dt.date.fromisoformat(r["test_date"])
-        except (ValueError, TypeError):
-            continue
-        records.append(PredictionRecord(
-            fold_index=r["fold_index"],
-            archetype_id=r["archetype_id"],
-            realm_slug=r["realm_slug"],
-            category_tag=r["category_tag"],
-            model_name=r["model_name"],
-            train_end=train_end,
-            test_date=test_date,
-            horizon_days=r["horizon_days"],
-            actual_price=r["actual_price"],
-            predicted_price=r["predicted_price"],
-            last_known_price=None,  # not stored; not needed for reporting
-            is_event_window=bool(r["is_event_window"]),
-        ))
-
-    typer.echo(f"  Predictions: {len(records)}")
+    lines.append(f"  Predictions: {n_records}")
 
     # ── Per-model × horizon metrics ──────────────────────────────────────────
-    model_metrics = slice_by_model_and_horizon(records)
-    typer.echo("")
-    typer.echo("Per-model metrics (MAE in gold | RMSE | MAPE | Dir.Acc):")
     header = (
         f"  {'Model':<22} {'H':>3}  {'N':>6}  {'MAE':>8}  "
         f"{'RMSE':>8}  {'MAPE':>7}  {'DirAcc':>7}"
     )
-    typer.echo(header)
-    typer.echo("  " + "-" * (len(header) - 2))
+    lines += [
+        "",
+        "Per-model metrics (MAE in gold | RMSE | MAPE | Dir.Acc):",
+        header,
+        "  " + "-" * (len(header) - 2),
+    ]
     for (model_name, h), m in sorted(model_metrics.items()):
         mae_str  = f"{m.mae:.2f}"  if m.mae  is not None else "  N/A"
         rmse_str = f"{m.rmse:.2f}" if m.rmse is not None else "  N/A"
@@ -1239,28 +1352,26 @@ def report_backtest(
             f"{m.directional_accuracy:.1%}"
             if m.directional_accuracy is not None else "  N/A"
         )
-        typer.echo(
+        lines.append(
             f"  {model_name:<22} {h:>3}  {m.n_evaluated:>6}  "
             f"{mae_str:>8}  {rmse_str:>8}  {mape_str:>7}  {dir_str:>7}"
         )
 
     # ── Event vs non-event split ─────────────────────────────────────────────
-    event_metrics = slice_by_event_window(records)
     if len(event_metrics) > 1:
-        typer.echo("")
-        typer.echo("Event vs non-event accuracy (all models combined):")
+        lines += ["", "Event vs non-event accuracy (all models combined):"]
         for window_key, m in sorted(event_metrics.items()):
             mae_str = f"{m.mae:.2f}" if m.mae is not None else "N/A"
             dir_str = (
                 f"{m.directional_accuracy:.1%}"
                 if m.directional_accuracy is not None else "N/A"
             )
-            typer.echo(
+            lines.append(
                 f"  {window_key:<20} N={m.n_evaluated:>5}  MAE={mae_str}  DirAcc={dir_str}"
             )
 
-    typer.echo("")
-    typer.echo("[OK] Report complete.")
+    lines += ["", "[OK] Report complete."]
+    typer.echo("\n".join(lines))
 
 
 @app.command("build-events")
@@ -1342,8 +1453,7 @@ def build_events_cmd(
 
     with get_connection(
         target_db,
-        wal_mode=config.database.wal_mode,
-        busy_timeout_ms=config.database.busy_timeout_ms,
+        **config.database.connection_kwargs(),
     ) as conn:
         apply_schema(conn)
         events_n, impacts_n = build_events_table(
@@ -1398,8 +1508,8 @@ def list_events_cmd(
 
     with get_connection(
         target_db,
-        wal_mode=config.database.wal_mode,
-        busy_timeout_ms=config.database.busy_timeout_ms,
+        **config.database.connection_kwargs(),
+        read_only=True,
     ) as conn:
         conn.row_factory = __import__("sqlite3").Row
         cur = conn.cursor()
@@ -1474,6 +1584,12 @@ def build_datasets_cmd(
         "--dry-run",
         help="Validate inputs and print what would be built, then exit without writing files.",
     ),
+    workers: int = typer.Option(
+        1,
+        "--workers",
+        min=1,
+        help="Realms to build in parallel worker processes (capped at the realm count).",
+    ),
     db_path: str | None = typer.Option(
         None,
         "--db-path",
@@ -1502,13 +1618,7 @@ def build_datasets_cmd(
       data/processed/features/inference/inference_{realm}_{today}.parquet
       data/processed/features/manifests/manifest_{realm}_{today}.json
     """
-    from wow_forecaster.db.connection import get_connection
-    from wow_forecaster.db.schema import apply_schema
-    from wow_forecaster.features.dataset_builder import build_datasets
-    from wow_forecaster.models.meta import RunMetadata
-    from wow_forecaster.utils.time_utils import utcnow
-
-    config = _load_config_or_exit(config_path)
+    config = _load_config_or_exit(config_path, dry_run=dry_run)
     _configure_logging(config)
 
     target_db = db_path or config.database.db_path
@@ -1518,9 +1628,9 @@ def build_datasets_cmd(
     # Use today + 1 so observations with a UTC timestamp that crosses midnight
     # (e.g. 00:22 UTC = evening prior day locally) are always included.
     try:
-        end = date.fromisoformat(end_date) if end_date else date.today() + timedelta(days=1)
+        end = _parse_date(end_date) if end_date else date.today() + timedelta(days=1)
         start = (
-            date.fromisoformat(start_date)
+            _parse_date(start_date)
             if start_date
             else end - timedelta(days=config.features.training_lookback_days)
         )
@@ -1555,13 +1665,13 @@ def build_datasets_cmd(
             )
         return
 
-    # Ensure schema exists.
-    with get_connection(
-        target_db,
-        wal_mode=config.database.wal_mode,
-        busy_timeout_ms=config.database.busy_timeout_ms,
-    ) as conn:
-        apply_schema(conn)
+    # Imported past the dry-run return: dataset_builder pulls in pyarrow and
+    # numpy, which a dry run never touches.
+    from wow_forecaster.db.connection import get_connection
+    from wow_forecaster.db.schema import apply_schema
+    from wow_forecaster.features.dataset_builder import build_datasets
+    from wow_forecaster.models.meta import RunMetadata
+    from wow_forecaster.utils.time_utils import utcnow
 
     # Create a RunMetadata for this build.
     run = RunMetadata(
@@ -1571,12 +1681,13 @@ def build_datasets_cmd(
         started_at=utcnow(),
     )
 
+    # One connection for both: schema check, then the build.
     try:
         with get_connection(
             target_db,
-            wal_mode=config.database.wal_mode,
-            busy_timeout_ms=config.database.busy_timeout_ms,
+            **config.database.connection_kwargs(),
         ) as conn:
+            apply_schema(conn)
             total = build_datasets(
                 conn=conn,
                 config=config,
@@ -1586,6 +1697,8 @@ def build_datasets_cmd(
                 end_date=end,
                 build_training=True,
                 build_inference=not no_inference,
+                db_path=target_db,
+                workers=workers,
             )
     except Exception as exc:
         typer.echo(f"[ERROR] Dataset build failed: {exc}", err=True)
@@ -1625,7 +1738,10 @@ def validate_datasets_cmd(
     """
     import pyarrow.parquet as pq
 
-    from wow_forecaster.features.quality import build_quality_report
+    from wow_forecaster.features.quality import (
+        QUALITY_REPORT_COLUMNS,
+        build_quality_report_arrow,
+    )
 
     config = _load_config_or_exit(config_path)
     _configure_logging(config)
@@ -1636,8 +1752,7 @@ def validate_datasets_cmd(
         raise typer.Exit(code=1)
 
     try:
-        with open(manifest_path, encoding="utf-8") as f:
-            manifest_data = json.load(f)
+        manifest_data = json.loads(manifest_path.read_bytes())
     except (json.JSONDecodeError, OSError) as exc:
         typer.echo(f"[ERROR] Failed to read manifest: {exc}", err=True)
         raise typer.Exit(code=1) from None
@@ -1651,15 +1766,21 @@ def validate_datasets_cmd(
 
     typer.echo(f"Loading Parquet: {training_path}")
     try:
-        table = pq.read_table(str(training_path))
-        rows = table.to_pylist()
+        # A registry column absent from an older file reads as all-null in the
+        # report either way, so project to the intersection.
+        present = set(pq.read_schema(str(training_path)).names)
+        table = pq.read_table(
+            str(training_path),
+            columns=[c for c in QUALITY_REPORT_COLUMNS if c in present],
+            memory_map=True,
+        )
     except Exception as exc:
         typer.echo(f"[ERROR] Failed to read Parquet: {exc}", err=True)
         raise typer.Exit(code=1) from None
 
-    typer.echo(f"Running quality report on {len(rows)} rows...")
+    typer.echo(f"Running quality report on {table.num_rows} rows...")
     items_excluded = manifest_data.get("quality", {}).get("items_excluded_no_archetype", 0)
-    report = build_quality_report(rows, items_excluded=items_excluded)
+    report = build_quality_report_arrow(table, items_excluded=items_excluded)
 
     # ── Print report ──────────────────────────────────────────────────────────
     typer.echo("")
@@ -1755,9 +1876,9 @@ def evaluate_live_forecast(
       Optionally writes data/outputs/monitoring/model_health_{realm}_{date}.json.
     """
     from wow_forecaster.db.connection import get_connection
-    from wow_forecaster.monitoring.health import compute_health_summary
+    from wow_forecaster.monitoring.health import compute_health_summaries
     from wow_forecaster.monitoring.reporter import (
-        persist_health_to_db,
+        persist_health_summaries,
         write_health_report,
     )
 
@@ -1773,21 +1894,17 @@ def evaluate_live_forecast(
         f"horizons={horizons} | window={window_days}d"
     )
 
-    summaries = []
     with get_connection(
         target_db,
-        wal_mode=config.database.wal_mode,
-        busy_timeout_ms=config.database.busy_timeout_ms,
+        **config.database.connection_kwargs(),
     ) as conn:
-        for h in horizons:
-            s = compute_health_summary(
-                conn=conn,
-                realm_slug=target_realm,
-                horizon_days=h,
-                window_days=window_days,
-            )
-            summaries.append(s)
-            persist_health_to_db(conn, run_id=0, summary=s)
+        summaries = compute_health_summaries(
+            conn=conn,
+            realm_slug=target_realm,
+            horizons=horizons,
+            window_days=window_days,
+        )
+        persist_health_summaries(conn, run_id=0, summaries=summaries)
 
     # ── Print table ───────────────────────────────────────────────────────────
     typer.echo("")
@@ -1811,7 +1928,6 @@ def evaluate_live_forecast(
         )
 
     if output_json and summaries:
-        from pathlib import Path
         out_dir = Path(config.monitoring.monitoring_output_dir)
         p = write_health_report(summaries, out_dir, target_realm)
         typer.echo("")
@@ -1873,8 +1989,6 @@ def check_drift(
     \b
     The latest uncertainty_mult is read by RecommendStage to widen CIs.
     """
-    from pathlib import Path
-
     from wow_forecaster.db.connection import get_connection
     from wow_forecaster.monitoring.drift import DriftChecker
     from wow_forecaster.monitoring.reporter import (
@@ -1893,8 +2007,7 @@ def check_drift(
 
     with get_connection(
         target_db,
-        wal_mode=config.database.wal_mode,
-        busy_timeout_ms=config.database.busy_timeout_ms,
+        **config.database.connection_kwargs(),
     ) as conn:
         checker = DriftChecker(
             conn=conn,
@@ -1998,7 +2111,8 @@ def report_top_items_cmd(
         None,
         "--export",
         help=(
-            "Write a flat CSV export to this path (for Power BI / manual analysis). "
+            "Write a flat export to this path (for Power BI / manual analysis): "
+            "Parquet for .parquet, Feather for .feather, otherwise CSV. "
             "E.g. --export data/exports/top_items.csv"
         ),
     ),
@@ -2058,15 +2172,14 @@ def report_top_items_cmd(
     Run 'run-daily-forecast' to refresh the underlying data.
 
     \b
-    Use --export PATH to write a flat CSV for Power BI or Excel.
+    Use --export PATH to write a flat CSV for Power BI or Excel (or a
+    .parquet / .feather path for a typed columnar file).
     Each row includes all score components as separate columns.
     """
-    from pathlib import Path as _Path
-
     from wow_forecaster.db.connection import get_connection
     from wow_forecaster.recommendations.item_overlay import fetch_item_discounts
     from wow_forecaster.reporting.export import (
-        export_to_csv,
+        export_records,
         flatten_recommendations_for_export,
     )
     from wow_forecaster.reporting.formatters import format_top_items_table
@@ -2079,7 +2192,7 @@ def report_top_items_cmd(
     _configure_logging(config)
 
     target_realm      = realm or config.realms.defaults[0]
-    out_dir           = _Path(config.model.recommendation_output_dir)
+    out_dir           = Path(config.model.recommendation_output_dir)
     target_expansion  = expansion or config.expansions.transfer_target
 
     recs = load_recommendations_report(target_realm, out_dir)
@@ -2109,8 +2222,8 @@ def report_top_items_cmd(
     try:
         with get_connection(
             target_db,
-            wal_mode=config.database.wal_mode,
-            busy_timeout_ms=config.database.busy_timeout_ms,
+            **config.database.connection_kwargs(),
+            read_only=True,
         ) as conn:
             for cat_items in categories.values():
                 for rec in cat_items:
@@ -2160,7 +2273,7 @@ def report_top_items_cmd(
         rows = flatten_recommendations_for_export(recs)
         if horizon:
             rows = [r for r in rows if r.get("horizon") == horizon]
-        p = export_to_csv(rows, _Path(export))
+        p = export_records(rows, Path(export))
         typer.echo(f"\n  Exported {len(rows)} rows to: {p}")
 
     typer.echo("")
@@ -2187,7 +2300,8 @@ def report_forecasts_cmd(
     export: str | None = typer.Option(
         None,
         "--export",
-        help="Write full forecast CSV (with ci_width_gold column) to this path.",
+        help="Write the full forecast set (with ci_width_gold column) to this path "
+             "(.parquet / .feather / CSV by suffix).",
     ),
     freshness_hours: float = typer.Option(
         4.0,
@@ -2217,24 +2331,24 @@ def report_forecasts_cmd(
 
     \b
     Use --export PATH to write the full forecast set (with computed
-    ci_width_gold and ci_pct_of_price columns) to a CSV file.
+    ci_width_gold and ci_pct_of_price columns) to a CSV file, or to
+    Parquet / Feather when PATH ends in .parquet / .feather.
     """
-    from pathlib import Path as _Path
-
     from wow_forecaster.reporting.export import (
-        export_to_csv,
+        FORECAST_FLOAT_COLUMNS,
+        export_records,
         flatten_forecast_records_for_export,
     )
     from wow_forecaster.reporting.formatters import format_forecast_summary
-    from wow_forecaster.reporting.reader import load_forecast_records
+    from wow_forecaster.reporting.reader import load_forecast_records_with_mtime
 
     config = _load_config_or_exit(config_path)
     _configure_logging(config)
 
     target_realm = realm or config.realms.defaults[0]
-    out_dir      = _Path(config.model.forecast_output_dir)
+    out_dir      = Path(config.model.forecast_output_dir)
 
-    records = load_forecast_records(target_realm, out_dir)
+    records, csv_mtime = load_forecast_records_with_mtime(target_realm, out_dir)
     if records is None:
         typer.echo(
             f"[INFO] No forecast CSV found for realm={target_realm} in {out_dir}"
@@ -2251,16 +2365,8 @@ def report_forecasts_cmd(
                 r["archetype_sub_tag"] = arch_names.get(int(arch_id), str(arch_id))
 
     # Freshness: use file mtime as proxy (CSV has no embedded timestamp).
-    from wow_forecaster.reporting.reader import find_latest_file
-    csv_path = find_latest_file(out_dir, f"forecast_{target_realm}_*.csv")
-    age_hours: float | None = None
-    is_fresh  = True
-    if csv_path is not None:
-        import os as _os
-        mtime     = _os.path.getmtime(csv_path)
-        import time as _time
-        age_hours = (_time.time() - mtime) / 3600.0
-        is_fresh  = age_hours <= freshness_hours
+    age_hours = (time.time() - csv_mtime) / 3600.0
+    is_fresh  = age_hours <= freshness_hours
 
     typer.echo(
         format_forecast_summary(
@@ -2274,14 +2380,14 @@ def report_forecasts_cmd(
     )
 
     if export:
-        enriched = flatten_forecast_records_for_export(records)
         if horizon:
-            enriched = [r for r in enriched if r.get("horizon") == horizon]
-        p = export_to_csv(enriched, _Path(export))
+            records = [r for r in records if r.get("horizon") == horizon]
+        # Filter before flattening so only exported rows get the CI columns.
+        enriched = flatten_forecast_records_for_export(records)
+        p = export_records(enriched, Path(export), float_columns=FORECAST_FLOAT_COLUMNS)
         typer.echo(f"\n  Exported {len(enriched)} rows to: {p}")
 
-    typer.echo("")
-    typer.echo("[OK] report-forecasts complete.")
+    typer.echo("\n[OK] report-forecasts complete.")
 
 
 @app.command("report-volatility")
@@ -2299,7 +2405,7 @@ def report_volatility_cmd(
     export: str | None = typer.Option(
         None,
         "--export",
-        help="Write watchlist CSV to this path.",
+        help="Write the watchlist to this path (.parquet / .feather / CSV by suffix).",
     ),
     freshness_hours: float = typer.Option(
         4.0,
@@ -2326,23 +2432,20 @@ def report_volatility_cmd(
 
     \b
     Reads forecast_{realm}_{date}.csv from data/outputs/forecasts/.
-    Use --export PATH to write the sorted watchlist to a CSV file.
+    Use --export PATH to write the sorted watchlist to a CSV file
+    (.parquet / .feather paths write a columnar file instead).
     """
-    import os as _os
-    import time as _time
-    from pathlib import Path as _Path
-
-    from wow_forecaster.reporting.export import export_to_csv
+    from wow_forecaster.reporting.export import FORECAST_FLOAT_COLUMNS, export_records
     from wow_forecaster.reporting.formatters import format_volatility_watchlist
-    from wow_forecaster.reporting.reader import find_latest_file, load_forecast_records
+    from wow_forecaster.reporting.reader import load_forecast_records_with_mtime
 
     config = _load_config_or_exit(config_path)
     _configure_logging(config)
 
     target_realm = realm or config.realms.defaults[0]
-    out_dir      = _Path(config.model.forecast_output_dir)
+    out_dir      = Path(config.model.forecast_output_dir)
 
-    records = load_forecast_records(target_realm, out_dir)
+    records, csv_mtime = load_forecast_records_with_mtime(target_realm, out_dir)
     if records is None:
         typer.echo(
             f"[INFO] No forecast CSV found for realm={target_realm} in {out_dir}"
@@ -2358,12 +2461,8 @@ def report_volatility_cmd(
             if arch_id is not None:
                 r["archetype_sub_tag"] = arch_names.get(int(arch_id), str(arch_id))
 
-    csv_path = find_latest_file(out_dir, f"forecast_{target_realm}_*.csv")
-    age_hours_: float | None = None
-    is_fresh_  = True
-    if csv_path is not None:
-        age_hours_ = (_time.time() - _os.path.getmtime(csv_path)) / 3600.0
-        is_fresh_  = age_hours_ <= freshness_hours
+    age_hours_ = (time.time() - csv_mtime) / 3600.0
+    is_fresh_  = age_hours_ <= freshness_hours
 
     typer.echo(
         format_volatility_watchlist(
@@ -2379,17 +2478,12 @@ def report_volatility_cmd(
         # Enrich with ci_width / ci_pct and sort before export.
         from wow_forecaster.reporting.export import flatten_forecast_records_for_export
         enriched = flatten_forecast_records_for_export(records)
-        try:
-            enriched.sort(
-                key=lambda r: -(float(r.get("ci_width_gold") or 0))
-            )
-        except (TypeError, ValueError):
-            pass
-        p = export_to_csv(enriched, _Path(export))
+        # ci_width_gold is already a float (or None) after flattening.
+        enriched.sort(key=lambda r: r["ci_width_gold"] or 0.0, reverse=True)
+        p = export_records(enriched, Path(export), float_columns=FORECAST_FLOAT_COLUMNS)
         typer.echo(f"\n  Exported {len(enriched)} rows to: {p}")
 
-    typer.echo("")
-    typer.echo("[OK] report-volatility complete.")
+    typer.echo("\n[OK] report-volatility complete.")
 
 
 @app.command("report-drift")
@@ -2438,8 +2532,6 @@ def report_drift_cmd(
     Run 'check-drift' to refresh the drift report.
     Run 'evaluate-live-forecast' to refresh the model health report.
     """
-    from pathlib import Path as _Path
-
     from wow_forecaster.reporting.export import export_to_json
     from wow_forecaster.reporting.formatters import format_drift_health_summary
     from wow_forecaster.reporting.reader import (
@@ -2452,16 +2544,18 @@ def report_drift_cmd(
     _configure_logging(config)
 
     target_realm = realm or config.realms.defaults[0]
-    mon_dir      = _Path(config.monitoring.monitoring_output_dir)
+    mon_dir      = Path(config.monitoring.monitoring_output_dir)
 
     drift  = load_drift_report(target_realm, mon_dir)
     health = load_health_report(target_realm, mon_dir)
 
+    # One clock reading so both reports are aged against the same instant.
+    now = datetime.now(tz=UTC)
     is_fresh_d, age_d = check_freshness(
-        drift.get("checked_at")  if drift  else None, freshness_hours
+        drift.get("checked_at")  if drift  else None, freshness_hours, now=now
     )
     is_fresh_h, age_h = check_freshness(
-        health.get("checked_at") if health else None, freshness_hours
+        health.get("checked_at") if health else None, freshness_hours, now=now
     )
 
     typer.echo(
@@ -2481,7 +2575,7 @@ def report_drift_cmd(
             "drift":  drift  or {},
             "health": health or {},
         }
-        p = export_to_json(payload, _Path(export))
+        p = export_to_json(payload, Path(export))
         typer.echo(f"\n  Exported drift+health to: {p}")
 
     typer.echo("")
@@ -2535,8 +2629,6 @@ def report_status_cmd(
     \b
     Run 'run-hourly-refresh' to produce a fresh provenance report.
     """
-    from pathlib import Path as _Path
-
     from wow_forecaster.reporting.export import export_to_json
     from wow_forecaster.reporting.formatters import format_status_summary
     from wow_forecaster.reporting.reader import (
@@ -2548,7 +2640,7 @@ def report_status_cmd(
     _configure_logging(config)
 
     target_realm = realm or config.realms.defaults[0]
-    mon_dir      = _Path(config.monitoring.monitoring_output_dir)
+    mon_dir      = Path(config.monitoring.monitoring_output_dir)
 
     prov = load_provenance_report(target_realm, mon_dir)
 
@@ -2566,7 +2658,7 @@ def report_status_cmd(
     )
 
     if export and prov:
-        p = export_to_json(prov, _Path(export))
+        p = export_to_json(prov, Path(export))
         typer.echo(f"\n  Exported provenance to: {p}")
 
     typer.echo("")
@@ -2646,7 +2738,6 @@ def check_data_health_cmd(
         wow-forecaster check-data-health --stale-hours 6
     """
     import sqlite3 as _sqlite3
-    from pathlib import Path as _Path
 
     from wow_forecaster.reporting.health import (
         collect_health_report,
@@ -2663,7 +2754,7 @@ def check_data_health_cmd(
     _configure_logging(config)
 
     target_realm = realm or config.realms.defaults[0]
-    db_path = _Path(config.database.db_path)
+    db_path = Path(config.database.db_path)
 
     conn = _sqlite3.connect(str(db_path))
     conn.row_factory = _sqlite3.Row
@@ -2774,15 +2865,13 @@ def list_sources_cmd(
 
     typer.echo(
         f"\n  Source Registry  ({len(policies)} sources, "
-        f"{n_enabled} enabled, {n_disabled} disabled)"
+        f"{n_enabled} enabled, {n_disabled} disabled)\n"
+        f"  Config: {sources_path}\n"
     )
-    typer.echo(f"  Config: {sources_path}")
-    typer.echo("")
 
     if verbose:
-        for p in policies:
-            typer.echo(format_source_detail(p))
-            typer.echo("")
+        # One echo for every detail block: click.echo flushes after each call.
+        typer.echo("".join(f"{format_source_detail(p)}\n\n" for p in policies), nl=False)
     else:
         typer.echo(format_source_table(policies))
         typer.echo("  Use --verbose for full rate-limit, backoff, and policy details.")
@@ -2821,9 +2910,6 @@ def validate_source_policies_cmd(
     \b
     Run this after editing config/sources.toml to catch mistakes early.
     """
-    import tomllib as _tomllib
-    from pathlib import Path as _Path
-
     from pydantic import ValidationError
 
     from wow_forecaster.governance.models import (
@@ -2840,7 +2926,7 @@ def validate_source_policies_cmd(
     config = _load_config_or_exit(config_path)
     _configure_logging(config)
 
-    sources_path = _Path(config.governance.sources_config_path)
+    sources_path = Path(config.governance.sources_config_path)
     typer.echo(f"\n  Validating source policies in: {sources_path}\n")
 
     if not sources_path.exists():
@@ -2852,7 +2938,7 @@ def validate_source_policies_cmd(
         raise typer.Exit(code=1)
 
     with open(sources_path, "rb") as f:
-        raw = _tomllib.load(f)
+        raw = tomllib.load(f)
 
     sources_raw = raw.get("sources", {})
     if not sources_raw:
@@ -2944,7 +3030,10 @@ def check_source_freshness_cmd(
     """
 
     from wow_forecaster.db.connection import get_connection
-    from wow_forecaster.governance.freshness import check_all_sources_freshness
+    from wow_forecaster.governance.freshness import (
+        FreshnessStatus,
+        check_all_sources_freshness,
+    )
     from wow_forecaster.governance.registry import list_sources
     from wow_forecaster.governance.reporter import format_freshness_table, write_governance_report
 
@@ -2960,29 +3049,30 @@ def check_source_freshness_cmd(
         typer.echo(f"[ERROR] {exc}", err=True)
         raise typer.Exit(code=1) from None
 
-    typer.echo("\n  Source Freshness Check")
-    typer.echo(f"  Sources config : {sources_path}")
-    typer.echo(f"  DB             : {target_db}")
-    if realm:
-        typer.echo(f"  Realm filter   : {realm}")
-    typer.echo("")
+    realm_line = f"  Realm filter   : {realm}\n" if realm else ""
+    typer.echo(
+        "\n  Source Freshness Check\n"
+        f"  Sources config : {sources_path}\n"
+        f"  DB             : {target_db}\n"
+        f"{realm_line}"
+    )
 
     with get_connection(
         target_db,
-        wal_mode=config.database.wal_mode,
-        busy_timeout_ms=config.database.busy_timeout_ms,
+        **config.database.connection_kwargs(),
+        read_only=True,
     ) as conn:
         results = check_all_sources_freshness(conn, policies, realm_slug=realm)
 
     typer.echo(format_freshness_table(results, realm_slug=realm))
 
-    # Summary counts
-    from wow_forecaster.governance.freshness import FreshnessStatus
-    n_fresh    = sum(1 for r in results if r.status == FreshnessStatus.FRESH)
-    n_aging    = sum(1 for r in results if r.status == FreshnessStatus.AGING)
-    n_stale    = sum(1 for r in results if r.status == FreshnessStatus.STALE)
-    n_critical = sum(1 for r in results if r.status == FreshnessStatus.CRITICAL)
-    n_unknown  = sum(1 for r in results if r.status == FreshnessStatus.UNKNOWN)
+    # Summary counts, tallied in one pass.
+    counts     = Counter(r.status for r in results)
+    n_fresh    = counts[FreshnessStatus.FRESH]
+    n_aging    = counts[FreshnessStatus.AGING]
+    n_stale    = counts[FreshnessStatus.STALE]
+    n_critical = counts[FreshnessStatus.CRITICAL]
+    n_unknown  = counts[FreshnessStatus.UNKNOWN]
 
     typer.echo(
         f"  Summary: {n_fresh} fresh, {n_aging} aging, {n_stale} stale, "
@@ -2993,8 +3083,7 @@ def check_source_freshness_cmd(
         out = write_governance_report(policies, results, export)
         typer.echo(f"\n  Exported governance report to: {out}")
 
-    typer.echo("")
-    typer.echo("[OK] check-source-freshness complete.")
+    typer.echo("\n[OK] check-source-freshness complete.")
 
 
 @app.command("start-scheduler")
@@ -3050,8 +3139,6 @@ def start_scheduler_cmd(
     Alternative: register Windows Task Scheduler tasks instead of running
     this daemon.  See scripts/setup_tasks.bat for one-command setup.
     """
-    from pathlib import Path as _Path
-
     from wow_forecaster.scheduler import SchedulerDaemon
 
     config = _load_config_or_exit(config_path)
@@ -3059,7 +3146,7 @@ def start_scheduler_cmd(
 
     target_realm = realm or (list(config.realms.defaults)[0] if config.realms.defaults else "us")
     target_db = db_path or config.database.db_path
-    target_log_dir = _Path(log_dir) if log_dir else _Path("logs")
+    target_log_dir = Path(log_dir) if log_dir else Path("logs")
 
     typer.echo("Starting scheduler daemon...")
     typer.echo(f"  Realm      : {target_realm}")
@@ -3126,8 +3213,6 @@ def seed_recipes(
         wow-forecaster seed-recipes --all               # all expansions
         wow-forecaster seed-recipes --professions alchemy,enchanting
     """
-    import os as _os
-
     from wow_forecaster.db.connection import get_connection
     from wow_forecaster.ingestion.blizzard_client import BlizzardClient
     from wow_forecaster.recipes.recipe_seeder import RecipeSeeder
@@ -3135,8 +3220,8 @@ def seed_recipes(
     config = _load_config_or_exit(config_path)
     _configure_logging(config)
 
-    client_id = _os.environ.get("BLIZZARD_CLIENT_ID")
-    client_secret = _os.environ.get("BLIZZARD_CLIENT_SECRET")
+    client_id = os.environ.get("BLIZZARD_CLIENT_ID")
+    client_secret = os.environ.get("BLIZZARD_CLIENT_SECRET")
     if not client_id or not client_secret:
         typer.echo(
             "[ERROR] BLIZZARD_CLIENT_ID and BLIZZARD_CLIENT_SECRET must be set in .env.",
@@ -3174,8 +3259,7 @@ def seed_recipes(
 
     with get_connection(
         target_db,
-        wal_mode=config.database.wal_mode,
-        busy_timeout_ms=config.database.busy_timeout_ms,
+        **config.database.connection_kwargs(),
     ) as conn:
         seeder = RecipeSeeder(conn, client)
         for exp in expansions_to_seed:
@@ -3223,8 +3307,6 @@ def build_margins(
         wow-forecaster build-margins --days 60
         wow-forecaster build-margins --realm us --days 30
     """
-    from datetime import date as _date
-
     from wow_forecaster.db.connection import get_connection
     from wow_forecaster.recipes.margin_calculator import MarginCalculator
 
@@ -3241,8 +3323,7 @@ def build_margins(
 
     with get_connection(
         target_db,
-        wal_mode=config.database.wal_mode,
-        busy_timeout_ms=config.database.busy_timeout_ms,
+        **config.database.connection_kwargs(),
     ) as conn:
         calc = MarginCalculator(
             conn,
@@ -3251,7 +3332,7 @@ def build_margins(
         stats = calc.compute_margins(
             realm_slug=target_realm,
             lookback_days=days,
-            end_date=_date.today(),
+            end_date=date.today(),
         )
 
     typer.echo(f"  Recipes processed      : {stats.recipes_processed}")
@@ -3290,7 +3371,6 @@ def report_crafting(
         wow-forecaster report-crafting --export crafting.csv
     """
     import csv as _csv
-    from datetime import date as _date
 
     from wow_forecaster.db.connection import get_connection
     from wow_forecaster.recommendations.crafting_advisor import (
@@ -3305,12 +3385,12 @@ def report_crafting(
         list(config.realms.defaults)[0] if config.realms.defaults else "us"
     )
     target_db = db_path or config.database.db_path
-    run_date = _date.today()
+    run_date = date.today()
 
     with get_connection(
         target_db,
-        wal_mode=config.database.wal_mode,
-        busy_timeout_ms=config.database.busy_timeout_ms,
+        **config.database.connection_kwargs(),
+        read_only=True,
     ) as conn:
         opportunities = build_crafting_opportunities(
             conn=conn,
@@ -3471,8 +3551,8 @@ def report_recipe_status(
 
     with get_connection(
         target_db,
-        wal_mode=config.database.wal_mode,
-        busy_timeout_ms=config.database.busy_timeout_ms,
+        **config.database.connection_kwargs(),
+        read_only=True,
     ) as conn:
         # ── Totals ────────────────────────────────────────────────────────────
         total_recipes = conn.execute("SELECT COUNT(*) FROM recipes;").fetchone()[0]
@@ -3844,8 +3924,6 @@ def checkpoint_db_cmd(
     to the database).  TRUNCATE mode (default) resets the WAL to zero bytes
     on success.  PASSIVE never blocks but may leave pages un-checkpointed.
     """
-    import os
-
     from wow_forecaster.db.connection import get_connection
 
     config = _load_config_or_exit(config_path)
@@ -3867,8 +3945,7 @@ def checkpoint_db_cmd(
 
     with get_connection(
         db_path,
-        wal_mode=config.database.wal_mode,
-        busy_timeout_ms=config.database.busy_timeout_ms,
+        **config.database.connection_kwargs(),
     ) as conn:
         result = conn.execute(f"PRAGMA wal_checkpoint({mode_upper});").fetchone()
         busy, log_pages, checkpointed = result
@@ -3936,7 +4013,6 @@ def export_tsm_cmd(
         wow-forecaster export-tsm --output tsm_export.txt
     """
     import sqlite3 as _sqlite3
-    from pathlib import Path as _Path
 
     from wow_forecaster.reporting.tsm_export import (
         build_tsm_import_string,
@@ -3948,7 +4024,7 @@ def export_tsm_cmd(
     _configure_logging(config)
 
     target_realm = realm or config.realms.defaults[0]
-    db_path = _Path(config.database.db_path)
+    db_path = Path(config.database.db_path)
 
     conn = _sqlite3.connect(str(db_path))
     conn.row_factory = _sqlite3.Row
@@ -3978,7 +4054,7 @@ def export_tsm_cmd(
     typer.echo("")
 
     if output:
-        p = write_tsm_export(items, _Path(output))
+        p = write_tsm_export(items, Path(output))
         typer.echo(f"  Written to: {p}")
 
     typer.echo("[OK] export-tsm complete.")
@@ -4487,8 +4563,7 @@ def backfill_rollups_cmd(
 
     with get_connection(
         target_db,
-        wal_mode=config.database.wal_mode,
-        busy_timeout_ms=config.database.busy_timeout_ms,
+        **config.database.connection_kwargs(),
     ) as conn:
         run_migrations(conn)
 
@@ -4508,8 +4583,7 @@ def backfill_rollups_cmd(
             return
 
         min_d, max_d, total_rows = row[0], row[1], row[2]
-        from datetime import date as _date
-        n_days = (_date.fromisoformat(max_d) - _date.fromisoformat(min_d)).days + 1
+        n_days = (date.fromisoformat(max_d) - date.fromisoformat(min_d)).days + 1
 
         typer.echo(f"  Date range: {min_d} -> {max_d} ({n_days} days)")
         typer.echo(f"  Source rows: {total_rows:,}")
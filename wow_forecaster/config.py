@@ -15,6 +15,7 @@ never raw dicts or individual env var lookups scattered through the codebase.
 
 from __future__ import annotations
 
+import functools
 import os
 import tomllib
 from pathlib import Path
@@ -34,6 +35,40 @@ class DatabaseConfig(BaseModel):
     db_path: str = "data/db/wow_forecaster.db"
     wal_mode: bool = True
     busy_timeout_ms: int = 30000
+    # Per-connection PRAGMAs. NORMAL is corruption-safe under WAL; it can only
+    # lose the last commits on power loss. mmap is off by default: a mapped
+    # read that hits an I/O error kills the process instead of raising.
+    synchronous: str = "NORMAL"
+    cache_size_kib: int = 65536
+    mmap_size_bytes: int = 0
+    temp_store: str = "MEMORY"
+
+    @field_validator("synchronous")
+    @classmethod
+    def validate_synchronous(cls, v: str) -> str:
+        valid = {"OFF", "NORMAL", "FULL", "EXTRA"}
+        if v.upper() not in valid:
+            raise ValueError(f"synchronous must be one of {sorted(valid)}, got '{v}'.")
+        return v.upper()
+
+    @field_validator("temp_store")
+    @classmethod
+    def validate_temp_store(cls, v: str) -> str:
+        valid = {"DEFAULT", "FILE", "MEMORY"}
+        if v.upper() not in valid:
+            raise ValueError(f"temp_store must be one of {sorted(valid)}, got '{v}'.")
+        return v.upper()
+
+    def connection_kwargs(self) -> dict[str, Any]:
+        """Keyword arguments for ``get_connection()`` besides the path."""
+        return {
+            "wal_mode": self.wal_mode,
+            "busy_timeout_ms": self.busy_timeout_ms,
+            "synchronous": self.synchronous,
+            "cache_size_kib": self.cache_size_kib,
+            "mmap_size_bytes": self.mmap_size_bytes,
+            "temp_store": self.temp_store,
+        }
 
 
 class DataConfig(BaseModel):
@@ -373,8 +408,12 @@ class AppConfig(BaseModel):
 _PROJECT_ROOT = Path(__file__).parent.parent
 
 
+@functools.cache
 def _find_project_root() -> Path:
-    """Walk up from this file to find the project root (contains pyproject.toml)."""
+    """Walk up from this file to find the project root (contains pyproject.toml).
+
+    Cached: the answer is fixed by ``__file__``, so the walk runs once per process.
+    """
     candidate = Path(__file__).parent
     for _ in range(5):
         if (candidate / "pyproject.toml").exists():
@@ -383,12 +422,29 @@ def _find_project_root() -> Path:
     return _PROJECT_ROOT
 
 
-def load_config(config_path: Path | None = None) -> AppConfig:
+def config_file_paths(config_path: Path | None = None) -> tuple[Path, Path]:
+    """Return ``(config_path, local_override_path)`` as ``load_config()`` reads them.
+
+    ``config_path`` defaults to ``<project_root>/config/default.toml``; the
+    override is the ``local.toml`` beside it.  Neither is checked for existence.
+    """
+    if config_path is None:
+        config_path = _find_project_root() / "config" / "default.toml"
+    config_path = Path(config_path)
+    return config_path, config_path.parent / "local.toml"
+
+
+def load_config(config_path: Path | None = None, validate: bool = True) -> AppConfig:
     """Load and merge application configuration.
 
     Args:
         config_path: Explicit path to a TOML config file. Defaults to
             ``<project_root>/config/default.toml``.
+        validate: If ``False``, build every model with ``model_construct()``,
+            skipping type coercion and field validators. An escape hatch for
+            dry runs only (see ``WOW_FORECASTER_SKIP_VALIDATION`` in the CLI);
+            a malformed value surfaces later as a wrong type, not a
+            ``ValidationError``.
 
     Returns:
         Fully validated ``AppConfig`` instance.
@@ -399,36 +455,38 @@ def load_config(config_path: Path | None = None) -> AppConfig:
     """
     root = _find_project_root()
 
-    # 1. Load .env file (silently skip if missing)
+    # 1. Load .env file (skipped outright when absent, as in deployments)
     dotenv_path = root / ".env"
-    load_dotenv(dotenv_path=dotenv_path, override=False)
+    if dotenv_path.is_file():
+        load_dotenv(dotenv_path=dotenv_path, override=False)
 
     # 2. Load TOML config
-    if config_path is None:
-        config_path = root / "config" / "default.toml"
-
-    config_path = Path(config_path)
-    if not config_path.exists():
+    # open() alone decides existence: no separate stat, and no race with a
+    # file removed between the check and the read.
+    config_path, local_config_path = config_file_paths(config_path)
+    try:
+        with open(config_path, "rb") as f:
+            raw: dict[str, Any] = tomllib.load(f)
+    except FileNotFoundError:
         raise FileNotFoundError(
             f"Config file not found: {config_path}\n"
             "Run 'wow-forecaster init-db' or create config/default.toml first."
-        )
-
-    with open(config_path, "rb") as f:
-        raw: dict[str, Any] = tomllib.load(f)
+        ) from None
 
     # Also merge local.toml if present (gitignored local overrides)
-    local_config_path = config_path.parent / "local.toml"
-    if local_config_path.exists():
+    try:
         with open(local_config_path, "rb") as f:
             local_raw: dict[str, Any] = tomllib.load(f)
+    except FileNotFoundError:
+        pass
+    else:
         raw = _deep_merge(raw, local_raw)
 
     # 3. Apply WOW_FORECASTER_* environment variable overrides
     raw = _apply_env_overrides(raw)
 
     # 4. Build and validate AppConfig
-    return _build_app_config(raw)
+    return _build_app_config(raw, validate=validate)
 
 
 def _deep_merge(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]:
@@ -462,26 +520,43 @@ def _apply_env_overrides(raw: dict[str, Any]) -> dict[str, Any]:
     return raw
 
 
-def _build_app_config(raw: dict[str, Any]) -> AppConfig:
-    """Map raw TOML dict to ``AppConfig`` model structure."""
+# TOML section name -> sub-config model, one row per AppConfig section field.
+_SECTION_MODELS: tuple[tuple[str, type[BaseModel]], ...] = (
+    ("database",   DatabaseConfig),
+    ("data",       DataConfig),
+    ("expansions", ExpansionsConfig),
+    ("realms",     RealmsConfig),
+    ("pipeline",   PipelineConfig),
+    ("forecast",   ForecastConfig),
+    ("logging",    LoggingConfig),
+    ("backtest",   BacktestConfig),
+    ("features",   FeatureConfig),
+    ("model",      ModelConfig),
+    ("monitoring", MonitoringConfig),
+    ("governance", GovernanceConfig),
+    ("crafting",   CraftingConfig),
+    ("retention",  RetentionConfig),
+    ("backup",     BackupConfig),
+    ("cloud_sync", CloudSyncConfig),
+)
+
+
+def _build_app_config(raw: dict[str, Any], validate: bool = True) -> AppConfig:
+    """Map raw TOML dict to ``AppConfig`` model structure.
+
+    With ``validate=False`` each model is built via ``model_construct()``,
+    which fills defaults but runs no coercion or validators.  A section that
+    is absent or empty is left out, so ``AppConfig`` keeps its field default
+    rather than building an identical model again.
+    """
     # Flatten top-level keys that may be nested under [project]
     project = raw.pop("project", {})
 
-    return AppConfig(
-        database=DatabaseConfig(**raw.get("database", {})),
-        data=DataConfig(**raw.get("data", {})),
-        expansions=ExpansionsConfig(**raw.get("expansions", {})),
-        realms=RealmsConfig(**raw.get("realms", {})),
-        pipeline=PipelineConfig(**raw.get("pipeline", {})),
-        forecast=ForecastConfig(**raw.get("forecast", {})),
-        logging=LoggingConfig(**raw.get("logging", {})),
-        backtest=BacktestConfig(**raw.get("backtest", {})),
-        features=FeatureConfig(**raw.get("features", {})),
-        model=ModelConfig(**raw.get("model", {})),
-        monitoring=MonitoringConfig(**raw.get("monitoring", {})),
-        governance=GovernanceConfig(**raw.get("governance", {})),
-        crafting=CraftingConfig(**raw.get("crafting", {})),
-        retention=RetentionConfig(**raw.get("retention", {})),
-        backup=BackupConfig(**raw.get("backup", {})),
-        debug=raw.get("debug", project.get("debug", False)),
-    )
+    sections: dict[str, Any] = {}
+    for name, model_cls in _SECTION_MODELS:
+        if values := raw.get(name):
+            sections[name] = (
+                model_cls(**values) if validate else model_cls.model_construct(**values)
+            )
+    sections["debug"] = raw.get("debug", project.get("debug", False))
+    return AppConfig(**sections) if validate else AppConfig.model_construct(**sections)
@@ -7,6 +7,7 @@ Provides a context manager ``get_connection()`` that:
   - Sets a busy timeout to handle lock contention gracefully.
   - Uses ``sqlite3.Row`` factory so rows behave like dicts.
   - Commits on clean exit, rolls back on exception.
+  - With ``read_only=True``, opens ``mode=ro`` for commands that only report.
 
 Usage::
 
@@ -32,6 +33,11 @@ def get_connection(
     db_path: str,
     wal_mode: bool = True,
     busy_timeout_ms: int = 30000,
+    synchronous: str | None = None,
+    cache_size_kib: int | None = None,
+    mmap_size_bytes: int | None = None,
+    temp_store: str | None = None,
+    read_only: bool = False,
 ) -> Generator[sqlite3.Connection, None, None]:
     """Context manager yielding a configured SQLite connection.
 
@@ -45,18 +51,41 @@ def get_connection(
         wal_mode: If ``True``, enable WAL journal mode for better concurrency.
         busy_timeout_ms: Milliseconds to wait when the database is locked
             before raising ``OperationalError``.
+        synchronous: ``PRAGMA synchronous`` level (``"NORMAL"``, ``"FULL"``...).
+        cache_size_kib: Page cache size in KiB (``PRAGMA cache_size = -N``).
+        mmap_size_bytes: ``PRAGMA mmap_size``; ``0`` disables memory mapping.
+        temp_store: ``PRAGMA temp_store`` (``"DEFAULT"``, ``"FILE"``, ``"MEMORY"``).
+        read_only: Open with ``mode=ro`` for report commands. The file must
+            already exist, any write raises ``OperationalError``, and
+            ``wal_mode`` is ignored (the journal mode is stored in the file).
+
+        A tuning argument left as ``None`` keeps SQLite's default. Callers
+        with an ``AppConfig`` pass ``**config.database.connection_kwargs()``.
 
     Yields:
         An open, configured ``sqlite3.Connection``.
 
     Raises:
-        sqlite3.OperationalError: If the database cannot be opened or is locked.
+        sqlite3.OperationalError: If the database cannot be opened or is locked,
+            or if ``read_only`` is set and the file does not exist.
     """
-    if db_path != ":memory:":
+    if read_only:
+        if db_path == ":memory:":
+            raise ValueError("read_only is meaningless for an in-memory database.")
         db_file = Path(db_path)
-        db_file.parent.mkdir(parents=True, exist_ok=True)
-
-    conn = sqlite3.connect(db_path, timeout=busy_timeout_ms / 1000)
+        if not db_file.is_file():
+            raise sqlite3.OperationalError(f"Database file not found: {db_path}")
+        # as_uri() needs an absolute path and percent-encodes '?', '#' and
+        # spaces, which would otherwise be read as URI syntax.
+        conn = sqlite3.connect(
+            f"{db_file.resolve().as_uri()}?mode=ro",
+            uri=True,
+            timeout=busy_timeout_ms / 1000,
+        )
+    else:
+        if db_path != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(db_path, timeout=busy_timeout_ms / 1000)
     conn.row_factory = sqlite3.Row
 
     try:
@@ -64,9 +93,20 @@ def get_connection(
         conn.execute("PRAGMA foreign_keys = ON;")
         conn.execute(f"PRAGMA busy_timeout = {busy_timeout_ms};")
 
-        if wal_mode:
+        if wal_mode and not read_only:
             conn.execute("PRAGMA journal_mode = WAL;")
 
+        # PRAGMA takes no bound parameters; the config validators restrict
+        # the string values, and the int() casts guard the rest.
+        if synchronous is not None:
+            conn.execute(f"PRAGMA synchronous = {synchronous};")
+        if cache_size_kib is not None:
+            conn.execute(f"PRAGMA cache_size = {-int(cache_size_kib)};")
+        if mmap_size_bytes is not None:
+            conn.execute(f"PRAGMA mmap_size = {int(mmap_size_bytes)};")
+        if temp_store is not None:
+            conn.execute(f"PRAGMA temp_store = {temp_store};")
+
         yield conn
         conn.commit()
 
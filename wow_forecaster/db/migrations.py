@@ -300,6 +300,23 @@ def migration_0009_add_health_check_indexes(conn: sqlite3.Connection) -> None:
     conn.commit()
 
 
+def migration_0010_add_backtest_report_index(conn: sqlite3.Connection) -> None:
+    """Add the covering (backtest_run_id, horizon_days, ...) index on backtest_fold_results.
+
+    report-backtest aggregates one run, optionally one horizon; with
+    idx_bt_results_run alone every matched row cost a table lookup for the
+    price columns. Re-executes the whole fold-results index DDL constant;
+    IF NOT EXISTS makes the pre-existing indexes a no-op.
+    """
+    from wow_forecaster.db.schema import _DDL_BACKTEST_FOLD_RESULTS_INDEXES
+
+    for statement in _DDL_BACKTEST_FOLD_RESULTS_INDEXES.strip().split(";"):
+        stmt = statement.strip()
+        if stmt:
+            conn.execute(stmt)
+    conn.commit()
+
+
 # ── Registry ──────────────────────────────────────────────────────────────────
 # Add new migrations here. They will run once, in order.
 
@@ -340,6 +357,10 @@ MIGRATIONS: dict[str, tuple[MigrationFn, str]] = {
         migration_0009_add_health_check_indexes,
         "Add observed_at and (realm_slug, ingested_at) indexes on market_observations_raw",
     ),
+    "0010_backtest_report_index": (
+        migration_0010_add_backtest_report_index,
+        "Add covering (backtest_run_id, horizon_days) index on backtest_fold_results",
+    ),
 }
 
 
@@ -13,6 +13,48 @@ from wow_forecaster.taxonomy.event_taxonomy import EventScope, EventSeverity, Ev
 
 logger = logging.getLogger(__name__)
 
+_UPSERT_SQL = """
+    INSERT INTO wow_events (
+        slug, display_name, event_type, scope, severity,
+        expansion_slug, patch_version, start_date, end_date,
+        announced_at, is_recurring, recurrence_rule, notes,
+        updated_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, strftime('%Y-%m-%dT%H:%M:%SZ', 'now'))
+    ON CONFLICT(slug) DO UPDATE SET
+        display_name   = excluded.display_name,
+        event_type     = excluded.event_type,
+        scope          = excluded.scope,
+        severity       = excluded.severity,
+        expansion_slug = excluded.expansion_slug,
+        patch_version  = excluded.patch_version,
+        start_date     = excluded.start_date,
+        end_date       = excluded.end_date,
+        announced_at   = excluded.announced_at,
+        is_recurring   = excluded.is_recurring,
+        recurrence_rule = excluded.recurrence_rule,
+        notes          = excluded.notes,
+        updated_at     = excluded.updated_at;
+"""
+
+
+def _upsert_params(event: WoWEvent) -> tuple:
+    """Positional parameters for ``_UPSERT_SQL``."""
+    return (
+        event.slug,
+        event.display_name,
+        event.event_type.value,
+        event.scope.value,
+        event.severity.value,
+        event.expansion_slug,
+        event.patch_version,
+        event.start_date.isoformat(),
+        event.end_date.isoformat() if event.end_date else None,
+        event.announced_at.isoformat() if event.announced_at else None,
+        int(event.is_recurring),
+        event.recurrence_rule,
+        event.notes,
+    )
+
 
 class WoWEventRepository(BaseRepository):
     """Read/write access to the ``wow_events`` table."""
@@ -61,45 +103,7 @@ class WoWEventRepository(BaseRepository):
         Returns:
             The ``event_id`` (existing or new).
         """
-        self.execute(
-            """
-            INSERT INTO wow_events (
-                slug, display_name, event_type, scope, severity,
-                expansion_slug, patch_version, start_date, end_date,
-                announced_at, is_recurring, recurrence_rule, notes,
-                updated_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, strftime('%Y-%m-%dT%H:%M:%SZ', 'now'))
-            ON CONFLICT(slug) DO UPDATE SET
-                display_name   = excluded.display_name,
-                event_type     = excluded.event_type,
-                scope          = excluded.scope,
-                severity       = excluded.severity,
-                expansion_slug = excluded.expansion_slug,
-                patch_version  = excluded.patch_version,
-                start_date     = excluded.start_date,
-                end_date       = excluded.end_date,
-                announced_at   = excluded.announced_at,
-                is_recurring   = excluded.is_recurring,
-                recurrence_rule = excluded.recurrence_rule,
-                notes          = excluded.notes,
-                updated_at     = excluded.updated_at;
-            """,
-            (
-                event.slug,
-                event.display_name,
-                event.event_type.value,
-                event.scope.value,
-                event.severity.value,
-                event.expansion_slug,
-                event.patch_version,
-                event.start_date.isoformat(),
-                event.end_date.isoformat() if event.end_date else None,
-                event.announced_at.isoformat() if event.announced_at else None,
-                int(event.is_recurring),
-                event.recurrence_rule,
-                event.notes,
-            ),
-        )
+        self.execute(_UPSERT_SQL, _upsert_params(event))
         row = self.fetchone("SELECT event_id FROM wow_events WHERE slug = ?;", (event.slug,))
         if row is None:
             raise RuntimeError(
@@ -107,6 +111,23 @@ class WoWEventRepository(BaseRepository):
             )
         return int(row["event_id"])
 
+    def upsert_many(self, events: list[WoWEvent]) -> int:
+        """Insert or replace a batch of events by slug with one prepared statement.
+
+        Unlike ``upsert()`` this does not read back each ``event_id``. Nothing
+        is committed here; the caller's transaction decides.
+
+        Args:
+            events: ``WoWEvent`` instances to persist.
+
+        Returns:
+            Number of events written.
+        """
+        if not events:
+            return 0
+        self.executemany(_UPSERT_SQL, [_upsert_params(ev) for ev in events])
+        return len(events)
+
     def get_by_id(self, event_id: int) -> WoWEvent | None:
         """Fetch a single event by primary key.
 
@@ -33,6 +33,7 @@ Table creation order respects foreign key dependencies:
 from __future__ import annotations
 
 import logging
+import re
 import sqlite3
 
 logger = logging.getLogger(__name__)
@@ -360,11 +361,17 @@ CREATE TABLE IF NOT EXISTS backtest_fold_results (
 );
 """
 
+# idx_bt_results_run_horizon covers the report-backtest aggregates: every
+# column the query_report_metrics() scan reads is in the key, so the scan
+# never touches table pages (migration 0010).
 _DDL_BACKTEST_FOLD_RESULTS_INDEXES = """
 CREATE INDEX IF NOT EXISTS idx_bt_results_run
     ON backtest_fold_results(backtest_run_id);
 CREATE INDEX IF NOT EXISTS idx_bt_results_archetype
     ON backtest_fold_results(archetype_id, model_name, horizon_days);
+CREATE INDEX IF NOT EXISTS idx_bt_results_run_horizon
+    ON backtest_fold_results(backtest_run_id, horizon_days, model_name,
+                             is_event_window, actual_price, predicted_price);
 """
 
 _DDL_DRIFT_CHECK_RESULTS = """
@@ -611,15 +618,43 @@ ALL_TABLE_NAMES = [
 ]
 
 
+# Every table and index the DDL above creates. Used by apply_schema() to
+# detect a complete schema with one catalog query.
+_SCHEMA_OBJECT_NAMES: tuple[str, ...] = tuple(
+    re.findall(
+        r"CREATE\s+(?:UNIQUE\s+)?(?:TABLE|INDEX)\s+IF\s+NOT\s+EXISTS\s+(\w+)",
+        "\n".join(_ALL_DDL),
+    )
+)
+
+
+def _schema_is_complete(conn: sqlite3.Connection) -> bool:
+    """Return True if every table and index in ``_ALL_DDL`` already exists."""
+    placeholders = ", ".join("?" * len(_SCHEMA_OBJECT_NAMES))
+    row = conn.execute(
+        "SELECT COUNT(*) FROM sqlite_master "
+        f"WHERE type IN ('table', 'index') AND name IN ({placeholders});",
+        _SCHEMA_OBJECT_NAMES,
+    ).fetchone()
+    return row[0] == len(_SCHEMA_OBJECT_NAMES)
+
+
 def apply_schema(conn: sqlite3.Connection) -> None:
     """Apply all DDL statements to ``conn``.
 
     Idempotent — safe to call on an already-initialized database.
     Each statement uses ``IF NOT EXISTS`` guards.
 
+    When one catalog query finds every table and index already present, no
+    DDL runs and nothing is committed.
+
     Args:
         conn: An open ``sqlite3.Connection`` (FK enforcement should be ON).
     """
+    if _schema_is_complete(conn):
+        logger.debug("Schema already complete; skipping DDL.")
+        return
+
     logger.debug("Applying schema to database...")
 
     for ddl in _ALL_DDL:
@@ -11,7 +11,8 @@ It coordinates all feature modules in sequence and writes:
     data/processed/features/manifests/manifest_{realm}_{date}.json
 
 One set of files is produced per realm slug.  When multiple realms are requested,
-``build_datasets()`` loops over them and accumulates the total row count for
+``build_datasets()`` loops over them (or fans them out to a process pool when
+``workers > 1``) and accumulates the total row count for
 ``RunMetadata.rows_processed``.
 
 Feature assembly pipeline (step-by-step)
@@ -76,7 +77,10 @@ import json
 import logging
 import sqlite3
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import UTC, date, datetime
+from functools import partial
 from pathlib import Path
 from typing import Any
 
@@ -109,6 +113,7 @@ from wow_forecaster.features.registry import (
     training_feature_names,
 )
 from wow_forecaster.models.meta import RunMetadata
+from wow_forecaster.utils.logging import configure_logging
 
 log = logging.getLogger(__name__)
 
@@ -387,6 +392,18 @@ def _find_expansion_launch(events: Any) -> list[date]:
 
 # ── Main orchestrator ──────────────────────────────────────────────────────────
 
+@dataclass(frozen=True)
+class _SharedInputs:
+    """Realm-independent inputs loaded once per ``build_datasets()`` call."""
+
+    events:             list[Any]
+    impacts:            Any
+    cat_impacts:        Any
+    arch_meta:          dict[int, Any]
+    items_excluded:     int
+    expansion_launches: list[date]
+
+
 def build_datasets(
     conn: sqlite3.Connection,
     config: AppConfig,
@@ -396,11 +413,18 @@ def build_datasets(
     end_date: date,
     build_training: bool = True,
     build_inference: bool = True,
+    db_path: str | None = None,
+    workers: int = 1,
 ) -> int:
     """Build training + inference Parquet datasets and manifest for each realm.
 
     This is the entry point called by ``FeatureBuildStage._execute()``.
 
+    With ``workers > 1`` and more than one realm, realms are built in a
+    process pool (the per-realm work is CPU-bound Python, so threads would
+    serialise on the GIL).  Each worker opens its own read-only connection to
+    ``db_path`` and writes its own realm's files, so nothing is shared.
+
     Args:
         conn:           Open SQLite connection.
         config:         Full application config.
@@ -410,11 +434,19 @@ def build_datasets(
         end_date:       Latest date in the training window (today for live runs).
         build_training: Write training Parquet if True (default True).
         build_inference: Write inference Parquet if True (default True).
+        db_path:        Path of the database behind ``conn``.  Required when
+                        ``workers > 1``.
+        workers:        Maximum worker processes (default 1 = in-process).
 
     Returns:
         Total rows written across all realms and files (for RunMetadata.rows_processed).
+
+    Raises:
+        ValueError: If ``workers > 1`` and ``db_path`` is not given.
     """
-    cfg_feat = config.features
+    if workers > 1 and db_path is None:
+        raise ValueError("build_datasets(workers > 1) requires db_path.")
+
     cfg_exp  = config.expansions
 
     # ── Preflight: events must be seeded ──────────────────────────────────────
@@ -430,116 +462,184 @@ def build_datasets(
         )
 
     # ── Load shared data once (not per realm, not per row) ────────────────────
-    events          = load_known_events(conn)
-    impacts         = load_archetype_impacts(conn)
-    cat_impacts     = load_category_impacts(conn)
-    arch_meta       = load_archetype_metadata(conn, cfg_exp.active, cfg_exp.transfer_target)
-    items_excluded = count_items_without_archetype(conn)
-    expansion_launches = _find_expansion_launch(events)
-
-    total_rows = 0
-
-    for realm_slug in realm_slugs:
-        log.info(
-            "Building features for realm=%s  window=%s -> %s", realm_slug, start_date, end_date
-        )
-
-        # Step 1: Daily aggregation.
-        agg_rows = fetch_daily_agg(conn, realm_slug, start_date, end_date)
-        if not agg_rows:
-            log.warning("No normalised observations for realm=%s — skipping.", realm_slug)
-            continue
+    events = load_known_events(conn)
+    shared = _SharedInputs(
+        events=events,
+        impacts=load_archetype_impacts(conn),
+        cat_impacts=load_category_impacts(conn),
+        arch_meta=load_archetype_metadata(conn, cfg_exp.active, cfg_exp.transfer_target),
+        items_excluded=count_items_without_archetype(conn),
+        expansion_launches=_find_expansion_launch(events),
+    )
 
-        # Step 2: Lag / rolling / momentum / targets.
-        feature_rows = compute_lag_rolling_features(agg_rows, cfg_feat)
-
-        # Step 3–4: Event features (per archetype group).
-        groups_by_arch: dict[int, list[dict[str, Any]]] = defaultdict(list)
-        for r in feature_rows:
-            groups_by_arch[r["archetype_id"]].append(r)
-
-        event_rows: list[dict[str, Any]] = []
-        for arch_id, arch_rows in groups_by_arch.items():
-            arch_info = arch_meta.get(arch_id)
-            arch_cat  = arch_info.category_tag if arch_info else None
-            event_rows.extend(
-                compute_event_features(
-                    arch_rows, events, impacts, arch_id,
-                    category_impacts=cat_impacts,
-                    archetype_category=arch_cat,
-                )
+    n_workers = min(workers, len(realm_slugs))
+    if n_workers <= 1:
+        return sum(
+            _build_realm(
+                conn, config, run, realm_slug, start_date, end_date, shared,
+                build_training, build_inference,
             )
+            for realm_slug in realm_slugs
+        )
+
+    # Committed before the workers open their own connections, so they see
+    # anything the caller wrote on ``conn`` (e.g. apply_schema()).
+    conn.commit()
+    worker = partial(
+        _build_realm_in_worker,
+        db_path, config.database.connection_kwargs(), config, run,
+        start_date=start_date,
+        end_date=end_date,
+        shared=shared,
+        build_training=build_training,
+        build_inference=build_inference,
+    )
+    # Spawned workers start with an unconfigured root logger, so per-realm
+    # warnings would be dropped; each worker applies the CLI's logging config.
+    with ProcessPoolExecutor(
+        max_workers=n_workers,
+        initializer=configure_logging,
+        initargs=(config.logging,),
+    ) as pool:
+        return sum(pool.map(worker, realm_slugs))
+
+
+def _build_realm_in_worker(
+    db_path: str,
+    db_kwargs: dict[str, Any],
+    config: AppConfig,
+    run: RunMetadata,
+    realm_slug: str,
+    *,
+    start_date: date,
+    end_date: date,
+    shared: _SharedInputs,
+    build_training: bool,
+    build_inference: bool,
+) -> int:
+    """Process-pool entry point: build one realm on its own connection."""
+    from wow_forecaster.db.connection import get_connection
 
-        # Step 5–6: Archetype / transfer features.
-        cold_start_counts = count_obs_per_archetype_realm(
-            conn, realm_slug, cfg_exp.transfer_target
+    with get_connection(db_path, read_only=True, **db_kwargs) as conn:
+        return _build_realm(
+            conn, config, run, realm_slug, start_date, end_date, shared,
+            build_training, build_inference,
         )
-        item_counts = count_items_per_archetype(conn, realm_slug)
-
-        arch_rows_out: list[dict[str, Any]] = []
-        # Re-group event_rows by archetype_id.
-        event_by_arch: dict[int, list[dict[str, Any]]] = defaultdict(list)
-        for r in event_rows:
-            event_by_arch[r["archetype_id"]].append(r)
-
-        for arch_id, arch_rows in event_by_arch.items():
-            arch_rows_out.extend(
-                compute_archetype_features(
-                    arch_rows,
-                    arch_id,
-                    realm_slug,
-                    arch_meta,
-                    cold_start_counts,
-                    item_counts,
-                    cfg_feat.cold_start_threshold,
-                    cfg_exp.transfer_target,
-                )
-            )
 
-        # Step 7: Temporal features (pure date arithmetic).
-        final_rows = _add_temporal_features(arch_rows_out, expansion_launches)
 
-        # Sort output by (archetype_id, obs_date) for deterministic output.
-        final_rows.sort(key=lambda r: (r["archetype_id"], r["obs_date"]))
+def _build_realm(
+    conn: sqlite3.Connection,
+    config: AppConfig,
+    run: RunMetadata,
+    realm_slug: str,
+    start_date: date,
+    end_date: date,
+    shared: _SharedInputs,
+    build_training: bool,
+    build_inference: bool,
+) -> int:
+    """Run steps 1-10 for one realm.  Returns training rows written."""
+    cfg_feat = config.features
+    cfg_exp  = config.expansions
+
+    log.info(
+        "Building features for realm=%s  window=%s -> %s", realm_slug, start_date, end_date
+    )
 
-        # Step 8: Quality report.
-        quality = build_quality_report(final_rows, items_excluded=items_excluded)
-        if not quality.is_clean:
-            log.warning(
-                "Quality issues for realm=%s: %d duplicates, %d leakage warnings",
-                realm_slug, quality.duplicate_key_count, len(quality.leakage_warnings),
+    # Step 1: Daily aggregation.
+    agg_rows = fetch_daily_agg(conn, realm_slug, start_date, end_date)
+    if not agg_rows:
+        log.warning("No normalised observations for realm=%s — skipping.", realm_slug)
+        return 0
+
+    # Step 2: Lag / rolling / momentum / targets.
+    feature_rows = compute_lag_rolling_features(agg_rows, cfg_feat)
+
+    # Step 3–4: Event features (per archetype group).
+    groups_by_arch: dict[int, list[dict[str, Any]]] = defaultdict(list)
+    for r in feature_rows:
+        groups_by_arch[r["archetype_id"]].append(r)
+
+    event_rows: list[dict[str, Any]] = []
+    for arch_id, arch_rows in groups_by_arch.items():
+        arch_info = shared.arch_meta.get(arch_id)
+        arch_cat  = arch_info.category_tag if arch_info else None
+        event_rows.extend(
+            compute_event_features(
+                arch_rows, shared.events, shared.impacts, arch_id,
+                category_impacts=shared.cat_impacts,
+                archetype_category=arch_cat,
             )
+        )
 
-        # Step 9: Write Parquet files.
-        paths = make_output_paths(config.data.processed_dir, realm_slug, start_date, end_date)
-        train_count = 0
-        infer_count = 0
-
-        if build_training:
-            train_count = write_training_parquet(final_rows, paths["training"])
-            total_rows += train_count
-
-        if build_inference:
-            infer_count = write_inference_parquet(final_rows, paths["inference"])
-
-        # Step 10: Manifest.
-        manifest = build_manifest(
-            realm_slug=realm_slug,
-            start_date=start_date,
-            end_date=end_date,
-            run_slug=run.run_slug,
-            training_path=paths["training"],
-            inference_path=paths["inference"],
-            training_rows=train_count,
-            inference_rows=infer_count,
-            quality=quality,
-            config=config,
+    # Step 5–6: Archetype / transfer features.
+    cold_start_counts = count_obs_per_archetype_realm(
+        conn, realm_slug, cfg_exp.transfer_target
+    )
+    item_counts = count_items_per_archetype(conn, realm_slug)
+
+    arch_rows_out: list[dict[str, Any]] = []
+    # Re-group event_rows by archetype_id.
+    event_by_arch: dict[int, list[dict[str, Any]]] = defaultdict(list)
+    for r in event_rows:
+        event_by_arch[r["archetype_id"]].append(r)
+
+    for arch_id, arch_rows in event_by_arch.items():
+        arch_rows_out.extend(
+            compute_archetype_features(
+                arch_rows,
+                arch_id,
+                realm_slug,
+                shared.arch_meta,
+                cold_start_counts,
+                item_counts,
+                cfg_feat.cold_start_threshold,
+                cfg_exp.transfer_target,
+            )
         )
-        write_manifest(manifest, paths["manifest"])
 
-        log.info(
-            "realm=%s done | training_rows=%d  inference_rows=%d  is_clean=%s",
-            realm_slug, train_count, infer_count, quality.is_clean,
+    # Step 7: Temporal features (pure date arithmetic).
+    final_rows = _add_temporal_features(arch_rows_out, shared.expansion_launches)
+
+    # Sort output by (archetype_id, obs_date) for deterministic output.
+    final_rows.sort(key=lambda r: (r["archetype_id"], r["obs_date"]))
+
+    # Step 8: Quality report.
+    quality = build_quality_report(final_rows, items_excluded=shared.items_excluded)
+    if not quality.is_clean:
+        log.warning(
+            "Quality issues for realm=%s: %d duplicates, %d leakage warnings",
+            realm_slug, quality.duplicate_key_count, len(quality.leakage_warnings),
         )
 
-    return total_rows
+    # Step 9: Write Parquet files.
+    paths = make_output_paths(config.data.processed_dir, realm_slug, start_date, end_date)
+    train_count = 0
+    infer_count = 0
+
+    if build_training:
+        train_count = write_training_parquet(final_rows, paths["training"])
+
+    if build_inference:
+        infer_count = write_inference_parquet(final_rows, paths["inference"])
+
+    # Step 10: Manifest.
+    manifest = build_manifest(
+        realm_slug=realm_slug,
+        start_date=start_date,
+        end_date=end_date,
+        run_slug=run.run_slug,
+        training_path=paths["training"],
+        inference_path=paths["inference"],
+        training_rows=train_count,
+        inference_rows=infer_count,
+        quality=quality,
+        config=config,
+    )
+    write_manifest(manifest, paths["manifest"])
+
+    log.info(
+        "realm=%s done | training_rows=%d  inference_rows=%d  is_clean=%s",
+        realm_slug, train_count, infer_count, quality.is_clean,
+    )
+    return train_count
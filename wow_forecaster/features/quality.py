@@ -25,6 +25,10 @@ Usage
 ``build_quality_report()`` operates on plain Python dicts (the feature rows
 assembled by ``dataset_builder``), so it can be called without a DB connection
 and is straightforward to unit-test with synthetic data.
+
+``build_quality_report_arrow()`` produces the same report from a
+``pyarrow.Table`` read back from Parquet (``validate-datasets``), using Arrow
+compute kernels instead of materialising one dict per row.
 """
 
 from __future__ import annotations
@@ -32,10 +36,18 @@ from __future__ import annotations
 from collections import defaultdict
 from dataclasses import dataclass
 from datetime import date
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from wow_forecaster.features.registry import feature_names
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+# Every column build_quality_report() reads. Callers loading a written dataset
+# project to these, so a column added to the Parquet files outside the
+# registry is never decoded just to be ignored.
+QUALITY_REPORT_COLUMNS: tuple[str, ...] = tuple(feature_names())
+
 
 @dataclass
 class DataQualityReport:
@@ -113,7 +125,7 @@ def build_quality_report(
         )
 
     n = len(rows)
-    all_cols = feature_names()
+    all_cols = QUALITY_REPORT_COLUMNS
 
     # ── Missingness ────────────────────────────────────────────────────────────
     missingness: dict[str, float] = {}
@@ -198,3 +210,139 @@ def build_quality_report(
         items_excluded_no_archetype=items_excluded,
         is_clean=is_clean,
     )
+
+
+def build_quality_report_arrow(
+    table: pa.Table,
+    items_excluded: int = 0,
+    missingness_threshold: float = 0.30,
+) -> DataQualityReport:
+    """Columnar equivalent of :func:`build_quality_report` for a Parquet table.
+
+    Gives the same report as ``build_quality_report(table.to_pylist(), ...)``
+    without building a dict per row: nulls are counted from Arrow validity
+    bitmaps, duplicates by a group-by, and gaps by diffing the sorted
+    ``obs_date`` column.  A registry column missing from ``table`` counts as
+    all-null, as it does for a dict without that key.
+
+    Args:
+        table:                 Feature table, e.g. from ``pq.read_table()``.
+        items_excluded:        As for :func:`build_quality_report`.
+        missingness_threshold: As for :func:`build_quality_report`.
+
+    Returns:
+        A ``DataQualityReport`` instance.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    n = table.num_rows
+    if n == 0:
+        return build_quality_report([], items_excluded, missingness_threshold)
+
+    present = set(table.column_names)
+
+    def column(name: str) -> pa.ChunkedArray:
+        if name in present:
+            return table[name]
+        return pa.chunked_array([pa.nulls(n)])
+
+    # ── Missingness ────────────────────────────────────────────────────────────
+    missingness = {col: column(col).null_count / n for col in QUALITY_REPORT_COLUMNS}
+    high_missingness_cols = [
+        col for col, frac in missingness.items()
+        if frac > missingness_threshold
+    ]
+
+    # ── Duplicate key detection ────────────────────────────────────────────────
+    # group_by keeps nulls as their own key, matching the tuple-set check.
+    key_cols = [c for c in ("archetype_id", "realm_slug", "obs_date") if c in present]
+    if key_cols:
+        n_keys = table.select(key_cols).group_by(key_cols).aggregate([]).num_rows
+    else:
+        n_keys = 1
+    duplicate_key_count = n - n_keys
+
+    # ── Time-series continuity ─────────────────────────────────────────────────
+    date_gap_series_count = 0
+    if "obs_date" in present:
+        series_cols = [c for c in ("archetype_id", "realm_slug") if c in present]
+        dated = table.select([*series_cols, "obs_date"]).filter(
+            pc.is_valid(table["obs_date"])
+        )
+        if dated.num_rows > 1:
+            dated = dated.sort_by([(c, "ascending") for c in (*series_cols, "obs_date")])
+            days = pc.cast(dated["obs_date"], pa.int32()).combine_chunks()
+            # Row i continues row i-1's series when every series key matches
+            # (null == null, as in the dict path's tuple keys).
+            same = pa.array([True] * (dated.num_rows - 1))
+            for c in series_cols:
+                col = dated[c].combine_chunks()
+                cur, prev = col[1:], col[:-1]
+                equal = pc.fill_null(pc.equal(cur, prev), False)
+                both_null = pc.and_(pc.is_null(cur), pc.is_null(prev))
+                same = pc.and_(same, pc.or_(equal, both_null))
+            gap = pc.greater(pc.subtract(days[1:], days[:-1]), 1)
+            # Number each series, then count the series owning any gap.
+            series_id = pc.cumulative_sum(
+                pc.cast(pc.invert(same), pa.int32()), start=0
+            )
+            gapped = pc.filter(series_id, pc.and_(same, gap))
+            date_gap_series_count = pc.count_distinct(gapped).as_py()
+
+    # ── Leakage heuristic ──────────────────────────────────────────────────────
+    leakage_warnings: list[str] = []
+    if "event_days_to_next" in present:
+        leaked = pc.fill_null(pc.less(table["event_days_to_next"], 0.0), False)
+        for days_to_next, obs_date, arch_id in zip(
+            table["event_days_to_next"].filter(leaked).to_pylist(),
+            column("obs_date").filter(leaked).to_pylist(),
+            column("archetype_id").filter(leaked).to_pylist(),
+            strict=True,
+        ):
+            leakage_warnings.append(
+                f"event_days_to_next={days_to_next:.1f} < 0 for "
+                f"archetype_id={arch_id} obs_date={obs_date} — "
+                "a past event may be incorrectly labelled as 'next upcoming'."
+            )
+
+    # ── Volume proxy and cold-start prevalence ─────────────────────────────────
+    def true_count(name: str) -> int:
+        if name not in present:
+            return 0
+        return pc.sum(pc.equal(table[name], True)).as_py() or 0
+
+    volume_proxy_pct = true_count("is_volume_proxy") / n
+    cold_start_pct   = true_count("is_cold_start")   / n
+
+    # ── Aggregates ─────────────────────────────────────────────────────────────
+    def distinct(name: str) -> int:
+        if name not in present:
+            return 0
+        return pc.count_distinct(table[name], mode="only_valid").as_py()
+
+    total_archetypes = distinct("archetype_id")
+    total_realms     = distinct("realm_slug")
+    if "obs_date" in present:
+        date_range = pc.min_max(table["obs_date"]).as_py()
+    else:
+        date_range = {"min": None, "max": None}
+
+    is_clean = duplicate_key_count == 0 and len(leakage_warnings) == 0
+
+    return DataQualityReport(
+        total_rows=n,
+        total_archetypes=total_archetypes,
+        total_realms=total_realms,
+        date_range_start=date_range["min"],
+        date_range_end=date_range["max"],
+        missingness=missingness,
+        high_missingness_cols=high_missingness_cols,
+        duplicate_key_count=duplicate_key_count,
+        date_gap_series_count=date_gap_series_count,
+        leakage_warnings=leakage_warnings,
+        volume_proxy_pct=volume_proxy_pct,
+        cold_start_pct=cold_start_pct,
+        items_excluded_no_archetype=items_excluded,
+        is_clean=is_clean,
+    )
@@ -159,6 +159,37 @@ def _query_last_snapshot_at(
     return None
 
 
+def _query_last_snapshots_at(
+    conn: sqlite3.Connection,
+    source_ids: list[str],
+) -> dict[str, str]:
+    """Query the most recent successful snapshot for several sources at once.
+
+    One grouped query replaces a ``_query_last_snapshot_at`` call per source.
+
+    Args:
+        conn:       Open SQLite connection.
+        source_ids: Source identifiers to query.
+
+    Returns:
+        Mapping of source_id to ISO-8601 fetched_at.  Sources with no
+        successful snapshot are absent.
+    """
+    if not source_ids:
+        return {}
+    placeholders = ", ".join("?" * len(source_ids))
+    rows = conn.execute(
+        f"""
+        SELECT source, MAX(fetched_at)
+        FROM ingestion_snapshots
+        WHERE success = 1 AND source IN ({placeholders})
+        GROUP BY source
+        """,
+        source_ids,
+    ).fetchall()
+    return {src: str(last_at) for src, last_at in rows if last_at}
+
+
 def _compute_age_hours(last_snapshot_at: str | None) -> float | None:
     """Compute hours elapsed since last_snapshot_at (UTC).
 
@@ -180,25 +211,18 @@ def _compute_age_hours(last_snapshot_at: str | None) -> float | None:
         return None
 
 
-# ── Public API ────────────────────────────────────────────────────────────────
-
-
-def check_source_freshness(
-    conn: sqlite3.Connection,
+def _build_result(
     source_id: str,
     policy: SourcePolicy,
-    realm_slug: str | None = None,
+    last_at: str | None,
 ) -> FreshnessResult:
-    """Check freshness of one source against its policy thresholds.
-
-    If the source does not require snapshots (e.g. manual_event_csv), the
-    function immediately returns status=UNKNOWN without querying the DB.
+    """Classify one source given its most recent snapshot timestamp.
 
     Args:
-        conn:       Open SQLite connection to wow_forecaster.db.
-        source_id:  Source ID to check (e.g., "blizzard_api").
-        policy:     SourcePolicy loaded from the registry.
-        realm_slug: Optional realm to filter snapshots (None = any realm).
+        source_id: Source ID being checked.
+        policy:    SourcePolicy loaded from the registry.
+        last_at:   ISO-8601 fetched_at of the latest successful snapshot,
+                   or None.  Ignored when the source requires no snapshots.
 
     Returns:
         FreshnessResult with status and age information.
@@ -221,7 +245,6 @@ def check_source_freshness(
             requires_snapshot=False,
         )
 
-    last_at  = _query_last_snapshot_at(conn, source_id, realm_slug)
     age_h    = _compute_age_hours(last_at)
     status   = _classify_status(
         age_h, fc.ttl_hours, fc.stale_threshold_hours, fc.critical_threshold_hours
@@ -242,6 +265,36 @@ def check_source_freshness(
     )
 
 
+# ── Public API ────────────────────────────────────────────────────────────────
+
+
+def check_source_freshness(
+    conn: sqlite3.Connection,
+    source_id: str,
+    policy: SourcePolicy,
+    realm_slug: str | None = None,
+) -> FreshnessResult:
+    """Check freshness of one source against its policy thresholds.
+
+    If the source does not require snapshots (e.g. manual_event_csv), the
+    function immediately returns status=UNKNOWN without querying the DB.
+
+    Args:
+        conn:       Open SQLite connection to wow_forecaster.db.
+        source_id:  Source ID to check (e.g., "blizzard_api").
+        policy:     SourcePolicy loaded from the registry.
+        realm_slug: Optional realm to filter snapshots (None = any realm).
+
+    Returns:
+        FreshnessResult with status and age information.
+    """
+    if not policy.provenance.requires_snapshot:
+        return _build_result(source_id, policy, None)
+    return _build_result(
+        source_id, policy, _query_last_snapshot_at(conn, source_id, realm_slug)
+    )
+
+
 def check_all_sources_freshness(
     conn: sqlite3.Connection,
     policies: list[SourcePolicy],
@@ -249,15 +302,20 @@ def check_all_sources_freshness(
 ) -> list[FreshnessResult]:
     """Check freshness for a list of source policies.
 
+    The latest snapshot of every snapshot-backed source is read in one
+    grouped query rather than one query per source.
+
     Args:
         conn:       Open SQLite connection.
         policies:   List of SourcePolicy instances to check.
-        realm_slug: Optional realm filter.
+        realm_slug: Optional realm filter.  Accepted for parity with
+                    ``check_source_freshness``; ingestion_snapshots has no
+                    realm column, so it does not narrow the query.
 
     Returns:
         List of FreshnessResult, one per policy, in input order.
     """
-    return [
-        check_source_freshness(conn, p.source_id, p, realm_slug)
-        for p in policies
-    ]
+    last_at = _query_last_snapshots_at(
+        conn, [p.source_id for p in policies if p.provenance.requires_snapshot]
+    )
+    return [_build_result(p.source_id, p, last_at.get(p.source_id)) for p in policies]
@@ -78,23 +78,22 @@ def parse_event_csv(path: Path) -> list[WoWEvent]:
                 f"Found columns: {sorted(actual_cols)}"
             )
 
-        rows = list(reader)
-
-    if not rows:
+        # Rows convert as they are read instead of being buffered into a list
+        # first; WoWEvent construction, not CSV tokenizing, is the cost here.
+        events: list[WoWEvent] = []
+        errors: list[tuple[int, str]] = []
+
+        for i, row in enumerate(reader):
+            line_no = i + 2  # 1-based, skip header row
+            try:
+                events.append(_row_to_wow_event(row))
+            except (ValueError, ValidationError) as exc:
+                errors.append((line_no, str(exc)))
+
+    if not events and not errors:
         logger.warning("Event CSV is empty (header only): %s", path)
         return []
 
-    events: list[WoWEvent] = []
-    errors: list[tuple[int, str]] = []
-
-    for i, row in enumerate(rows):
-        line_no = i + 2  # 1-based, skip header row
-        try:
-            event = _row_to_wow_event(row)
-            events.append(event)
-        except (ValueError, ValidationError) as exc:
-            errors.append((line_no, str(exc)))
-
     if errors:
         max_shown = 10
         detail = "\n".join(f"  Row {ln}: {msg}" for ln, msg in errors[:max_shown])
@@ -169,5 +169,4 @@ def load_snapshot(path: Path) -> dict[str, Any]:
         FileNotFoundError: If ``path`` does not exist.
         json.JSONDecodeError: If the file is not valid JSON.
     """
-    with open(path, encoding="utf-8") as f:
-        return json.load(f)
+    return json.loads(Path(path).read_bytes())
@@ -32,11 +32,13 @@ __all__ = [
     "ReviewState",
 ]
 
-from wow_forecaster.learning.models import (
-    Curriculum,
-    Grade,
-    LabState,
-    Module,
-    Question,
-    ReviewState,
-)
+
+def __getattr__(name: str):
+    # Re-exports resolve on first access (PEP 562). Importing the package is
+    # what registering ``learning.cli`` does on every ``wowfc`` invocation, and
+    # an eager ``models`` import here put pydantic on that path.
+    if name in __all__:
+        from wow_forecaster.learning import models
+
+        return getattr(models, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -94,7 +94,7 @@ def run_inference(
             "Call self._persist_run(run) first."
         )
 
-    table = pq.read_table(str(inference_parquet_path))
+    table = pq.read_table(str(inference_parquet_path), memory_map=True)
     raw_rows: list[dict[str, Any]] = table.to_pylist()
 
     if not raw_rows:
@@ -69,7 +69,7 @@ def train_models(
         )
 
     logger.info("Loading training data: %s", training_parquet_path)
-    table = pq.read_table(str(training_parquet_path))
+    table = pq.read_table(str(training_parquet_path), memory_map=True)
     raw_rows: list[dict[str, Any]] = table.to_pylist()
 
     if not raw_rows:
@@ -407,83 +407,75 @@ class DriftChecker:
         cutoff_recent   = _days_ago(self._drift_window_h / 24.0)
         cutoff_baseline = _days_ago(self._baseline_days)
 
-        # ── Baseline stats per series ─────────────────────────────────────────
-        baseline_q = """
-            SELECT archetype_id,
-                   AVG(price_gold)                     AS mean_price,
-                   SUM((price_gold - sub.avg_p) * (price_gold - sub.avg_p)) AS ss,
-                   COUNT(*)                            AS n
-            FROM market_observations_normalized
-            JOIN (
-                SELECT archetype_id AS a_id, AVG(price_gold) AS avg_p
+        # ── Baseline + recent stats per series, one scan ──────────────────────
+        # ``w`` reads the window once and tags each row as recent or baseline;
+        # ``b`` is the baseline mean needed for the two-pass sum of squares.
+        # The lower bound is the earlier cutoff so the recent window is never
+        # clipped by a short baseline.  No MATERIALIZED hint: it needs SQLite
+        # 3.35+, and the planner already evaluates ``w`` once.
+        stats_q = """
+            WITH w AS (
+                SELECT archetype_id,
+                       price_gold,
+                       date(observed_at) >= :recent AS is_recent
                 FROM market_observations_normalized
-                WHERE realm_slug = ?
-                  AND date(observed_at) >= ?
-                  AND date(observed_at) < ?
+                WHERE realm_slug = :realm
+                  AND date(observed_at) >= min(:baseline, :recent)
                   AND is_outlier = 0
                   AND archetype_id IS NOT NULL
+            ),
+            b AS (
+                SELECT archetype_id, AVG(price_gold) AS avg_p
+                FROM w
+                WHERE NOT is_recent
                 GROUP BY archetype_id
-            ) sub ON archetype_id = sub.a_id
-            WHERE realm_slug = ?
-              AND date(observed_at) >= ?
-              AND date(observed_at) < ?
-              AND is_outlier = 0
-              AND archetype_id IS NOT NULL
-            GROUP BY archetype_id;
+            )
+            SELECT w.archetype_id,
+                   AVG(CASE WHEN NOT w.is_recent THEN w.price_gold END) AS b_mean,
+                   SUM(CASE WHEN NOT w.is_recent
+                            THEN (w.price_gold - b.avg_p) * (w.price_gold - b.avg_p)
+                       END)                                             AS b_ss,
+                   COUNT(CASE WHEN NOT w.is_recent THEN 1 END)          AS b_n,
+                   AVG(CASE WHEN w.is_recent THEN w.price_gold END)     AS r_mean,
+                   COUNT(CASE WHEN w.is_recent THEN 1 END)              AS r_n
+            FROM w
+            LEFT JOIN b ON b.archetype_id = w.archetype_id
+            GROUP BY w.archetype_id;
         """
-        baseline_cutoff_str = cutoff_baseline.isoformat()
-        recent_cutoff_str   = cutoff_recent.isoformat()
-
         try:
-            baseline_rows = self._conn.execute(
-                baseline_q,
-                (realm_slug, baseline_cutoff_str, recent_cutoff_str,
-                 realm_slug, baseline_cutoff_str, recent_cutoff_str),
+            stats_rows = self._conn.execute(
+                stats_q,
+                {
+                    "realm":    realm_slug,
+                    "baseline": cutoff_baseline.isoformat(),
+                    "recent":   cutoff_recent.isoformat(),
+                },
             ).fetchall()
+        except sqlite3.OperationalError:
+            # A malformed query or missing table must not read as "no drift".
+            raise
         except Exception as exc:
-            logger.warning("Data drift baseline query failed: %s", exc)
-            baseline_rows = []
+            logger.warning("Data drift query failed: %s", exc)
+            stats_rows = []
 
         baseline_by_arch: dict[int, dict] = {}
-        for row in baseline_rows:
-            arch_id = row["archetype_id"]
-            n       = row["n"] or 0
-            mean_p  = row["mean_price"]
-            # std = sqrt(SS / n) (population std for consistency)
-            std_p   = math.sqrt(row["ss"] / n) if (n > 1 and row["ss"] is not None) else 0.0
-            baseline_by_arch[arch_id] = {
-                "mean": mean_p,
-                "std":  std_p,
-                "n":    n,
-            }
-
-        # ── Recent stats per series ───────────────────────────────────────────
-        recent_q = """
-            SELECT archetype_id,
-                   AVG(price_gold) AS mean_price,
-                   COUNT(*)        AS n
-            FROM market_observations_normalized
-            WHERE realm_slug = ?
-              AND date(observed_at) >= ?
-              AND is_outlier = 0
-              AND archetype_id IS NOT NULL
-            GROUP BY archetype_id;
-        """
-        try:
-            recent_rows = self._conn.execute(
-                recent_q,
-                (realm_slug, recent_cutoff_str),
-            ).fetchall()
-        except Exception as exc:
-            logger.warning("Data drift recent query failed: %s", exc)
-            recent_rows = []
-
         recent_by_arch: dict[int, dict] = {}
-        for row in recent_rows:
-            recent_by_arch[row["archetype_id"]] = {
-                "mean": row["mean_price"],
-                "n":    row["n"] or 0,
-            }
+        for row in stats_rows:
+            arch_id = row["archetype_id"]
+            n       = row["b_n"] or 0
+            if n > 0:
+                # std = sqrt(SS / n) (population std for consistency)
+                std_p = math.sqrt(row["b_ss"] / n) if (n > 1 and row["b_ss"] is not None) else 0.0
+                baseline_by_arch[arch_id] = {
+                    "mean": row["b_mean"],
+                    "std":  std_p,
+                    "n":    n,
+                }
+            if row["r_n"]:
+                recent_by_arch[arch_id] = {
+                    "mean": row["r_mean"],
+                    "n":    row["r_n"],
+                }
 
         # ── Compute per-series stats ──────────────────────────────────────────
         all_series: set[int] = set(baseline_by_arch) | set(recent_by_arch)
@@ -594,29 +586,21 @@ class DriftChecker:
         # ── Baseline MAE: from most recent backtest run ────────────────────────
         baseline_mae: float | None = None
         try:
-            bt_row = self._conn.execute(
+            metrics_row = self._conn.execute(
                 """
-                SELECT backtest_run_id FROM backtest_runs
-                WHERE realm_slug = ?
-                ORDER BY backtest_run_id DESC LIMIT 1;
+                SELECT AVG(abs_error) AS baseline_mae
+                FROM backtest_fold_results
+                WHERE backtest_run_id = (
+                        SELECT MAX(backtest_run_id) FROM backtest_runs
+                        WHERE realm_slug = ?
+                      )
+                  AND horizon_days = ?
+                  AND actual_price IS NOT NULL;
                 """,
-                (realm_slug,),
+                (realm_slug, horizon_days),
             ).fetchone()
-
-            if bt_row is not None:
-                bt_run_id = bt_row["backtest_run_id"]
-                metrics_row = self._conn.execute(
-                    """
-                    SELECT AVG(abs_error) AS baseline_mae
-                    FROM backtest_fold_results
-                    WHERE backtest_run_id = ?
-                      AND horizon_days = ?
-                      AND actual_price IS NOT NULL;
-                    """,
-                    (bt_run_id, horizon_days),
-                ).fetchone()
-                if metrics_row and metrics_row["baseline_mae"] is not None:
-                    baseline_mae = metrics_row["baseline_mae"]
+            if metrics_row and metrics_row["baseline_mae"] is not None:
+                baseline_mae = metrics_row["baseline_mae"]
         except Exception as exc:
             logger.warning("Error drift baseline query failed: %s", exc)
 
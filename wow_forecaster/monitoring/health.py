@@ -83,18 +83,49 @@ def compute_health_summary(
     Returns:
         ModelHealthSummary.
     """
+    return compute_health_summaries(
+        conn, realm_slug, [horizon_days], window_days=window_days
+    )[0]
+
+
+def compute_health_summaries(
+    conn: sqlite3.Connection,
+    realm_slug: str,
+    horizons: list[int],
+    window_days: int = 14,
+) -> list[ModelHealthSummary]:
+    """Compute live health summaries for several horizons of one realm.
+
+    Equivalent to calling :func:`compute_health_summary` once per horizon,
+    but the live and baseline queries each scan once for all horizons and
+    the results are grouped in Python.
+
+    Args:
+        conn:        Open SQLite connection.
+        realm_slug:  Realm to evaluate.
+        horizons:    Forecast horizons to evaluate, in output order.
+        window_days: How many recent days of target dates to include.
+
+    Returns:
+        One ModelHealthSummary per entry in ``horizons``, in the same order.
+    """
     from wow_forecaster.monitoring.drift import _utc_now_iso
 
-    now_str     = _utc_now_iso()
-    horizon_tag = f"{horizon_days}d"
-    cutoff      = (date.today() - timedelta(days=window_days)).isoformat()
+    if not horizons:
+        return []
+
+    now_str      = _utc_now_iso()
+    horizon_tags = {f"{h}d": h for h in horizons}
+    cutoff       = (date.today() - timedelta(days=window_days)).isoformat()
+    placeholders = ", ".join("?" * len(horizon_tags))
 
     # ── Live MAE and directional accuracy ────────────────────────────────────
     # For each forecast where target_date < today, find the average actual
     # price from normalized obs on that target_date.
-    live_q = """
+    live_q = f"""
         SELECT
             f.forecast_id,
+            f.forecast_horizon,
             f.predicted_price_gold,
             f.target_date,
             AVG(n.price_gold) AS actual_price
@@ -104,7 +135,7 @@ def compute_health_summary(
             AND n.realm_slug   = f.realm_slug
             AND date(n.observed_at) = f.target_date
         WHERE f.realm_slug       = ?
-          AND f.forecast_horizon = ?
+          AND f.forecast_horizon IN ({placeholders})
           AND f.target_date     >= ?
           AND f.target_date     <  date('now')
           AND n.is_outlier = 0
@@ -112,33 +143,27 @@ def compute_health_summary(
     """
     try:
         live_rows = conn.execute(
-            live_q, (realm_slug, horizon_tag, cutoff)
+            live_q, (realm_slug, *horizon_tags, cutoff)
         ).fetchall()
     except Exception as exc:
         logger.warning("Health summary live query failed: %s", exc)
         live_rows = []
 
-    n_evaluated   = len(live_rows)
-    live_mae      = None
-    live_dir_acc  = None
-
-    if n_evaluated > 0:
-        errors = []
-        for row in live_rows:
-            pred   = row["predicted_price_gold"]
-            actual = row["actual_price"]
-            if pred is not None and actual is not None:
-                errors.append(abs(pred - actual))
-                # For directional accuracy we need the price at the time the
-                # forecast was made.  We don't store that directly; we skip
-                # dir_acc when we can't compute it.
-
-        if errors:
-            live_mae = round(sum(errors) / len(errors), 4)
+    n_by_horizon: dict[int, int] = dict.fromkeys(horizons, 0)
+    errors_by_horizon: dict[int, list[float]] = {h: [] for h in horizons}
+    for row in live_rows:
+        h = horizon_tags[row["forecast_horizon"]]
+        n_by_horizon[h] += 1
+        pred   = row["predicted_price_gold"]
+        actual = row["actual_price"]
+        if pred is not None and actual is not None:
+            errors_by_horizon[h].append(abs(pred - actual))
+            # For directional accuracy we need the price at the time the
+            # forecast was made.  We don't store that directly; we skip
+            # dir_acc when we can't compute it.
 
     # ── Baseline MAE and dir_acc from most recent backtest ───────────────────
-    baseline_mae     = None
-    baseline_dir_acc = None
+    baseline: dict[int, tuple[float | None, float | None]] = {}
     try:
         bt_row = conn.execute(
             """
@@ -152,54 +177,67 @@ def compute_health_summary(
         if bt_row is not None:
             bt_run_id = bt_row["backtest_run_id"]
 
-            m_row = conn.execute(
-                """
+            m_rows = conn.execute(
+                f"""
                 SELECT
+                    horizon_days,
                     AVG(abs_error)       AS mae,
                     AVG(direction_correct) AS dir_acc
                 FROM backtest_fold_results
                 WHERE backtest_run_id = ?
-                  AND horizon_days    = ?
-                  AND actual_price IS NOT NULL;
+                  AND horizon_days    IN ({placeholders})
+                  AND actual_price IS NOT NULL
+                GROUP BY horizon_days;
                 """,
-                (bt_run_id, horizon_days),
-            ).fetchone()
-
-            if m_row:
-                if m_row["mae"] is not None:
-                    baseline_mae = round(m_row["mae"], 4)
-                if m_row["dir_acc"] is not None:
-                    baseline_dir_acc = round(m_row["dir_acc"], 4)
+                (bt_run_id, *horizon_tags.values()),
+            ).fetchall()
+
+            for m_row in m_rows:
+                baseline[m_row["horizon_days"]] = (
+                    round(m_row["mae"], 4) if m_row["mae"] is not None else None,
+                    round(m_row["dir_acc"], 4) if m_row["dir_acc"] is not None else None,
+                )
     except Exception as exc:
         logger.warning("Health summary baseline query failed: %s", exc)
 
-    # ── MAE ratio and health status ───────────────────────────────────────────
-    mae_ratio = None
-    if live_mae is not None and baseline_mae is not None and baseline_mae > 1e-6:
-        mae_ratio = round(live_mae / baseline_mae, 4)
-
-    health_status = _classify_health(mae_ratio)
-
-    logger.info(
-        "Model health | realm=%s | h=%dd | n=%d | live_mae=%s | ratio=%s | status=%s",
-        realm_slug, horizon_days, n_evaluated,
-        f"{live_mae:.2f}g" if live_mae else "N/A",
-        f"{mae_ratio:.2f}x" if mae_ratio else "N/A",
-        health_status,
-    )
-
-    return ModelHealthSummary(
-        realm_slug=realm_slug,
-        checked_at=now_str,
-        horizon_days=horizon_days,
-        n_evaluated=n_evaluated,
-        live_mae=live_mae,
-        baseline_mae=baseline_mae,
-        mae_ratio=mae_ratio,
-        live_dir_acc=live_dir_acc,
-        baseline_dir_acc=baseline_dir_acc,
-        health_status=health_status,
-    )
+    summaries: list[ModelHealthSummary] = []
+    for horizon_days in horizons:
+        errors       = errors_by_horizon[horizon_days]
+        n_evaluated  = n_by_horizon[horizon_days]
+        live_mae     = round(sum(errors) / len(errors), 4) if errors else None
+        live_dir_acc = None
+        baseline_mae, baseline_dir_acc = baseline.get(horizon_days, (None, None))
+
+        # ── MAE ratio and health status ───────────────────────────────────────
+        mae_ratio = None
+        if live_mae is not None and baseline_mae is not None and baseline_mae > 1e-6:
+            mae_ratio = round(live_mae / baseline_mae, 4)
+
+        health_status = _classify_health(mae_ratio)
+
+        logger.info(
+            "Model health | realm=%s | h=%dd | n=%d | live_mae=%s | ratio=%s | status=%s",
+            realm_slug, horizon_days, n_evaluated,
+            f"{live_mae:.2f}g" if live_mae else "N/A",
+            f"{mae_ratio:.2f}x" if mae_ratio else "N/A",
+            health_status,
+        )
+
+        summaries.append(
+            ModelHealthSummary(
+                realm_slug=realm_slug,
+                checked_at=now_str,
+                horizon_days=horizon_days,
+                n_evaluated=n_evaluated,
+                live_mae=live_mae,
+                baseline_mae=baseline_mae,
+                mae_ratio=mae_ratio,
+                live_dir_acc=live_dir_acc,
+                baseline_dir_acc=baseline_dir_acc,
+                health_status=health_status,
+            )
+        )
+    return summaries
 
 
 def _classify_health(mae_ratio: float | None) -> str:
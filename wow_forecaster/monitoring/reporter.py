@@ -228,8 +228,25 @@ def persist_health_to_db(
         run_id:  run_metadata.run_id for this orchestration run.
         summary: ModelHealthSummary to persist.
     """
+    persist_health_summaries(conn, run_id, [summary])
+
+
+def persist_health_summaries(
+    conn,
+    run_id: int,
+    summaries: list[ModelHealthSummary],
+) -> None:
+    """Persist several ModelHealthSummary rows in one statement and commit.
+
+    Args:
+        conn:      Open SQLite connection.
+        run_id:    run_metadata.run_id for this orchestration run.
+        summaries: ModelHealthSummary rows to persist.
+    """
+    if not summaries:
+        return
     try:
-        conn.execute(
+        conn.executemany(
             """
             INSERT INTO model_health_snapshots
                 (run_id, realm_slug, horizon_days, n_evaluated,
@@ -237,25 +254,28 @@ def persist_health_to_db(
                  live_dir_acc, baseline_dir_acc, health_status, checked_at)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?);
             """,
-            (
-                run_id,
-                summary.realm_slug,
-                summary.horizon_days,
-                summary.n_evaluated,
-                summary.live_mae,
-                summary.baseline_mae,
-                summary.mae_ratio,
-                summary.live_dir_acc,
-                summary.baseline_dir_acc,
-                summary.health_status,
-                summary.checked_at,
-            ),
+            [
+                (
+                    run_id,
+                    s.realm_slug,
+                    s.horizon_days,
+                    s.n_evaluated,
+                    s.live_mae,
+                    s.baseline_mae,
+                    s.mae_ratio,
+                    s.live_dir_acc,
+                    s.baseline_dir_acc,
+                    s.health_status,
+                    s.checked_at,
+                )
+                for s in summaries
+            ],
         )
         conn.commit()
     except Exception as exc:
         logger.error(
-            "Failed to persist health summary for realm=%s h=%dd: %s",
-            summary.realm_slug, summary.horizon_days, exc,
+            "Failed to persist health summaries for realm=%s: %s",
+            summaries[0].realm_slug, exc,
             exc_info=True,
         )
 
@@ -90,8 +90,7 @@ class BacktestStage(PipelineStage):
 
         with get_connection(
             self.db_path,
-            wal_mode=self.config.database.wal_mode,
-            busy_timeout_ms=self.config.database.busy_timeout_ms,
+            **self.config.database.connection_kwargs(),
         ) as conn:
             # ── Load active event dates for is_event_window classification ──
             event_rows = conn.execute(
@@ -161,8 +161,7 @@ class PipelineStage(ABC):
 
             with get_connection(
                 self.db_path,
-                wal_mode=self.config.database.wal_mode,
-                busy_timeout_ms=self.config.database.busy_timeout_ms,
+                **self.config.database.connection_kwargs(),
             ) as conn:
                 repo = RunMetadataRepository(conn)
                 if run.run_id is None:
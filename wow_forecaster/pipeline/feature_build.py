@@ -89,8 +89,7 @@ class FeatureBuildStage(PipelineStage):
 
         with get_connection(
             self.db_path,
-            wal_mode=self.config.database.wal_mode,
-            busy_timeout_ms=self.config.database.busy_timeout_ms,
+            **self.config.database.connection_kwargs(),
         ) as conn:
             total = build_datasets(
                 conn=conn,
@@ -181,8 +181,7 @@ class ForecastStage(PipelineStage):
         if max_age_hours > 0:
             with get_connection(
                 self.db_path,
-                wal_mode=self.config.database.wal_mode,
-                busy_timeout_ms=self.config.database.busy_timeout_ms,
+                **self.config.database.connection_kwargs(),
             ) as conn:
                 for realm in realms:
                     age = _fetch_max_observation_age_hours(conn, realm, now=now)
@@ -241,8 +240,7 @@ class ForecastStage(PipelineStage):
             # Read drift-based uncertainty multiplier and cold-start blend data.
             with get_connection(
                 self.db_path,
-                wal_mode=self.config.database.wal_mode,
-                busy_timeout_ms=self.config.database.busy_timeout_ms,
+                **self.config.database.connection_kwargs(),
             ) as conn:
                 uncertainty_mult = get_latest_uncertainty_multiplier(conn, realm)
                 blend_data = _fetch_cold_start_blend_data(
@@ -280,8 +278,7 @@ class ForecastStage(PipelineStage):
             # Persist archetype-level forecasts and generate item-level forecasts
             with get_connection(
                 self.db_path,
-                wal_mode=self.config.database.wal_mode,
-                busy_timeout_ms=self.config.database.busy_timeout_ms,
+                **self.config.database.connection_kwargs(),
             ) as conn:
                 repo = ForecastOutputRepository(conn)
                 for fc in outputs:
@@ -166,8 +166,7 @@ class IngestStage(PipelineStage):
         # ── Phase 1: Read-only — load FK guard set (short connection) ──────
         with get_connection(
             self.db_path,
-            wal_mode=self.config.database.wal_mode,
-            busy_timeout_ms=self.config.database.busy_timeout_ms,
+            **self.config.database.connection_kwargs(),
         ) as conn:
             item_repo = ItemRepository(conn)
             known_item_ids: set[int] = item_repo.get_all_item_ids()
@@ -218,9 +217,12 @@ class IngestStage(PipelineStage):
         # ── Phase 3: Write — short connection for all DB inserts ───────────
         with get_connection(
             self.db_path,
-            wal_mode=self.config.database.wal_mode,
-            busy_timeout_ms=self.config.database.busy_timeout_ms,
+            **self.config.database.connection_kwargs(),
         ) as conn:
+            # Take the write lock up front: with concurrent per-realm ingests
+            # a deferred transaction can hit SQLITE_BUSY mid-batch, whereas
+            # BEGIN IMMEDIATE waits out busy_timeout before any row is written.
+            conn.execute("BEGIN IMMEDIATE;")
             snap_repo = IngestionSnapshotRepository(conn)
             market_repo = MarketObservationRepository(conn)
 
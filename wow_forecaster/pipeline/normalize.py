@@ -61,8 +61,7 @@ class NormalizeStage(PipelineStage):
 
         with get_connection(
             self.db_path,
-            wal_mode=self.config.database.wal_mode,
-            busy_timeout_ms=self.config.database.busy_timeout_ms,
+            **self.config.database.connection_kwargs(),
         ) as conn:
             # Count pending rows upfront for X/Y progress reporting.
             total_pending = conn.execute(
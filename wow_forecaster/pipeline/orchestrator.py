@@ -63,6 +63,7 @@ To run on a schedule:
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
@@ -72,6 +73,10 @@ from wow_forecaster.config import AppConfig
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent per-realm ingests.  SQLite still serialises the
+# write phase of each IngestStage, so more threads only add lock contention.
+MAX_INGEST_WORKERS = 8
+
 
 # ── Result types ──────────────────────────────────────────────────────────────
 
@@ -149,6 +154,7 @@ class HourlyOrchestrator:
         check_drift: bool   = True,
         apply_adaptive: bool = True,
         now: datetime | None = None,
+        workers: int = 1,
     ) -> OrchestratorResult:
         """Execute the full hourly refresh pipeline.
 
@@ -159,6 +165,9 @@ class HourlyOrchestrator:
             now:            UTC-aware clock anchoring the rollup step's target
                             dates (default: current UTC time).  Injectable so
                             tests are deterministic in any timezone.
+            workers:        Realms ingested concurrently (default 1 = serial).
+                            Capped at ``min(len(realms), MAX_INGEST_WORKERS)``;
+                            each thread's IngestStage opens its own connections.
 
         Returns:
             OrchestratorResult summarising all steps.
@@ -183,9 +192,20 @@ class HourlyOrchestrator:
         result.run_id = run_id
 
         # ── Step 2: Ingest (per realm, isolated) ──────────────────────────────
-        logger.info("[1/4] IngestStage per realm ...")
-        for realm in realms:
-            realm_result = self._run_ingest(realm, run_id)
+        n_workers = max(1, min(workers, len(realms), MAX_INGEST_WORKERS))
+        logger.info("[1/4] IngestStage per realm (workers=%d) ...", n_workers)
+        if n_workers > 1:
+            # Network fetches overlap; pool.map keeps results in realm order.
+            with ThreadPoolExecutor(
+                max_workers=n_workers, thread_name_prefix="ingest"
+            ) as pool:
+                realm_results = list(
+                    pool.map(lambda realm: self._run_ingest(realm, run_id), realms)
+                )
+        else:
+            realm_results = [self._run_ingest(realm, run_id) for realm in realms]
+
+        for realm, realm_result in zip(realms, realm_results, strict=True):
             result.realm_results.append(realm_result)
             if not realm_result.success:
                 result.errors.append(
@@ -210,8 +230,7 @@ class HourlyOrchestrator:
             today_utc = now.date()
             with get_connection(
                 self.db_path,
-                wal_mode=self.config.database.wal_mode,
-                busy_timeout_ms=self.config.database.busy_timeout_ms,
+                **self.config.database.connection_kwargs(),
             ) as conn:
                 for realm in realms:
                     # Both the previous and current UTC dates: observations from
@@ -264,8 +283,7 @@ class HourlyOrchestrator:
 
             with get_connection(
                 self.db_path,
-                wal_mode=self.config.database.wal_mode,
-                busy_timeout_ms=self.config.database.busy_timeout_ms,
+                **self.config.database.connection_kwargs(),
             ) as conn:
                 wal_result = conn.execute("PRAGMA wal_checkpoint(TRUNCATE);").fetchone()
                 busy, log_pages, checkpointed = wal_result
@@ -335,8 +353,7 @@ class HourlyOrchestrator:
 
         with get_connection(
             self.db_path,
-            wal_mode=self.config.database.wal_mode,
-            busy_timeout_ms=self.config.database.busy_timeout_ms,
+            **self.config.database.connection_kwargs(),
         ) as conn:
             apply_schema(conn)
             run_migrations(conn)
@@ -511,8 +528,7 @@ class HourlyOrchestrator:
         try:
             with get_connection(
                 self.db_path,
-                wal_mode=self.config.database.wal_mode,
-                busy_timeout_ms=self.config.database.busy_timeout_ms,
+                **self.config.database.connection_kwargs(),
             ) as conn:
                 from wow_forecaster.monitoring.drift import DriftChecker
                 from wow_forecaster.monitoring.provenance import build_provenance_summary
@@ -609,8 +625,7 @@ class HourlyOrchestrator:
             )
             with get_connection(
                 self.db_path,
-                wal_mode=self.config.database.wal_mode,
-                busy_timeout_ms=self.config.database.busy_timeout_ms,
+                **self.config.database.connection_kwargs(),
             ) as conn:
                 repo   = RunMetadataRepository(conn)
                 run_id = repo.insert_run(run)
@@ -637,8 +652,7 @@ class HourlyOrchestrator:
 
             with get_connection(
                 self.db_path,
-                wal_mode=self.config.database.wal_mode,
-                busy_timeout_ms=self.config.database.busy_timeout_ms,
+                **self.config.database.connection_kwargs(),
             ) as conn:
                 conn.execute(
                     """
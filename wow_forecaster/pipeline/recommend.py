@@ -100,14 +100,13 @@ class RecommendStage(PipelineStage):
                 )
                 continue
 
-            inf_table = pq.read_table(str(inf_path))
+            inf_table = pq.read_table(str(inf_path), memory_map=True)
             inf_rows  = inf_table.to_pylist()
 
             # ── Load forecast outputs from DB ─────────────────────────────────
             with get_connection(
                 self.db_path,
-                wal_mode=self.config.database.wal_mode,
-                busy_timeout_ms=self.config.database.busy_timeout_ms,
+                **self.config.database.connection_kwargs(),
             ) as conn:
                 forecasts = _load_recent_forecasts(
                     conn=conn,
@@ -136,8 +135,7 @@ class RecommendStage(PipelineStage):
             # ── Persist recommendations + enrich with item-level discounts ────
             with get_connection(
                 self.db_path,
-                wal_mode=self.config.database.wal_mode,
-                busy_timeout_ms=self.config.database.busy_timeout_ms,
+                **self.config.database.connection_kwargs(),
             ) as conn:
                 repo = ForecastOutputRepository(conn)
                 for rec in rec_outputs:
@@ -323,8 +323,7 @@ class SyncSnapshotsStage(PipelineStage):
     def _connect(self, get_connection):
         return get_connection(
             self.db_path,
-            wal_mode=self.config.database.wal_mode,
-            busy_timeout_ms=self.config.database.busy_timeout_ms,
+            **self.config.database.connection_kwargs(),
         )
 
     def _lock_path(self):
@@ -80,8 +80,7 @@ class TrainStage(PipelineStage):
             try:
                 with get_connection(
                     self.db_path,
-                    wal_mode=self.config.database.wal_mode,
-                    busy_timeout_ms=self.config.database.busy_timeout_ms,
+                    **self.config.database.connection_kwargs(),
                 ) as conn:
                     trained = train_models(
                         conn=conn,
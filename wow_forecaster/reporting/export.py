@@ -6,7 +6,9 @@ They accept generic ``list[dict]`` data to stay decoupled from
 specific report shapes.
 
 CSV exports are flat (no nested dicts) so they load directly in Power BI,
-Excel, or pandas without any pre-processing step.
+Excel, or pandas without any pre-processing step.  ``export_records()`` picks
+the format from the path suffix: ``.parquet`` and ``.feather`` write typed
+columnar files via pyarrow; anything else writes CSV.
 
 ``flatten_recommendations_for_export()`` is the main adapter function:
 it converts the nested ``categories`` structure of the recommendations
@@ -17,18 +19,34 @@ from __future__ import annotations
 
 import csv
 import json
+from collections.abc import Iterable
 from pathlib import Path
 
+_ARROW_SUFFIXES = (".parquet", ".feather")
+
+# Numeric columns of ``forecast_{realm}_{date}.csv``.  The CSV reader hands
+# them back as strings; pass these as ``float_columns`` so Parquet/Feather
+# exports get numeric columns.  ``roi_pct`` is written pre-formatted
+# (``+12.34%``) and stays a string.
+FORECAST_FLOAT_COLUMNS = ("current_price", "predicted_price", "ci_lower", "ci_upper", "score")
+
+# Write buffer for CSV exports: large exports flush in 1 MiB chunks rather
+# than the default 8 KiB.
+_CSV_BUFFER_BYTES = 1 << 20
+
 
 def export_to_csv(
-    records: list[dict],
+    records: Iterable[dict],
     path: Path,
     fieldnames: list[str] | None = None,
 ) -> Path:
     """Write ``records`` to a UTF-8 CSV file.
 
+    Rows are streamed to the writer, so ``records`` may be a generator;
+    nothing beyond the first row is held to pick the columns.
+
     Args:
-        records:    List of row dicts.
+        records:    Row dicts (list or any iterable).
         path:       Destination file path (parent dirs created if missing).
         fieldnames: Column order.  If None, uses the keys of the first record.
 
@@ -36,17 +54,109 @@ def export_to_csv(
         ``path`` as written.
     """
     path.parent.mkdir(parents=True, exist_ok=True)
-    if not records:
+    rows = iter(records)
+    first = next(rows, None)
+    if first is None:
         path.write_text("", encoding="utf-8")
         return path
-    cols = fieldnames or list(records[0].keys())
-    with path.open("w", newline="", encoding="utf-8") as f:
+    cols = fieldnames or list(first.keys())
+    with path.open("w", newline="", encoding="utf-8", buffering=_CSV_BUFFER_BYTES) as f:
         writer = csv.DictWriter(f, fieldnames=cols, extrasaction="ignore")
         writer.writeheader()
-        writer.writerows(records)
+        writer.writerow(first)
+        writer.writerows(rows)
     return path
 
 
+def _to_float(value: object) -> float | None:
+    """Convert a cell to float; empty or unparseable cells become None."""
+    if value is None or value == "":
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def export_to_arrow(
+    records: list[dict],
+    path: Path,
+    fieldnames: list[str] | None = None,
+    float_columns: Iterable[str] = (),
+) -> Path:
+    """Write ``records`` to a Parquet (zstd) or Feather file, by suffix.
+
+    Empty-string cells, which the flatteners use for "no value", are written
+    as nulls so numeric columns keep a numeric type.  A column whose values
+    pyarrow cannot infer a single type for is written as strings.
+
+    Args:
+        records:       List of row dicts.
+        path:          Destination ``.parquet`` or ``.feather`` path (parent
+                       dirs created if missing).
+        fieldnames:    Column order.  If None, uses the keys of the first record.
+        float_columns: Columns converted to float64; cells that do not parse
+                       are written as nulls.
+
+    Returns:
+        ``path`` as written.
+
+    Raises:
+        ValueError: If ``path`` has neither suffix.
+    """
+    import pyarrow as pa
+
+    suffix = path.suffix.lower()
+    if suffix not in _ARROW_SUFFIXES:
+        raise ValueError(f"Unsupported columnar export suffix: {path.suffix!r}")
+
+    cols = fieldnames or (list(records[0].keys()) if records else [])
+    floats = set(float_columns)
+    arrays = {}
+    for col in cols:
+        if col in floats:
+            arrays[col] = pa.array([_to_float(r.get(col)) for r in records], type=pa.float64())
+            continue
+        values = [None if r.get(col) == "" else r.get(col) for r in records]
+        try:
+            arrays[col] = pa.array(values)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            arrays[col] = pa.array(
+                [None if v is None else str(v) for v in values], type=pa.string()
+            )
+    table = pa.table(arrays)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if suffix == ".parquet":
+        import pyarrow.parquet as pq
+
+        pq.write_table(table, str(path), compression="zstd", use_dictionary=True)
+    else:
+        import pyarrow.feather as feather
+
+        feather.write_feather(table, str(path))
+    return path
+
+
+def export_records(
+    records: list[dict],
+    path: Path,
+    fieldnames: list[str] | None = None,
+    float_columns: Iterable[str] = (),
+) -> Path:
+    """Write ``records`` as Parquet/Feather or CSV depending on ``path``'s suffix.
+
+    ``float_columns`` applies to the Parquet/Feather path only; CSV cells are
+    written as given.
+
+    Returns:
+        ``path`` as written.
+    """
+    if path.suffix.lower() in _ARROW_SUFFIXES:
+        return export_to_arrow(records, path, fieldnames, float_columns)
+    return export_to_csv(records, path, fieldnames)
+
+
 def export_to_json(
     data: dict | list,
     path: Path,
@@ -88,6 +88,15 @@ def _fmt_gold(gold: float) -> str:
 
 # ── Top items ─────────────────────────────────────────────────────────────────
 
+# Fixed header rows, built once rather than once per category / archetype.
+_TOP_ITEMS_HEADER = (
+    f"    {'Rank':>4}  {'Archetype':<30}  {'Horizon':>7}  "
+    f"{'Current':>13}  {'Predicted':>13}  {'ROI':>8}  "
+    f"{'Score':>6}  {'Action':>6}"
+)
+_TOP_ITEMS_RULE = "    " + "-" * (len(_TOP_ITEMS_HEADER) - 4)
+_DISCOUNT_HEADER = f"          {'Item':<32}  {'Price':>13}  {'vs. Arch':>9}"
+
 
 def format_top_items_table(
     categories:     dict[str, list[dict]],
@@ -137,17 +146,13 @@ def format_top_items_table(
         lines.append("  (no recommendations available — run 'run-daily-forecast' first)")
         return "\n".join(lines)
 
+    discounts = item_discounts or {}
     for cat in sorted(categories):
         recs = categories[cat]
         lines.append("")
         lines.append(f"  [{cat.upper()}]")
-        header = (
-            f"    {'Rank':>4}  {'Archetype':<30}  {'Horizon':>7}  "
-            f"{'Current':>13}  {'Predicted':>13}  {'ROI':>8}  "
-            f"{'Score':>6}  {'Action':>6}"
-        )
-        lines.append(header)
-        lines.append("    " + "-" * (len(header) - 4))
+        lines.append(_TOP_ITEMS_HEADER)
+        lines.append(_TOP_ITEMS_RULE)
         for item in recs:
             roi     = item.get("roi_pct", 0.0)
             curr    = item.get("current_price", 0.0)
@@ -167,11 +172,9 @@ def format_top_items_table(
 
             # Per-item discount sub-rows
             arch_id = item.get("archetype_id")
-            disc_rows = (item_discounts or {}).get(arch_id, [])
+            disc_rows = discounts.get(arch_id, [])
             if disc_rows:
-                lines.append(
-                    f"          {'Item':<32}  {'Price':>13}  {'vs. Arch':>9}"
-                )
+                lines.append(_DISCOUNT_HEADER)
                 for dr in disc_rows:
                     name      = str(dr.get("name", ""))[:32]
                     price     = dr.get("item_price_gold", 0.0)
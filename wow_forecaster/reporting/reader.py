@@ -23,8 +23,10 @@ Freshness conventions:
 from __future__ import annotations
 
 import csv
+import fnmatch
 import json
 import logging
+import os
 from datetime import UTC, datetime
 from pathlib import Path
 
@@ -33,6 +35,41 @@ logger = logging.getLogger(__name__)
 
 # ── File discovery ─────────────────────────────────────────────────────────────
 
+def find_latest_file_with_mtime(
+    directory: Path,
+    glob_pattern: str,
+) -> tuple[Path, float] | None:
+    """Return the most recently modified file matching ``glob_pattern`` and its mtime.
+
+    One ``os.scandir`` pass: the mtime comes from the directory entry, so
+    callers that also need it (freshness checks) skip a second stat.
+
+    Args:
+        directory:    Directory to search (returns None if it does not exist
+                      or is not a directory).
+        glob_pattern: Filename pattern (``fnmatch`` syntax, no subdirectories).
+
+    Returns:
+        ``(path, st_mtime)`` of the newest matching file, or None.
+    """
+    best: tuple[Path, float] | None = None
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if not fnmatch.fnmatch(entry.name, glob_pattern):
+                    continue
+                if not entry.is_file():
+                    continue
+                mtime = entry.stat().st_mtime
+                if best is None or mtime > best[1]:
+                    best = (Path(entry.path), mtime)
+    except OSError:
+        # Missing, not a directory or unreadable: no match, as directory.glob()
+        # reported it before.
+        return None
+    return best
+
+
 def find_latest_file(directory: Path, glob_pattern: str) -> Path | None:
     """Return the most recently *modified* file matching ``glob_pattern``.
 
@@ -44,12 +81,8 @@ def find_latest_file(directory: Path, glob_pattern: str) -> Path | None:
     Returns:
         Path of the most recently modified matching file, or None.
     """
-    if not directory.exists():
-        return None
-    matches = list(directory.glob(glob_pattern))
-    if not matches:
-        return None
-    return max(matches, key=lambda p: p.stat().st_mtime)
+    found = find_latest_file_with_mtime(directory, glob_pattern)
+    return found[0] if found is not None else None
 
 
 # ── Freshness ─────────────────────────────────────────────────────────────────
@@ -57,6 +90,7 @@ def find_latest_file(directory: Path, glob_pattern: str) -> Path | None:
 def check_freshness(
     generated_at: str | None,
     max_hours: float = 4.0,
+    now: datetime | None = None,
 ) -> tuple[bool, float | None]:
     """Check whether a report timestamp is within the freshness window.
 
@@ -68,6 +102,9 @@ def check_freshness(
                       ``checked_at`` field.
         max_hours:    Hours beyond which the report is considered stale
                       (default 4 h).
+        now:          Aware UTC reference time.  Pass one value to age
+                      several reports against the same clock reading;
+                      defaults to the current time.
 
     Returns:
         ``(is_fresh, age_hours)`` — ``age_hours`` is None when the string
@@ -82,7 +119,8 @@ def check_freshness(
             dt = datetime.fromisoformat(generated_at + "T00:00:00")
         if dt.tzinfo is None:
             dt = dt.replace(tzinfo=UTC)
-        now = datetime.now(tz=UTC)
+        if now is None:
+            now = datetime.now(tz=UTC)
         age_hours = (now - dt).total_seconds() / 3600.0
         return age_hours <= max_hours, age_hours
     except (ValueError, OverflowError):
@@ -110,7 +148,7 @@ def load_recommendations_report(
         )
         return None
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return json.loads(path.read_bytes())
     except (json.JSONDecodeError, OSError) as exc:
         logger.warning("Failed to load recommendations report %s: %s", path, exc)
         return None
@@ -125,21 +163,34 @@ def load_forecast_records(
     Returns a list of row dicts (keyed by CSV header names), or None
     if no file is found.  Returns an empty list for an empty CSV.
     """
-    path = find_latest_file(output_dir, f"forecast_{realm}_*.csv")
-    if path is None:
+    return load_forecast_records_with_mtime(realm, output_dir)[0]
+
+
+def load_forecast_records_with_mtime(
+    realm: str,
+    output_dir: Path,
+) -> tuple[list[dict] | None, float | None]:
+    """Like ``load_forecast_records()``, also returning the CSV's mtime.
+
+    The CSV carries no embedded timestamp, so report commands use the file
+    mtime for freshness; taking it from the same directory scan avoids a
+    second lookup.  The mtime is None whenever the records are None.
+    """
+    found = find_latest_file_with_mtime(output_dir, f"forecast_{realm}_*.csv")
+    if found is None:
         logger.debug(
             "No forecast CSV found for realm=%s in %s", realm, output_dir
         )
-        return None
+        return None, None
+    path, mtime = found
     try:
-        rows: list[dict] = []
+        # DictReader already yields plain dicts; no per-row copy needed.
         with path.open(newline="", encoding="utf-8") as f:
-            for row in csv.DictReader(f):
-                rows.append(dict(row))
-        return rows
+            rows: list[dict] = list(csv.DictReader(f))
+        return rows, mtime
     except (csv.Error, OSError) as exc:
         logger.warning("Failed to load forecast CSV %s: %s", path, exc)
-        return None
+        return None, None
 
 
 def load_drift_report(
@@ -155,7 +206,7 @@ def load_drift_report(
     if path is None:
         return None
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return json.loads(path.read_bytes())
     except (json.JSONDecodeError, OSError) as exc:
         logger.warning("Failed to load drift report %s: %s", path, exc)
         return None
@@ -174,7 +225,7 @@ def load_health_report(
     if path is None:
         return None
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return json.loads(path.read_bytes())
     except (json.JSONDecodeError, OSError) as exc:
         logger.warning("Failed to load health report %s: %s", path, exc)
         return None
@@ -193,7 +244,7 @@ def load_provenance_report(
     if path is None:
         return None
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return json.loads(path.read_bytes())
     except (json.JSONDecodeError, OSError) as exc:
         logger.warning("Failed to load provenance report %s: %s", path, exc)
         return None